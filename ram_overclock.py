@@ -6,14 +6,270 @@ Based on real-world principles used by experts like Buildzoid
 """
 
 import os
+import re
 import sys
 import time
-import random
 import json
-from typing import Dict, List, Tuple, Optional
+import math
+import bisect
+import heapq
+import struct
+import hashlib
+import binascii
+import argparse
+import importlib
+import threading
+import functools
+import traceback
+from typing import Callable, Dict, List, Tuple, Optional
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+class LazyObject:
+    # Stand-in for an expensive object (a heavy module, a precomputed table) that
+    # is only built on first attribute access. Attributes are then cached on the
+    # proxy itself, so later lookups are plain instance-dict hits.
+    def __init__(self, factory):
+        self._factory = factory
+
+    def _resolve(self):
+        target = self.__dict__.get("_target")
+        if target is None:
+            target = self.__dict__["_target"] = self._factory()
+        return target
+
+    def __getattr__(self, name):
+        value = getattr(self._resolve(), name)
+        self.__dict__[name] = value
+        return value
+
+# NumPy backs the simulation engines and asyncio only the live dashboard; neither
+# is imported until used, so one-shot CLI commands that don't need them stay cheap
+np = LazyObject(lambda: importlib.import_module("numpy"))
+asyncio = LazyObject(lambda: importlib.import_module("asyncio"))
+
+# Built-in metrics, rendered in the Prometheus text format by `serve` (/metrics)
+# and `--metrics-file`. Hot paths hold a series object resolved once and bump a
+# plain attribute, so recording costs about as much as an attribute increment.
+# Updates aren't locked: a rare lost increment under threads is the price of that.
+class Counter:
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+class Gauge(Counter):
+    def set(self, value: float):
+        self.value = value
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # The last slot is +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+class MetricFamily:
+    def __init__(self, name: str, help_text: str, kind: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Optional[Tuple[float, ...]] = None):
+        self.name = name
+        self.help_text = help_text
+        self.kind = kind
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self.series: Dict[tuple, object] = {}
+
+    def labels(self, *values):
+        series = self.series.get(values)
+        if series is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} takes labels {self.labelnames}")
+            series = self.series[values] = Histogram(self.buckets) if self.kind == "histogram" else \
+                (Gauge() if self.kind == "gauge" else Counter())
+        return series
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        for values, series in sorted(self.series.items()):
+            labels = [f'{name}="{value}"' for name, value in zip(self.labelnames, values)]
+            if self.kind != "histogram":
+                lines.append(f"{self.name}{{{','.join(labels)}}} {series.value:g}" if labels else
+                             f"{self.name} {series.value:g}")
+                continue
+            total = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series.counts):
+                total += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                bucket_labels = ",".join(labels + [f'le="{le}"'])
+                lines.append(f"{self.name}_bucket{{{bucket_labels}}} {total}")
+            suffix = f"{{{','.join(labels)}}}" if labels else ""
+            lines.append(f"{self.name}_sum{suffix} {series.sum:g}")
+            lines.append(f"{self.name}_count{suffix} {total}")
+        return lines
+
+class MetricsRegistry:
+    def __init__(self):
+        self.families: List[MetricFamily] = []
+
+    def add(self, name: str, help_text: str, kind: str, labelnames: Tuple[str, ...] = (),
+            buckets: Optional[Tuple[float, ...]] = None) -> MetricFamily:
+        family = MetricFamily(name, help_text, kind, labelnames, buckets)
+        self.families.append(family)
+        return family
+
+    def render(self) -> str:
+        return "\n".join(line for family in self.families for line in family.render()) + "\n"
+
+    def dump(self, path: str):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+LATENCY_BUCKETS = (1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+SIZE_BUCKETS = (1, 4, 16, 64, 256, 1024, 4096, 16384, 65536)
+METRICS = MetricsRegistry()
+CONFIGS_EVALUATED = METRICS.add("ramtimings_configs_evaluated_total", "Configurations scored for stability",
+                                "counter", ("path",))
+CACHE_REQUESTS = METRICS.add("ramtimings_cache_requests_total", "Cache lookups by cache and outcome",
+                             "counter", ("cache", "result"))
+STRESS_TESTS = METRICS.add("ramtimings_stress_tests_total", "Finished stress tests by intensity and result",
+                           "counter", ("intensity", "result"))
+EVALUATION_SECONDS = METRICS.add("ramtimings_evaluation_seconds", "Wall time of evaluation operations",
+                                 "histogram", ("operation",), LATENCY_BUCKETS)
+BATCH_SIZE = METRICS.add("ramtimings_batch_size", "Items per batch or parallel job list", "histogram",
+                         ("operation",), SIZE_BUCKETS)
+WORKER_BUSY_SECONDS = METRICS.add("ramtimings_worker_busy_seconds_total", "Time pool workers spent on tasks",
+                                  "counter", ("pool",))
+WORKER_AVAILABLE_SECONDS = METRICS.add("ramtimings_worker_available_seconds_total",
+                                       "Wall time multiplied by pool size", "counter", ("pool",))
+WORKER_UTILIZATION = METRICS.add("ramtimings_worker_utilization", "Busy share of the last pool run",
+                                 "gauge", ("pool",))
+HTTP_REQUESTS = METRICS.add("ramtimings_http_requests_total", "Service requests by path and status",
+                            "counter", ("path", "code"))
+SESSIONS = METRICS.add("ramtimings_sessions", "Player sessions held in memory or evicted to disk", "gauge", ("state",))
+SESSION_EVENTS = METRICS.add("ramtimings_session_events_total", "Session lifecycle events", "counter", ("event",))
+ENGINE_EVALUATED = CONFIGS_EVALUATED.labels("engine")
+STABILITY_CACHE_HITS = CACHE_REQUESTS.labels("stability", "hit")
+STABILITY_CACHE_MISSES = CACHE_REQUESTS.labels("stability", "miss")
+
+# Journals of interrupted long runs, picked up when the same run is started again
+CHECKPOINT_DIR = os.path.join(os.environ.get("XDG_STATE_HOME", os.path.join(os.path.expanduser("~"), ".local", "state")),
+                              "ramtimings", "checkpoints")
+
+class Checkpoint:
+    # Completed work units of a long run. The file is named by a hash of the
+    # run's spec, so running the same command again resumes it. The first line
+    # holds the spec and the run's state (such as the seed it picked); each
+    # later line is one unit's result, synced to disk at most every `interval`
+    # seconds and on close. A line cut short by a crash does not parse and is
+    # dropped, so a unit is either recorded whole or run again, never both.
+    def __init__(self, kind: str, spec, state: Optional[dict] = None, interval: float = 2.0, resume: bool = True):
+        digest = hashlib.sha1(json.dumps([kind, spec], sort_keys=True, default=str).encode()).hexdigest()[:16]
+        self.path = os.path.join(CHECKPOINT_DIR, f"{kind}-{digest}.jsonl")
+        self.interval = interval
+        self.done: Dict[int, object] = {}
+        self.state = state or {}
+        lines = []
+        try:
+            if not resume:
+                raise FileNotFoundError(self.path)
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        lines.append(json.loads(line))
+                    except ValueError:
+                        break
+        except OSError:
+            pass
+        self.resumed = bool(lines) and lines[0].get("spec") == json.loads(json.dumps(spec, default=str))
+        if self.resumed:
+            self.state = lines[0]["state"]
+            self.done = {index: result for index, result in lines[1:]}
+        # Start the journal over from what parsed, so appends never follow a torn line
+        os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps({"kind": kind, "spec": spec, "state": self.state}, default=str) + "\n")
+            for index, result in self.done.items():
+                f.write(json.dumps([index, result]) + "\n")
+        os.replace(tmp_path, self.path)
+        self.file = open(self.path, "a")
+        self.synced = time.monotonic()
+
+    def record(self, index: int, result):
+        self.done[index] = result
+        self.file.write(json.dumps([index, result]) + "\n")
+        if time.monotonic() - self.synced >= self.interval:
+            self.sync()
+
+    def sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.synced = time.monotonic()
+
+    def close(self):
+        if not self.file.closed:
+            self.sync()
+            self.file.close()
+
+    def complete(self):
+        # The run finished; nothing is left to resume
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+def timed_job(task: tuple):
+    # Run one pool task and report how long the worker spent on it
+    function, job = task
+    started = time.perf_counter()
+    result = function(job)
+    return time.perf_counter() - started, result
+
+def run_pool(name: str, function, jobs: list, workers: Optional[int] = None, chunksize: int = 1,
+             checkpoint: Optional[Checkpoint] = None) -> list:
+    # function(job) for every job, on a process pool unless one worker is asked
+    # for or there is only one job, recording how busy the workers were. With a
+    # checkpoint, jobs it already holds are skipped and each result is recorded
+    # as it arrives, so an interrupted run keeps its finished jobs.
+    results = dict(checkpoint.done) if checkpoint else {}
+    pending = [index for index in range(len(jobs)) if index not in results]
+    workers = 1 if len(pending) <= 1 else (workers or os.cpu_count() or 1)
+    started = time.perf_counter()
+    tasks = [(function, jobs[index]) for index in pending]
+    busy = 0.0
+    pool = None
+    try:
+        if workers == 1:
+            timed = map(timed_job, tasks)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            pool = ProcessPoolExecutor(workers)
+            timed = pool.map(timed_job, tasks, chunksize=chunksize)
+        for index, (elapsed, result) in zip(pending, timed):
+            busy += elapsed
+            results[index] = result
+            if checkpoint:
+                checkpoint.record(index, result)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if checkpoint:
+            checkpoint.close()
+        available = (time.perf_counter() - started) * workers
+        WORKER_BUSY_SECONDS.labels(name).inc(busy)
+        WORKER_AVAILABLE_SECONDS.labels(name).inc(available)
+        WORKER_UTILIZATION.labels(name).set(busy / available if available else 0.0)
+        BATCH_SIZE.labels(name).observe(len(pending))
+    return [results[index] for index in range(len(jobs))]
+
 class MemoryType(Enum):
     DDR4 = "DDR4"
     DDR5 = "DDR5"
@@ -48,6 +304,7 @@ class MemoryModule:
         self.current_voltage = 1.2 if self.memory_type == MemoryType.DDR4 else 1.1
         self.stability_score = 100
         self.errors = 0
+        self.secondary_timings: Dict[str, int] = {}  # Manual overrides, everything else stays on Auto
 
 @dataclass
 class MemoryController:
@@ -59,292 +316,2967 @@ class MemoryController:
     current_gear_mode: int  # 1 or 2 (DDR5 only)
     vccio_voltage: float
     vccsa_voltage: float
+    
+    def __post_init__(self):
+        # The board's stock rails; the IMC model works with offsets from these
+        self.stock_vccio = self.vccio_voltage
+        self.stock_vccsa = self.vccsa_voltage
 
-class RAMOverclockGame:
-    def __init__(self):
-        self.player_name = ""
-        self.experience_level = 0
-        self.achievements = []
-        self.current_modules: List[MemoryModule] = []
-        self.memory_controller = None
-        self.ambient_temperature = 25.0
-        self.cooling_solution = "Stock"
-        self.stress_test_running = False
-        self.game_data = self.load_game_data()
-        
-    def clear_screen(self):
-        os.system('clear' if os.name == 'posix' else 'cls')
-        
-    def print_banner(self):
-        print("╔══════════════════════════════════════════════════════════════╗")
-        print("║                   RAM OVERCLOCKING SIMULATOR                 ║")
-        print("║              Learn Real Memory Overclocking!                ║")
-        print("╚══════════════════════════════════════════════════════════════╝")
-        print()
-        
-    def main_menu(self):
-        while True:
-            self.clear_screen()
-            self.print_banner()
-            
-            if self.player_name:
-                print(f"Welcome back, {self.player_name}! (Level {self.experience_level})")
-                print()
-            
-            print("1. Start New Game")
-            print("2. Load Game")
-            print("3. Memory Overview")
-            print("4. Overclocking Lab")
-            print("5. Stress Testing")
-            print("6. Temperature Monitor")
-            print("7. Knowledge Base")
-            print("8. Achievements")
-            print("9. Settings")
-            print("0. Exit")
-            print()
-            
-            choice = input("Select option: ").strip()
-            
-            if choice == "1":
-                self.new_game()
-            elif choice == "2":
-                self.load_game()
-            elif choice == "3" and self.current_modules:
-                self.memory_overview()
-            elif choice == "4" and self.current_modules:
-                self.overclocking_lab()
-            elif choice == "5" and self.current_modules:
-                self.stress_testing_menu()
-            elif choice == "6" and self.current_modules:
-                self.temperature_monitor()
-            elif choice == "7":
-                self.knowledge_base()
-            elif choice == "8":
-                self.show_achievements()
-            elif choice == "9":
-                self.settings_menu()
-            elif choice == "0":
-                print("Thanks for playing!")
-                sys.exit(0)
-            else:
-                print("Invalid option or no memory installed!")
-                input("Press Enter to continue...")
-                
-    def new_game(self):
-        self.clear_screen()
-        self.print_banner()
-        
-        print("Starting new game...")
-        print()
-        
-        self.player_name = input("Enter your overclocker name: ").strip()
-        if not self.player_name:
-            self.player_name = "Anonymous OC'er"
-            
-        print()
-        print("Choose your experience level:")
-        print("1. Beginner (Safe settings, guided experience)")
-        print("2. Intermediate (Some freedom, moderate risk)")
-        print("3. Expert (Full control, high risk/reward)")
-        
-        level_choice = input("Select level (1-3): ").strip()
-        self.experience_level = max(1, min(3, int(level_choice) if level_choice.isdigit() else 1))
-        
-        print()
-        print("Choose your starting memory kit:")
-        self.choose_memory_kit()
-        
-        print()
-        print("Choose your memory controller:")
-        self.choose_memory_controller()
-        
-        self.save_game()
-        print(f"\nWelcome to RAM overclocking, {self.player_name}!")
-        input("Press Enter to continue...")
-        
-    def choose_memory_kit(self):
-        kits = [
-            # DDR4 Kits
-            MemoryModule("Corsair Vengeance LPX 3200", MemoryType.DDR4, MemoryIC.HYNIX_CJR, 
-                        2133, (15, 15, 15, 36), 3200, (16, 18, 18, 36), 1.35, 16, 35.0, 6),
-            MemoryModule("G.Skill Trident Z Neo 3600", MemoryType.DDR4, MemoryIC.SAMSUNG_CDIE,
-                        2133, (15, 15, 15, 36), 3600, (16, 19, 19, 39), 1.35, 16, 38.0, 7),
-            MemoryModule("G.Skill Trident Z Royal 4000", MemoryType.DDR4, MemoryIC.SAMSUNG_BDIE,
-                        2133, (15, 15, 15, 36), 4000, (19, 19, 19, 39), 1.4, 16, 40.0, 9),
-            MemoryModule("Crucial Ballistix 3200", MemoryType.DDR4, MemoryIC.MICRON_EDIE,
-                        2133, (15, 15, 15, 36), 3200, (16, 18, 18, 36), 1.35, 16, 36.0, 7),
-            MemoryModule("Team T-Force Xtreem 4500", MemoryType.DDR4, MemoryIC.SAMSUNG_BDIE,
-                        2133, (15, 15, 15, 36), 4500, (19, 19, 19, 39), 1.45, 16, 42.0, 10),
-            MemoryModule("Kingston Fury Beast 3600", MemoryType.DDR4, MemoryIC.HYNIX_DJR,
-                        2133, (15, 15, 15, 36), 3600, (18, 22, 22, 42), 1.35, 16, 37.0, 6),
-            MemoryModule("Patriot Viper Steel 4400", MemoryType.DDR4, MemoryIC.SAMSUNG_BDIE,
-                        2133, (15, 15, 15, 36), 4400, (19, 19, 19, 39), 1.45, 16, 41.0, 9),
-            MemoryModule("Corsair Vengeance RGB Pro 3600", MemoryType.DDR4, MemoryIC.SAMSUNG_CDIE,
-                        2133, (15, 15, 15, 36), 3600, (18, 22, 22, 42), 1.35, 16, 38.0, 7),
-            MemoryModule("ADATA XPG Spectrix D60G 3600", MemoryType.DDR4, MemoryIC.HYNIX_CJR,
-                        2133, (15, 15, 15, 36), 3600, (18, 20, 20, 40), 1.35, 16, 38.0, 6),
-            MemoryModule("Thermaltake TOUGHRAM RGB 3200", MemoryType.DDR4, MemoryIC.SAMSUNG_CDIE,
-                        2133, (15, 15, 15, 36), 3200, (16, 18, 18, 36), 1.35, 16, 36.0, 6),
-            # DDR5 Kits
-            MemoryModule("Corsair Dominator Platinum 5200", MemoryType.DDR5, MemoryIC.MICRON_BDIE,
-                        4800, (40, 40, 40, 76), 5200, (40, 40, 40, 76), 1.25, 32, 42.0, 8),
-            MemoryModule("G.Skill Trident Z5 RGB 6000", MemoryType.DDR5, MemoryIC.SAMSUNG_EDIE,
-                        4800, (40, 40, 40, 76), 6000, (30, 38, 38, 96), 1.35, 32, 45.0, 9),
-            MemoryModule("Kingston Fury Beast 5600", MemoryType.DDR5, MemoryIC.MICRON_BDIE,
-                        4800, (40, 40, 40, 76), 5600, (36, 36, 36, 76), 1.25, 32, 43.0, 7),
-            MemoryModule("Corsair Vengeance DDR5 5600", MemoryType.DDR5, MemoryIC.HYNIX_MFR,
-                        4800, (40, 40, 40, 76), 5600, (36, 36, 36, 76), 1.25, 32, 43.0, 7),
-            MemoryModule("TeamGroup T-Force Delta RGB 6200", MemoryType.DDR5, MemoryIC.SAMSUNG_EDIE,
-                        4800, (40, 40, 40, 76), 6200, (36, 36, 36, 76), 1.35, 32, 46.0, 8),
-            MemoryModule("ADATA XPG Lancer RGB 6000", MemoryType.DDR5, MemoryIC.MICRON_BDIE,
-                        4800, (40, 40, 40, 76), 6000, (32, 38, 38, 96), 1.35, 32, 45.0, 8),
-            MemoryModule("Crucial DDR5 5200", MemoryType.DDR5, MemoryIC.MICRON_BDIE,
-                        4800, (40, 40, 40, 76), 5200, (42, 42, 42, 84), 1.1, 32, 40.0, 6),
-            MemoryModule("Patriot Viper Venom DDR5 6200", MemoryType.DDR5, MemoryIC.SAMSUNG_EDIE,
-                        4800, (40, 40, 40, 76), 6200, (36, 36, 36, 76), 1.35, 32, 46.0, 9),
-            MemoryModule("Thermaltake TOUGHRAM RC DDR5 5600", MemoryType.DDR5, MemoryIC.HYNIX_MFR,
-                        4800, (40, 40, 40, 76), 5600, (36, 36, 36, 76), 1.25, 32, 43.0, 7),
-            MemoryModule("G.Skill Trident Z5 Royal 6400", MemoryType.DDR5, MemoryIC.SAMSUNG_EDIE,
-                        4800, (40, 40, 40, 76), 6400, (32, 39, 39, 102), 1.4, 32, 48.0, 10),
-        ]
-        
-        print("Available memory kits:")
-        print("\nDDR4 Kits:")
-        ddr4_count = 0
-        for i, kit in enumerate(kits, 1):
-            if kit.memory_type == MemoryType.DDR4:
-                ddr4_count += 1
-                print(f"{i}. {kit.name}")
-                print(f"   Type: {kit.memory_type.value}, IC: {kit.ic_type.value}")
-                print(f"   JEDEC: {kit.jedec_speed} MHz, Rated: {kit.rated_speed} MHz")
-                print(f"   Capacity: {kit.capacity}GB x2, Quality: {kit.quality_bin}/10")
-                print()
-        
-        print("\nDDR5 Kits:")
-        for i, kit in enumerate(kits, 1):
-            if kit.memory_type == MemoryType.DDR5:
-                print(f"{i}. {kit.name}")
-                print(f"   Type: {kit.memory_type.value}, IC: {kit.ic_type.value}")
-                print(f"   JEDEC: {kit.jedec_speed} MHz, Rated: {kit.rated_speed} MHz")
-                print(f"   Capacity: {kit.capacity}GB x2, Quality: {kit.quality_bin}/10")
-                print()
-            
-        choice = input(f"Select kit (1-{len(kits)}): ").strip()
-        kit_index = max(0, min(len(kits)-1, int(choice) - 1 if choice.isdigit() else 0))
-        
-        selected_kit = kits[kit_index]
-        self.current_modules = [selected_kit, selected_kit]  # Dual channel
-        print(f"Selected: {selected_kit.name}")
-        
-    def choose_memory_controller(self):
-        controllers = [
-            ("Intel Z690/Z790 IMC", MemoryController(7, 1.5, True, True, 2, 1, 1.1, 1.25)),
-            ("AMD Zen 3 IMC", MemoryController(6, 1.45, False, False, 1, 1, 0.9, 1.0)),
-            ("Intel Z490/Z590 IMC", MemoryController(8, 1.55, True, True, 2, 1, 1.15, 1.3)),
-            ("AMD Zen 4 IMC", MemoryController(8, 1.4, True, True, 1, 1, 0.95, 1.05)),
-        ]
-        
-        print("Available memory controllers:")
-        for i, (name, controller) in enumerate(controllers, 1):
-            print(f"{i}. {name} (Quality: {controller.imc_quality}/10)")
-            
-        choice = input("Select controller (1-4): ").strip()
-        controller_index = max(0, min(3, int(choice) - 1 if choice.isdigit() else 0))
-        
-        self.memory_controller = controllers[controller_index][1]
-        print(f"Selected: {controllers[controller_index][0]}")
+def kit_catalog() -> List[MemoryModule]:
+    # Fresh modules for every call, since the game mutates the selected kit
+    return builtin_kits() + [
+        MemoryModule(name, MemoryType(memory_type), MemoryIC(ic), jedec_speed, tuple(jedec_timings),
+                     rated_speed, tuple(rated_timings), voltage, capacity, temperature, quality_bin)
+        for name, memory_type, ic, jedec_speed, jedec_timings, rated_speed, rated_timings,
+            voltage, capacity, temperature, quality_bin in imported_kit_rows()]
 
-    def memory_overview(self):
-        while True:
-            self.clear_screen()
-            self.print_banner()
-            print("═══ MEMORY OVERVIEW ═══")
-            print()
-            
-            for i, module in enumerate(self.current_modules, 1):
-                print(f"DIMM {i}: {module.name}")
-                print(f"  Type: {module.memory_type.value} | IC: {module.ic_type.value}")
-                print(f"  Current: {module.current_speed} MHz @ {module.current_voltage:.3f}V")
-                print(f"  Timings: {'-'.join(map(str, module.current_timings))} | Temp: {module.temperature:.1f}°C")
-                print(f"  Stability: {module.stability_score}% | Errors: {module.errors}")
-                print()
-                
-            print("Memory Controller Info:")
-            print(f"  Quality: {self.memory_controller.imc_quality}/10")
-            print(f"  Command Rate: {self.memory_controller.current_command_rate}T")
-            if self.current_modules[0].memory_type == MemoryType.DDR5:
-                print(f"  Gear Mode: {self.memory_controller.current_gear_mode}")
-            print(f"  VCCIO: {self.memory_controller.vccio_voltage:.3f}V")
-            print(f"  VCCSA: {self.memory_controller.vccsa_voltage:.3f}V")
-            print()
-            
-            print("1. Back to Main Menu")
-            choice = input("Select option: ").strip()
-            
-            if choice == "1":
-                break
+def builtin_kits() -> List[MemoryModule]:
+    return [
+        # DDR4 Kits
+        MemoryModule("Corsair Vengeance LPX 3200", MemoryType.DDR4, MemoryIC.HYNIX_CJR, 
+                    2133, (15, 15, 15, 36), 3200, (16, 18, 18, 36), 1.35, 16, 35.0, 6),
+        MemoryModule("G.Skill Trident Z Neo 3600", MemoryType.DDR4, MemoryIC.SAMSUNG_CDIE,
+                    2133, (15, 15, 15, 36), 3600, (16, 19, 19, 39), 1.35, 16, 38.0, 7),
+        MemoryModule("G.Skill Trident Z Royal 4000", MemoryType.DDR4, MemoryIC.SAMSUNG_BDIE,
+                    2133, (15, 15, 15, 36), 4000, (19, 19, 19, 39), 1.4, 16, 40.0, 9),
+        MemoryModule("Crucial Ballistix 3200", MemoryType.DDR4, MemoryIC.MICRON_EDIE,
+                    2133, (15, 15, 15, 36), 3200, (16, 18, 18, 36), 1.35, 16, 36.0, 7),
+        MemoryModule("Team T-Force Xtreem 4500", MemoryType.DDR4, MemoryIC.SAMSUNG_BDIE,
+                    2133, (15, 15, 15, 36), 4500, (19, 19, 19, 39), 1.45, 16, 42.0, 10),
+        MemoryModule("Kingston Fury Beast 3600", MemoryType.DDR4, MemoryIC.HYNIX_DJR,
+                    2133, (15, 15, 15, 36), 3600, (18, 22, 22, 42), 1.35, 16, 37.0, 6),
+        MemoryModule("Patriot Viper Steel 4400", MemoryType.DDR4, MemoryIC.SAMSUNG_BDIE,
+                    2133, (15, 15, 15, 36), 4400, (19, 19, 19, 39), 1.45, 16, 41.0, 9),
+        MemoryModule("Corsair Vengeance RGB Pro 3600", MemoryType.DDR4, MemoryIC.SAMSUNG_CDIE,
+                    2133, (15, 15, 15, 36), 3600, (18, 22, 22, 42), 1.35, 16, 38.0, 7),
+        MemoryModule("ADATA XPG Spectrix D60G 3600", MemoryType.DDR4, MemoryIC.HYNIX_CJR,
+                    2133, (15, 15, 15, 36), 3600, (18, 20, 20, 40), 1.35, 16, 38.0, 6),
+        MemoryModule("Thermaltake TOUGHRAM RGB 3200", MemoryType.DDR4, MemoryIC.SAMSUNG_CDIE,
+                    2133, (15, 15, 15, 36), 3200, (16, 18, 18, 36), 1.35, 16, 36.0, 6),
+        # DDR5 Kits
+        MemoryModule("Corsair Dominator Platinum 5200", MemoryType.DDR5, MemoryIC.MICRON_BDIE,
+                    4800, (40, 40, 40, 76), 5200, (40, 40, 40, 76), 1.25, 32, 42.0, 8),
+        MemoryModule("G.Skill Trident Z5 RGB 6000", MemoryType.DDR5, MemoryIC.SAMSUNG_EDIE,
+                    4800, (40, 40, 40, 76), 6000, (30, 38, 38, 96), 1.35, 32, 45.0, 9),
+        MemoryModule("Kingston Fury Beast 5600", MemoryType.DDR5, MemoryIC.MICRON_BDIE,
+                    4800, (40, 40, 40, 76), 5600, (36, 36, 36, 76), 1.25, 32, 43.0, 7),
+        MemoryModule("Corsair Vengeance DDR5 5600", MemoryType.DDR5, MemoryIC.HYNIX_MFR,
+                    4800, (40, 40, 40, 76), 5600, (36, 36, 36, 76), 1.25, 32, 43.0, 7),
+        MemoryModule("TeamGroup T-Force Delta RGB 6200", MemoryType.DDR5, MemoryIC.SAMSUNG_EDIE,
+                    4800, (40, 40, 40, 76), 6200, (36, 36, 36, 76), 1.35, 32, 46.0, 8),
+        MemoryModule("ADATA XPG Lancer RGB 6000", MemoryType.DDR5, MemoryIC.MICRON_BDIE,
+                    4800, (40, 40, 40, 76), 6000, (32, 38, 38, 96), 1.35, 32, 45.0, 8),
+        MemoryModule("Crucial DDR5 5200", MemoryType.DDR5, MemoryIC.MICRON_BDIE,
+                    4800, (40, 40, 40, 76), 5200, (42, 42, 42, 84), 1.1, 32, 40.0, 6),
+        MemoryModule("Patriot Viper Venom DDR5 6200", MemoryType.DDR5, MemoryIC.SAMSUNG_EDIE,
+                    4800, (40, 40, 40, 76), 6200, (36, 36, 36, 76), 1.35, 32, 46.0, 9),
+        MemoryModule("Thermaltake TOUGHRAM RC DDR5 5600", MemoryType.DDR5, MemoryIC.HYNIX_MFR,
+                    4800, (40, 40, 40, 76), 5600, (36, 36, 36, 76), 1.25, 32, 43.0, 7),
+        MemoryModule("G.Skill Trident Z5 Royal 6400", MemoryType.DDR5, MemoryIC.SAMSUNG_EDIE,
+                    4800, (40, 40, 40, 76), 6400, (32, 39, 39, 102), 1.4, 32, 48.0, 10),
+    ]
 
-    def load_game_data(self):
-        return {}
-        
-    def save_game(self):
-        pass
-        
-    def load_game(self):
-        print("Load game functionality not implemented yet.")
-        input("Press Enter to continue...")
-        
-    def overclocking_lab(self):
-        while True:
-            self.clear_screen()
-            self.print_banner()
-            print("═══ OVERCLOCKING LABORATORY ═══")
-            print()
-            
-            module = self.current_modules[0]  # Focus on first module
-            print(f"Current Settings - {module.name}")
-            print(f"Frequency: {module.current_speed} MHz")
-            print(f"Primary Timings: {'-'.join(map(str, module.current_timings[:4]))}")
-            print(f"Voltage: {module.current_voltage:.3f}V")
-            print(f"Temperature: {module.temperature:.1f}°C")
-            print(f"Stability: {module.stability_score}%")
-            print()
-            
-            print("Overclocking Options:")
-            print("1. Adjust Frequency")
-            print("2. Adjust Primary Timings")
-            print("3. Adjust Voltage")
-            print("4. Secondary Timings (Advanced)")
-            print("5. Apply XMP/DOCP Profile")
-            print("6. Auto-Overclock Assistant")
-            print("7. Reset to JEDEC")
-            print("8. Quick Stability Test")
-            print("9. Back to Main Menu")
-            print()
-            
-            choice = input("Select option: ").strip()
-            
-            if choice == "1":
-                self.adjust_frequency()
-            elif choice == "2":
-                self.adjust_primary_timings()
-            elif choice == "3":
-                self.adjust_voltage()
-            elif choice == "4":
-                self.adjust_secondary_timings()
-            elif choice == "5":
-                self.apply_xmp_profile()
-            elif choice == "6":
-                self.auto_overclock_assistant()
-            elif choice == "7":
-                self.reset_to_jedec()
-            elif choice == "8":
-                self.quick_stability_test()
-            elif choice == "9":
-                break
+def controller_catalog() -> List[Tuple[str, MemoryController]]:
+    return [
+        ("Intel Z690/Z790 IMC", MemoryController(7, 1.5, True, True, 2, 1, 1.1, 1.25)),
+        ("AMD Zen 3 IMC", MemoryController(6, 1.45, False, False, 1, 1, 0.9, 1.0)),
+        ("Intel Z490/Z590 IMC", MemoryController(8, 1.55, True, True, 2, 1, 1.15, 1.3)),
+        ("AMD Zen 4 IMC", MemoryController(8, 1.4, True, True, 1, 1, 0.95, 1.05)),
+    ]
+
+PRIMARY_TIMING_NAMES = ("CL", "tRCD", "tRP", "tRAS")
+# Secondary and tertiary timings, in the order every timing vector uses
+SECONDARY_TIMING_NAMES = ("tRRD_S", "tRRD_L", "tFAW", "tWTR_S", "tWTR_L", "tRFC", "tREFI",
+                          "tWR", "tRTP", "tCWL", "tRDRD_SG", "tRDRD_DG", "tWRWR_SG", "tWRWR_DG")
+# Turnarounds are protocol limits counted in clocks; everything else is specified in ns.
+# tREFI is the refresh interval, where longer is faster, so ICs give a ceiling for it.
+CLOCK_TIMINGS = ("tRDRD_SG", "tRDRD_DG", "tWRWR_SG", "tWRWR_DG")
+SECONDARY_IN_CLOCKS = tuple(name in CLOCK_TIMINGS for name in SECONDARY_TIMING_NAMES)
+SECONDARY_IS_CEILING = tuple(name == "tREFI" for name in SECONDARY_TIMING_NAMES)
+
+# What the BIOS picks on Auto (tCWL follows CL instead), and the fewest clocks it accepts
+JEDEC_SECONDARY = {
+    MemoryType.DDR4: (3.3, 4.9, 21.0, 2.5, 7.5, 350.0, 7800.0, 15.0, 7.5, None, 6, 4, 6, 4),
+    MemoryType.DDR5: (2.5, 5.0, 10.666, 2.5, 10.0, 295.0, 3900.0, 30.0, 7.5, None, 8, 8, 16, 8),
+}
+MIN_CLOCKS = {
+    MemoryType.DDR4: (4, 4, 16, 2, 4, 1, 1, 8, 4, 9, 4, 4, 4, 4),
+    MemoryType.DDR5: (8, 8, 32, 4, 16, 1, 1, 12, 12, 20, 8, 8, 8, 8),
+}
+CWL_OFFSET = {MemoryType.DDR4: 0, MemoryType.DDR5: 2}
+
+# Built-in IC characteristics, one row per (memory type, IC). IC None is the
+# fallback for ICs without a dedicated row.
+# (type, IC, typical MHz range, CL/tRCD/tRP/tRAS ranges, JEDEC/daily/max V, warn/critical °C,
+#  tightest secondary timings in SECONDARY_TIMING_NAMES order)
+BUILTIN_IC_PROFILES = [
+    ("DDR4", None, (2133, 3200), ((15, 20), (15, 22), (15, 22), (30, 44)), (1.2, 1.4, 1.5), (75, 85),
+     (2.5, 3.5, 12.0, 2.0, 5.0, 260.0, 20000.0, 7.5, 3.75, 7.0, 5, 4, 5, 4)),
+    ("DDR4", MemoryIC.SAMSUNG_BDIE, (3200, 4400), ((14, 19), (14, 21), (14, 21), (28, 42)), (1.2, 1.45, 1.5), (75, 85),
+     (1.9, 2.5, 8.0, 1.5, 3.5, 140.0, 32000.0, 6.0, 3.0, 6.5, 4, 4, 4, 4)),
+    ("DDR4", MemoryIC.SAMSUNG_CDIE, (3000, 3800), ((16, 22), (16, 24), (16, 24), (32, 48)), (1.2, 1.35, 1.45), (75, 85),
+     (2.5, 3.5, 12.0, 2.0, 5.0, 250.0, 16000.0, 7.5, 3.75, 7.5, 5, 4, 5, 4)),
+    ("DDR4", MemoryIC.SAMSUNG_EDIE, (2800, 3400), ((15, 20), (15, 22), (15, 22), (30, 44)), (1.2, 1.4, 1.5), (75, 85),
+     (2.5, 3.5, 12.0, 2.0, 5.0, 260.0, 20000.0, 7.5, 3.75, 7.0, 5, 4, 5, 4)),
+    ("DDR4", MemoryIC.HYNIX_CJR, (3000, 3600), ((16, 20), (18, 22), (18, 22), (36, 44)), (1.2, 1.35, 1.45), (75, 85),
+     (2.5, 3.5, 12.0, 2.0, 5.0, 260.0, 24000.0, 7.5, 3.75, 7.0, 5, 4, 5, 4)),
+    ("DDR4", MemoryIC.HYNIX_DJR, (3200, 3800), ((15, 20), (15, 22), (15, 22), (30, 44)), (1.2, 1.35, 1.45), (75, 85),
+     (2.2, 3.0, 10.0, 2.0, 4.5, 250.0, 26000.0, 7.0, 3.5, 7.0, 4, 4, 4, 4)),
+    ("DDR4", MemoryIC.HYNIX_MFR, (2400, 3000), ((15, 20), (15, 22), (15, 22), (30, 44)), (1.2, 1.35, 1.45), (75, 85),
+     (2.8, 4.0, 14.0, 2.2, 5.5, 280.0, 16000.0, 8.0, 4.0, 7.5, 5, 4, 5, 4)),
+    ("DDR4", MemoryIC.MICRON_EDIE, (3000, 3600), ((15, 20), (15, 22), (15, 22), (30, 44)), (1.2, 1.4, 1.5), (65, 80),
+     (2.2, 3.0, 10.0, 2.0, 4.5, 280.0, 20000.0, 7.0, 3.5, 7.0, 4, 4, 4, 4)),
+    ("DDR4", MemoryIC.MICRON_BDIE, (3400, 4000), ((15, 19), (17, 21), (17, 21), (34, 42)), (1.2, 1.4, 1.5), (65, 80),
+     (2.2, 3.0, 10.0, 2.0, 4.5, 270.0, 20000.0, 7.0, 3.5, 7.0, 4, 4, 4, 4)),
+    ("DDR5", None, (4800, 5600), ((36, 44), (36, 46), (36, 46), (72, 96)), (1.1, 1.3, 1.4), (75, 85),
+     (2.0, 3.5, 8.0, 2.0, 6.0, 260.0, 16000.0, 20.0, 5.0, 7.5, 8, 8, 8, 8)),
+    ("DDR5", MemoryIC.SAMSUNG_EDIE, (5600, 6800), ((30, 38), (36, 42), (36, 42), (68, 102)), (1.1, 1.35, 1.4), (75, 85),
+     (2.0, 3.5, 8.0, 2.0, 6.0, 220.0, 20000.0, 18.0, 5.0, 7.5, 8, 8, 8, 8)),
+    ("DDR5", MemoryIC.HYNIX_MFR, (4800, 6000), ((34, 40), (36, 42), (36, 42), (72, 90)), (1.1, 1.3, 1.4), (75, 85),
+     (1.6, 3.0, 6.0, 1.6, 5.0, 160.0, 32000.0, 16.0, 4.0, 7.0, 8, 8, 8, 8)),
+    ("DDR5", MemoryIC.MICRON_BDIE, (4800, 6000), ((38, 46), (38, 48), (38, 48), (76, 96)), (1.1, 1.3, 1.4), (65, 80),
+     (2.0, 4.0, 8.0, 2.0, 6.5, 250.0, 16000.0, 20.0, 5.0, 7.5, 8, 8, 8, 8)),
+]
+
+class ICProfileTable:
+    # Immutable, precomputed IC limits stored as parallel NumPy arrays so batch
+    # scorers can gather rows with an index array. Keys are (type, IC name)
+    # strings so a data file can describe ICs the MemoryIC enum doesn't know yet.
+    TIMING_NAMES = PRIMARY_TIMING_NAMES
+    DEFAULT_IC = "default"
+
+    def __init__(self, rows: List[tuple]):
+        self.keys: List[Tuple[str, str]] = []
+        self.index: Dict[Tuple[str, str], int] = {}
+        for memory_type, ic, *_ in rows:
+            key = (memory_type, ic.value if isinstance(ic, MemoryIC) else (ic or self.DEFAULT_IC))
+            if key in self.index:
+                raise ValueError(f"Duplicate IC profile: {key[0]} {key[1]}")
+            self.index[key] = len(self.keys)
+            self.keys.append(key)
+        self.frequency_range = self._frozen([row[2] for row in rows], int)  # (n, 2)
+        self.timing_range = self._frozen([row[3] for row in rows], int)  # (n, 4, 2)
+        self.voltage = self._frozen([row[4] for row in rows], float)  # (n, 3) JEDEC, daily, max
+        self.thermal = self._frozen([row[5] for row in rows], float)  # (n, 2) warn, critical
+        for memory_type in {key[0] for key in self.keys}:
+            if (memory_type, self.DEFAULT_IC) not in self.index:
+                raise ValueError(f"IC profile table has no default row for {memory_type}")
+        self.secondary = self._frozen(self._secondary_rows(rows), float)  # (n, 14) ns, clocks for turnarounds
+
+    def _secondary_rows(self, rows: List[tuple]) -> List[tuple]:
+        # Rows may leave the secondary limits out or give only some of them by name;
+        # the rest come from their memory type's default row
+        defaults = {}
+        for (memory_type, ic), row in zip(self.keys, rows):
+            if ic == self.DEFAULT_IC:
+                values = row[6] if len(row) > 6 else None
+                if not isinstance(values, (tuple, list)) or len(values) != len(SECONDARY_TIMING_NAMES):
+                    raise ValueError(f"Default IC profile for {memory_type} needs every secondary timing limit")
+                defaults[memory_type] = tuple(values)
+        result = []
+        for (memory_type, _), row in zip(self.keys, rows):
+            values = row[6] if len(row) > 6 else None
+            if values is None:
+                values = defaults[memory_type]
+            elif isinstance(values, dict):
+                values = tuple(values.get(name, default) for name, default in zip(SECONDARY_TIMING_NAMES, defaults[memory_type]))
+            result.append(values)
+        return result
+
+    @staticmethod
+    def _frozen(values, dtype):
+        array = np.array(values, dtype=dtype)
+        array.flags.writeable = False
+        return array
+
+    def row(self, memory_type, ic) -> int:
+        memory_type = memory_type.value if isinstance(memory_type, MemoryType) else memory_type
+        ic = ic.value if isinstance(ic, MemoryIC) else ic
+        row = self.index.get((memory_type, ic))
+        if row is None:
+            row = self.index[(memory_type, self.DEFAULT_IC)]
+        return row
+
+    def has_profile(self, memory_type, ic) -> bool:
+        memory_type = memory_type.value if isinstance(memory_type, MemoryType) else memory_type
+        ic = ic.value if isinstance(ic, MemoryIC) else ic
+        return (memory_type, ic) in self.index
+
+    def timing_ranges(self, row: int) -> Dict[str, Tuple[int, int]]:
+        return {name: tuple(int(v) for v in self.timing_range[row, i]) for i, name in enumerate(self.TIMING_NAMES)}
+
+    def rows(self) -> List[tuple]:
+        return [(memory_type, ic if ic != self.DEFAULT_IC else None,
+                 tuple(self.frequency_range[i].tolist()),
+                 tuple(tuple(r) for r in self.timing_range[i].tolist()),
+                 tuple(self.voltage[i].tolist()),
+                 tuple(self.thermal[i].tolist()),
+                 tuple(self.secondary[i].tolist()))
+                for i, (memory_type, ic) in enumerate(self.keys)]
+
+    def extended(self, rows: List[tuple]) -> "ICProfileTable":
+        # New table with `rows` added; rows for an existing key replace it
+        merged = {row[:2]: row for row in self.rows()}
+        for row in rows:
+            ic = row[1].value if isinstance(row[1], MemoryIC) else row[1]
+            row = (row[0], ic) + tuple(row[2:])
+            # Partial secondary limits refine the row they replace
+            secondary = row[6] if len(row) > 6 else None
+            previous = merged.get(row[:2])
+            if previous is not None and (secondary is None or isinstance(secondary, dict)):
+                limits = dict(zip(SECONDARY_TIMING_NAMES, previous[6]))
+                limits.update(secondary or {})
+                row = row[:6] + (tuple(limits[name] for name in SECONDARY_TIMING_NAMES),)
+            merged[row[:2]] = row
+        return ICProfileTable(list(merged.values()))
+
+    @staticmethod
+    def read_rows(path: str) -> List[tuple]:
+        # JSON list of {"memory_type", "ic", "frequency": [min, max],
+        # "timings": {"CL": [min, max], ...}, "voltage": [jedec, daily, max],
+        # "thermal": [warn, critical], "secondary": {"tRFC": ns, ...}}
+        with open(path) as f:
+            entries = json.load(f)
+        rows = []
+        for entry in entries:
+            timings = entry["timings"]
+            rows.append((entry["memory_type"], entry.get("ic"),
+                         tuple(entry["frequency"]),
+                         tuple(tuple(timings[name]) for name in ICProfileTable.TIMING_NAMES),
+                         tuple(entry["voltage"]),
+                         tuple(entry.get("thermal", (75, 85))),
+                         entry.get("secondary")))
+        return rows
+
+# Extra or overriding IC profiles are picked up from this file when present
+IC_PROFILE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ic_profiles.json")
+
+def load_ic_profiles(path: str = IC_PROFILE_FILE) -> ICProfileTable:
+    table = ICProfileTable(BUILTIN_IC_PROFILES)
+    if os.path.exists(path):
+        table = table.extended(ICProfileTable.read_rows(path))
+    return table
+
+IC_PROFILES = LazyObject(load_ic_profiles)
+
+# Relations between timings: target >= sum(coefficient * source) for the listed
+# memory types. DDR4 boards want tRAS to cover tRCD + CL, while DDR5 only needs
+# the row held open through tRCD + tRTP.
+TIMING_RELATIONS = (
+    ("tRAS", (("tRCD", 1), ("CL", 1)), (MemoryType.DDR4,)),
+    ("tRAS", (("tRCD", 1), ("tRTP", 1)), (MemoryType.DDR5,)),
+    ("tRRD_L", (("tRRD_S", 1),), (MemoryType.DDR4, MemoryType.DDR5)),
+    ("tFAW", (("tRRD_S", 4),), (MemoryType.DDR4, MemoryType.DDR5)),
+    ("tWTR_L", (("tWTR_S", 1),), (MemoryType.DDR4, MemoryType.DDR5)),
+    ("tWR", (("tRTP", 2),), (MemoryType.DDR4, MemoryType.DDR5)),
+    ("tREFI", (("tRFC", 1),), (MemoryType.DDR4, MemoryType.DDR5)),
+    ("CL", (("tCWL", 1),), (MemoryType.DDR4, MemoryType.DDR5)),
+    ("tRDRD_SG", (("tRDRD_DG", 1),), (MemoryType.DDR4, MemoryType.DDR5)),
+    ("tWRWR_SG", (("tWRWR_DG", 1),), (MemoryType.DDR4, MemoryType.DDR5)),
+)
+
+class TimingConstraints:
+    # The relations for one memory type, compiled to index form and ordered so each
+    # rule runs after every rule that can change its sources. Propagation is then a
+    # single forward pass over plain ints (a few µs, cheap enough for search loops),
+    # and the batch check is one matrix product over (..., 18) timing sets.
+    NAMES = PRIMARY_TIMING_NAMES + SECONDARY_TIMING_NAMES
+    INDEX = {name: i for i, name in enumerate(NAMES)}
+    USER_PRIMARIES = (0, 1, 2)  # CL, tRCD, tRP are never moved by a repair
+
+    def __init__(self, memory_type: MemoryType):
+        self.memory_type = memory_type
+        self.min_clocks = (1,) * len(PRIMARY_TIMING_NAMES) + MIN_CLOCKS[memory_type]
+        self.jedec = JEDEC_SECONDARY[memory_type]
+        self.cwl_offset = CWL_OFFSET[memory_type]
+        rules = [(self.INDEX[target], tuple((self.INDEX[source], coefficient) for source, coefficient in sources))
+                 for target, sources, memory_types in TIMING_RELATIONS if memory_type in memory_types]
+        depth, visiting = {}, set()
+        def level(timing):  # Longest chain of rules feeding this timing
+            if timing not in depth:
+                if timing in visiting:
+                    raise ValueError(f"Timing relations form a cycle through {self.NAMES[timing]}")
+                visiting.add(timing)
+                depth[timing] = max((1 + max(level(source) for source, _ in sources)
+                                     for target, sources in rules if target == timing), default=0)
+            return depth[timing]
+        self.rules = sorted(rules, key=lambda rule: level(rule[0]))
+        self._auto_clocks: Dict[int, List[int]] = {}
+        self._compiled = None
+
+    def auto(self, speed: int, cl: int) -> List[int]:
+        # Secondary timings the BIOS would pick on Auto, before propagation
+        clocks = self._auto_clocks.get(speed)
+        if clocks is None:
+            tck = 2000 / speed  # ns per memory clock
+            minimums = self.min_clocks[len(PRIMARY_TIMING_NAMES):]
+            clocks = [value if value is None or in_clocks else max(minimum, math.ceil(value / tck - 1e-9))
+                      for value, minimum, in_clocks in zip(self.jedec, minimums, SECONDARY_IN_CLOCKS)]
+            self._auto_clocks[speed] = clocks
+        clocks = list(clocks)
+        cwl = self.INDEX["tCWL"] - len(PRIMARY_TIMING_NAMES)
+        clocks[cwl] = max(self.min_clocks[self.INDEX["tCWL"]], cl - self.cwl_offset)
+        return clocks
+
+    def propagate(self, timings: List[int], fixed) -> List[int]:
+        # Raise free targets to satisfy each rule; when the target is fixed and the
+        # rule is a plain "target >= source", lower a free source instead
+        for target, sources in self.rules:
+            required = sum(timings[source] * coefficient for source, coefficient in sources)
+            if timings[target] >= required:
+                continue
+            if target not in fixed:
+                timings[target] = required
+            elif len(sources) == 1 and sources[0][1] == 1 and sources[0][0] not in fixed:
+                timings[sources[0][0]] = timings[target]
+        return timings
+
+    def derive(self, speed: int, primaries, overrides: Dict[str, int]) -> List[int]:
+        # Full timing set: primaries and manual values as given, Auto for the rest
+        timings = list(primaries) + self.auto(speed, primaries[0])
+        fixed = {0, 1, 2, 3}
+        for name, value in overrides.items():
+            timings[self.INDEX[name]] = value
+            fixed.add(self.INDEX[name])
+        return self.propagate(timings, fixed)
+
+    def repair(self, timings, fixed=USER_PRIMARIES) -> List[int]:
+        # Nearest valid set that only ever loosens timings outside `fixed`
+        timings = [value if i in fixed else max(value, minimum)
+                   for i, (value, minimum) in enumerate(zip(timings, self.min_clocks))]
+        return self.propagate(timings, fixed)
+
+    def violations(self, timings) -> List[str]:
+        problems = [f"{name} ({value}) is below the minimum of {minimum}"
+                    for name, value, minimum in zip(self.NAMES, timings, self.min_clocks) if value < minimum]
+        for target, sources in self.rules:
+            required = sum(timings[source] * coefficient for source, coefficient in sources)
+            if timings[target] < required:
+                terms = " + ".join(self.NAMES[source] if coefficient == 1 else f"{coefficient}×{self.NAMES[source]}"
+                                   for source, coefficient in sources)
+                problems.append(f"{self.NAMES[target]} ({timings[target]}) must be at least {terms} ({required})")
+        return problems
+
+    def deficits(self, timings):
+        # Clocks by which each timing set in a (..., 18) array misses its relations
+        # and minimums, summed per set; 0 means the set is valid
+        if self._compiled is None:
+            matrix = np.zeros((len(self.rules), len(self.NAMES)))
+            for row, (_, sources) in enumerate(self.rules):
+                for source, coefficient in sources:
+                    matrix[row, source] += coefficient
+            self._compiled = (np.array([target for target, _ in self.rules]), matrix.T, np.array(self.min_clocks))
+        targets, matrix, min_clocks = self._compiled
+        timings = np.asarray(timings, dtype=float)
+        relations = np.maximum(0, timings @ matrix - timings[..., targets]).sum(axis=-1)
+        return relations + np.maximum(0, min_clocks - timings).sum(axis=-1)
+
+TIMING_CONSTRAINTS = {memory_type: TimingConstraints(memory_type) for memory_type in MemoryType}
+
+def module_timings(module: MemoryModule) -> List[int]:
+    # Effective primaries followed by secondaries, as the memory would train
+    return TIMING_CONSTRAINTS[module.memory_type].derive(module.current_speed, module.current_timings,
+                                                         module.secondary_timings)
+
+def secondary_limits(module: MemoryModule) -> List[int]:
+    # Tightest secondaries this module's IC and bin should manage at its current
+    # speed (tREFI: the longest interval); turnarounds don't depend on binning
+    floors = IC_PROFILES.secondary[IC_PROFILES.row(module.memory_type, module.ic_type)]
+    binning = 1.1 - 0.02 * module.quality_bin
+    limits = []
+    for value, in_clocks, ceiling in zip(floors.tolist(), SECONDARY_IN_CLOCKS, SECONDARY_IS_CEILING):
+        if in_clocks:
+            limits.append(int(value))
+        elif ceiling:
+            limits.append(min(65535, int(value * module.current_speed / 2000)))  # 16-bit register
+        else:
+            limits.append(math.ceil(value * module.current_speed / 2000 * binning - 1e-9))
+    return limits
+
+class ThermalModel:
+    # First-order RC model per DIMM: C * dT/dt = P - (T - T_ambient) / R
+    # P comes from the frequency/voltage load, R from the cooling solution. All
+    # inputs broadcast, so a (fleet, dimm) array of modules integrates in one pass.
+    STATIC_POWER = {MemoryType.DDR4: 1.05, MemoryType.DDR5: 1.4}  # W per DIMM, DDR5 carries its own PMIC
+    DYNAMIC_POWER = {MemoryType.DDR4: 1.0, MemoryType.DDR5: 0.55}  # W per GHz·V² at full activity
+    COOLING_RESISTANCE = {  # °C/W from DIMM to ambient air
+        "Stock": 6.0,
+        "Stock Cooler": 6.0,
+        "Tower Air Cooler": 5.0,
+        "AIO Liquid Cooler": 4.5,
+        "Custom Loop": 4.0,
+    }
+    IDLE_ACTIVITY = 0.2
+    STRESS_ACTIVITY = {"light": 0.5, "medium": 0.7, "heavy": 0.85, "extreme": 1.0}
+
+    def __init__(self, heat_capacity: float = 5.0):
+        self.heat_capacity = heat_capacity  # J/°C, gives a ~20-30s time constant
+
+    def resistance(self, cooling_solution: str) -> float:
+        return self.COOLING_RESISTANCE.get(cooling_solution, self.COOLING_RESISTANCE["Stock"])
+
+    def power(self, speed, voltage, activity, ddr5):
+        ddr5 = np.asarray(ddr5, dtype=bool)
+        static = np.where(ddr5, self.STATIC_POWER[MemoryType.DDR5], self.STATIC_POWER[MemoryType.DDR4])
+        dynamic = np.where(ddr5, self.DYNAMIC_POWER[MemoryType.DDR5], self.DYNAMIC_POWER[MemoryType.DDR4])
+        return static + dynamic * np.asarray(speed) / 1000 * np.square(voltage) * activity
+
+    def module_power(self, modules: List[MemoryModule], activity):
+        speed = np.array([m.current_speed for m in modules], dtype=float)
+        voltage = np.array([m.current_voltage for m in modules], dtype=float)
+        ddr5 = np.array([m.memory_type == MemoryType.DDR5 for m in modules])
+        return self.power(speed, voltage, activity, ddr5)
+
+    def steady_state(self, power, ambient, resistance):
+        return ambient + power * resistance
+
+    def integrate(self, temps, power, ambient, resistance, dt):
+        # Exact solution for power held constant over dt, so large steps stay stable
+        target = self.steady_state(power, ambient, resistance)
+        decay = np.exp(-np.asarray(dt, dtype=float) / (np.asarray(resistance) * self.heat_capacity))
+        return target + (np.asarray(temps, dtype=float) - target) * decay
+
+    def transient(self, temps, power, ambient, resistance, times):
+        # Temperature at every time in `times` for a constant load, shape (len(times),) + temps.shape
+        temps = np.asarray(temps, dtype=float)
+        times = np.asarray(times, dtype=float).reshape((-1,) + (1,) * temps.ndim)
+        target = self.steady_state(power, ambient, resistance)
+        tau = np.asarray(resistance) * self.heat_capacity
+        return target + (temps - target) * np.exp(-times / tau)
+
+# Stability is a pure function of the configuration, split into components that
+# each read only a few input fields. Every component works on scalars and on
+# broadcast NumPy arrays alike, so the incremental engine and the batch scorer
+# share one implementation. Components return a penalty; negative is a bonus.
+def frequency_penalty(speed, rated_speed, quality_bin, profile):
+    speed, rated_speed, quality_bin = np.asarray(speed, dtype=float), np.asarray(rated_speed), np.asarray(quality_bin)
+    over_rated = np.maximum(0, speed - rated_speed) / rated_speed * 100
+    beyond_ic = np.maximum(0, speed - IC_PROFILES.frequency_range[profile, 1])
+    return np.minimum(50, over_rated * (1.4 - 0.06 * quality_bin)) + beyond_ic * 0.05
+
+TIMING_WEIGHTS = (1.0, 1.0, 1.0, 0.3)  # CL, tRCD, tRP, tRAS
+SECONDARY_WEIGHTS = (1.0, 0.8, 0.8, 0.6, 0.6, 1.0, 0.5, 0.4, 0.4, 0.5, 0.5, 0.5, 0.5, 0.5)
+
+def timing_penalty(speed, cl, trcd, trp, tras, secondaries, rated_speed, rated_cl, rated_trcd, rated_trp, rated_tras,
+                   quality_bin, ddr5, profile):
+    # The IC's typical ranges apply around the middle of its frequency range;
+    # timings are latencies in clocks, so the limits scale with speed. A kit is
+    # binned for its rated timings, so those are always within reach.
+    speed, quality_bin = np.asarray(speed, dtype=float), np.asarray(quality_bin)
+    reference = IC_PROFILES.frequency_range[profile].mean(axis=-1)
+    ranges = IC_PROFILES.timing_range[profile]
+    timings = np.stack(np.broadcast_arrays(cl, trcd, trp, tras), axis=-1)
+    rated = np.stack(np.broadcast_arrays(rated_cl, rated_trcd, rated_trp, rated_tras), axis=-1)
+    scale = (speed / reference)[..., None]
+    tight = np.minimum(ranges[..., 0] * scale * (1.1 - 0.02 * quality_bin)[..., None],
+                       rated * (speed / np.asarray(rated_speed))[..., None])
+    loose = ranges[..., 1] * scale
+
+    # Penalty grows quickly past the limit; DDR5 counts twice the clocks for the same latency
+    too_tight = np.maximum(0, tight - timings) / np.where(ddr5, 2, 1)[..., None]
+    penalty = ((8 * too_tight + 4 * np.square(too_tight)) * TIMING_WEIGHTS).sum(axis=-1)
+    bonus = np.minimum(10, (2 * np.maximum(0, timings - loose)).sum(axis=-1))  # Bonus for loose timings
+
+    # Secondaries against the IC's limits, as a fraction of the limit since tRFC
+    # runs to hundreds of clocks and tRRD_S to a handful
+    secondaries = np.asarray(secondaries, dtype=float)
+    floors = IC_PROFILES.secondary[profile]
+    limit = np.where(SECONDARY_IN_CLOCKS, floors, floors * (speed / 2000)[..., None])
+    binned = limit * np.where(SECONDARY_IN_CLOCKS, 1.0, (1.1 - 0.02 * quality_bin)[..., None])
+    shortfall = np.where(SECONDARY_IS_CEILING, np.maximum(0, secondaries - limit) / limit,
+                         np.maximum(0, binned - secondaries) / binned)
+    penalty = penalty + ((40 * shortfall + 100 * np.square(shortfall)) * SECONDARY_WEIGHTS).sum(axis=-1)
+
+    # A set that breaks the timing relations won't train reliably at all
+    lead = np.broadcast_shapes(timings.shape[:-1], secondaries.shape[:-1])
+    full = np.concatenate([np.broadcast_to(timings, lead + timings.shape[-1:]),
+                           np.broadcast_to(secondaries, lead + secondaries.shape[-1:])], axis=-1)
+    broken = np.where(ddr5, TIMING_CONSTRAINTS[MemoryType.DDR5].deficits(full),
+                      TIMING_CONSTRAINTS[MemoryType.DDR4].deficits(full))
+    return penalty + 5 * broken - bonus
+
+def voltage_penalty(dram_voltage, ddr5, profile):
+    # Higher voltage improves stability until the IC's limit, then hurts it
+    dram_voltage = np.asarray(dram_voltage, dtype=float)
+    jedec_v, max_v = IC_PROFILES.voltage[profile, 0], IC_PROFILES.voltage[profile, 2]
+    benefit = (dram_voltage - jedec_v) * np.where(ddr5, 50, 40)
+    return np.maximum(0, dram_voltage - max_v) * 200 - benefit
+
+def temperature_penalty(temperature, profile):
+    temperature = np.asarray(temperature, dtype=float)
+    warn, critical = IC_PROFILES.thermal[profile, 0], IC_PROFILES.thermal[profile, 1]
+    return np.maximum(0, temperature - warn) * 2 + np.maximum(0, temperature - critical) * 3
+
+def imc_ceiling(ddr5, imc_quality, command_rate, gear, gear_down, vccio_offset, vccsa_offset):
+    # Highest frequency the memory controller trains reliably with these settings
+    ddr5, imc_quality = np.asarray(ddr5, dtype=bool), np.asarray(imc_quality)
+    command_rate, gear = np.asarray(command_rate), np.asarray(gear)
+    ceiling = np.where(ddr5, 4800 + 200 * imc_quality, 3000 + 150 * imc_quality)
+    # A half-rate controller (gear 2) has far more headroom on DDR5
+    ceiling = ceiling + np.where(ddr5 & (gear == 2), 800, 0)
+    # 2T gives commands twice the setup time; DDR4 gear-down mode recovers part of that at 1T
+    ceiling = ceiling + np.where(command_rate == 2, 200, np.where(~ddr5 & np.asarray(gear_down, dtype=bool), 100, 0))
+    # Raising VCCSA/VCCIO buys headroom up to +0.15V each; undervolting costs it
+    vccio_offset, vccsa_offset = np.asarray(vccio_offset, dtype=float), np.asarray(vccsa_offset, dtype=float)
+    return ceiling + 1500 * np.minimum(vccsa_offset, 0.15) + 1000 * np.minimum(vccio_offset, 0.15)
+
+def imc_penalty(speed, ddr5, imc_quality, command_rate, gear, gear_down, vccio_offset, vccsa_offset,
+                dram_voltage, max_imc_voltage):
+    speed = np.asarray(speed, dtype=float)
+    ceiling = imc_ceiling(ddr5, imc_quality, command_rate, gear, gear_down, vccio_offset, vccsa_offset)
+    # Rails far above stock and DRAM voltage beyond what the IMC tolerates both destabilize it
+    rails = np.maximum(0, np.asarray(vccio_offset) - 0.2) + np.maximum(0, np.asarray(vccsa_offset) - 0.2)
+    overvolted = np.maximum(0, np.asarray(dram_voltage, dtype=float) - max_imc_voltage)
+    return np.maximum(0, speed - ceiling) * 0.08 + (rails + overvolted) * 100
+
+# Component name -> (input fields, function)
+STABILITY_COMPONENTS = {
+    "frequency": (("speed", "rated_speed", "quality_bin", "profile"), frequency_penalty),
+    "timings": (("speed", "cl", "trcd", "trp", "tras", "secondaries", "rated_speed", "rated_cl", "rated_trcd",
+                 "rated_trp", "rated_tras", "quality_bin", "ddr5", "profile"), timing_penalty),
+    "voltage": (("dram_voltage", "ddr5", "profile"), voltage_penalty),
+    "temperature": (("temperature", "profile"), temperature_penalty),
+    "imc": (("speed", "ddr5", "imc_quality", "command_rate", "gear", "gear_down", "vccio_offset", "vccsa_offset",
+             "dram_voltage", "max_imc_voltage"), imc_penalty),
+}
+
+def stability_from_penalties(penalties):
+    return np.clip(100 - sum(penalties), 10, 100)
+
+def stability_inputs(module: MemoryModule, controller: MemoryController, **overrides) -> Dict[str, object]:
+    inputs = {
+        "profile": IC_PROFILES.row(module.memory_type, module.ic_type),
+        "ddr5": int(module.memory_type == MemoryType.DDR5),
+        "quality_bin": module.quality_bin,
+        "rated_speed": module.rated_speed,
+        "rated_cl": module.rated_timings[0],
+        "rated_trcd": module.rated_timings[1],
+        "rated_trp": module.rated_timings[2],
+        "rated_tras": module.rated_timings[3],
+        "speed": module.current_speed,
+        "cl": module.current_timings[0],
+        "trcd": module.current_timings[1],
+        "trp": module.current_timings[2],
+        "tras": module.current_timings[3],
+        "secondary_overrides": tuple(sorted(module.secondary_timings.items())),
+        "dram_voltage": round(module.current_voltage, 3),
+        "temperature": round(module.temperature, 1),  # Sensor resolution, keeps the cache effective
+        "imc_quality": controller.imc_quality,
+        # Controllers without 1T support run 2T whatever is set, and gear modes are DDR5 only
+        "command_rate": controller.current_command_rate if controller.supports_command_rate_1t else 2,
+        "supports_1t": int(controller.supports_command_rate_1t),
+        "gear": controller.current_gear_mode if module.memory_type == MemoryType.DDR5 else 1,
+        "gear_down": int(controller.supports_gear_down),
+        "vccio_offset": round(controller.vccio_voltage - controller.stock_vccio, 3),
+        "vccsa_offset": round(controller.vccsa_voltage - controller.stock_vccsa, 3),
+        "max_imc_voltage": controller.max_safe_voltage,
+    }
+    inputs.update(overrides)
+    if "secondaries" not in overrides:
+        inputs["secondaries"] = derived_secondaries(inputs)
+    return inputs
+
+def derived_secondaries(inputs: Dict[str, object]) -> tuple:
+    # Re-derive Auto secondaries after speed or primaries change; manual ones stay put
+    constraints = TIMING_CONSTRAINTS[MemoryType.DDR5 if inputs["ddr5"] else MemoryType.DDR4]
+    primaries = (inputs["cl"], inputs["trcd"], inputs["trp"], inputs["tras"])
+    timings = constraints.derive(inputs["speed"], primaries, dict(inputs["secondary_overrides"]))
+    return tuple(timings[len(PRIMARY_TIMING_NAMES):])
+
+BATCH_SCORED = CONFIGS_EVALUATED.labels("batch")
+BATCH_SIZE_SCORED = BATCH_SIZE.labels("score_batch")
+BATCH_SECONDS = EVALUATION_SECONDS.labels("score_batch")
+
+def score_batch(batch: Dict[str, object]) -> Dict[str, "np.ndarray"]:
+    # Vectorized scoring: every field is a scalar or an array broadcastable to the
+    # batch shape; returns each component's penalty plus the total stability
+    started = time.perf_counter()
+    result = {}
+    for name, (fields, function) in STABILITY_COMPONENTS.items():
+        result[name] = function(*(batch[field] for field in fields))
+    result["stability"] = stability_from_penalties(result[name] for name in STABILITY_COMPONENTS)
+    size = int(np.size(result["stability"]))
+    BATCH_SCORED.inc(size)
+    BATCH_SIZE_SCORED.observe(size)
+    BATCH_SECONDS.observe(time.perf_counter() - started)
+    return result
+
+class StabilityEngine:
+    # Incremental evaluator: each component's value is memoized on exactly the
+    # inputs it reads, so a change to one knob only recomputes the components
+    # that depend on it, and revisited configurations cost nothing.
+    def __init__(self, cache_size: int = 4096):
+        self.cache_size = cache_size
+        self.caches: Dict[str, "OrderedDict[tuple, float]"] = {name: OrderedDict() for name in STABILITY_COMPONENTS}
+        self.evaluations = 0
+        self.recomputed = {name: 0 for name in STABILITY_COMPONENTS}
+
+    def components(self, inputs: Dict[str, object]) -> Dict[str, float]:
+        self.evaluations += 1
+        values = {}
+        misses = 0
+        for name, (fields, function) in STABILITY_COMPONENTS.items():
+            key = tuple(inputs[field] for field in fields)
+            cache = self.caches[name]
+            value = cache.get(key)
+            if value is None:
+                value = float(function(*key))
+                self.recomputed[name] += 1
+                misses += 1
+                cache[key] = value
+                if len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(key)
+            values[name] = value
+        ENGINE_EVALUATED.value += 1
+        STABILITY_CACHE_MISSES.value += misses
+        STABILITY_CACHE_HITS.value += len(values) - misses
+        return values
+
+    def evaluate(self, inputs: Dict[str, object]) -> float:
+        return float(stability_from_penalties(self.components(inputs).values()))
+
+# Performance model: the read/write/copy bandwidth and latency an AIDA64-style
+# memory benchmark would report. Like the stability components it broadcasts
+# over NumPy arrays, so sweeps and searches can rank configs by performance.
+CHANNELS = 2
+BYTES_PER_TRANSFER = 8  # 64-bit channel, two 32-bit subchannels on DDR5
+IMC_LATENCY_NS = (30.0, 33.0)  # DDR4, DDR5: core to memory controller and back
+GEAR2_LATENCY_NS = 7.0  # Controller clocked at half the memory clock
+ROW_MISS_RATE = 0.05  # Streaming accesses that have to open a new row
+ROW_CONFLICT_RATE = 0.5  # Random accesses that find another row open in their bank
+SAME_GROUP_RATE = 0.1  # Back-to-back bursts or activates within one bank group
+BANK_OVERLAP = 8  # Row misses the controller can hide behind work in other banks
+TURNAROUND_BATCH = 16  # Lines moved in one direction before a copy switches
+CONTROLLER_EFFICIENCY = 0.98
+
+PERFORMANCE_FIELDS = ("speed", "cl", "trcd", "trp", "tras", "secondaries", "command_rate", "gear", "ddr5")
+
+def memory_performance(speed, cl, trcd, trp, tras, secondaries, command_rate, gear, ddr5):
+    # Returns MB/s for read, write and copy and ns for latency. Time is counted in
+    # memory clocks per 64-byte line on one (sub)channel, then scaled to the peak rate.
+    speed = np.asarray(speed, dtype=float)
+    cl, trcd, trp = (np.asarray(t, dtype=float) for t in (cl, trcd, trp))
+    secondaries = np.asarray(secondaries, dtype=float)
+    t = {name: secondaries[..., i] for i, name in enumerate(SECONDARY_TIMING_NAMES)}
+    tck = 2000 / speed
+    burst = np.where(ddr5, 8.0, 4.0)  # BL8 on DDR4, BL16 on a half-width DDR5 subchannel
+
+    # Bursts are spaced by the bank-group turnaround, row misses cost a precharge
+    # and activate that other banks partly hide, and tRRD/tFAW cap the activate rate
+    activate = ROW_MISS_RATE * np.maximum(SAME_GROUP_RATE * t["tRRD_L"] + (1 - SAME_GROUP_RATE) * t["tRRD_S"],
+                                          t["tFAW"] / 4)
+    read_ccd = SAME_GROUP_RATE * t["tRDRD_SG"] + (1 - SAME_GROUP_RATE) * t["tRDRD_DG"]
+    write_ccd = SAME_GROUP_RATE * t["tWRWR_SG"] + (1 - SAME_GROUP_RATE) * t["tWRWR_DG"]
+    read_line = np.maximum(np.maximum(burst, read_ccd) + ROW_MISS_RATE * (t["tRTP"] + trp + trcd) / BANK_OVERLAP, activate)
+    write_line = np.maximum(np.maximum(burst, write_ccd) + ROW_MISS_RATE * (t["tWR"] + trp + trcd) / BANK_OVERLAP, activate)
+
+    # A copy alternates batches of reads and writes, paying both bus turnarounds per round
+    write_to_read = t["tCWL"] + burst + SAME_GROUP_RATE * t["tWTR_L"] + (1 - SAME_GROUP_RATE) * t["tWTR_S"]
+    read_to_write = np.maximum(0, cl - t["tCWL"]) + burst + 2
+    copy_line = (read_line + write_line + (write_to_read + read_to_write) / TURNAROUND_BATCH) / 2
+
+    # Refresh blocks the rank for tRFC every tREFI; 2T spends extra command slots
+    available = 1 - t["tRFC"] / t["tREFI"]
+    efficiency = available * CONTROLLER_EFFICIENCY * (1 - 0.02 * (np.asarray(command_rate) - 1)) * \
+        np.where(np.asarray(gear) == 2, 0.98, 1.0)
+    peak = speed * BYTES_PER_TRANSFER * CHANNELS
+    read, write, copy = (peak * efficiency * burst / line for line in (read_line, write_line, copy_line))
+
+    # Pointer chasing mostly misses the open row; an access that lands in a refresh waits half a tRFC
+    dram = (cl + trcd + ROW_CONFLICT_RATE * trp + burst / 2 + 2 * (np.asarray(command_rate) - 1)) * tck
+    refresh_wait = t["tRFC"] / t["tREFI"] * t["tRFC"] / 2 * tck
+    latency = np.where(ddr5, IMC_LATENCY_NS[1], IMC_LATENCY_NS[0]) + \
+        np.where(np.asarray(gear) == 2, GEAR2_LATENCY_NS, 0.0) + dram + refresh_wait
+    return {"read": read, "write": write, "copy": copy, "latency": latency}
+
+# Every input field a batch needs for stability and performance
+BATCH_FIELDS = tuple(sorted({field for fields, _ in STABILITY_COMPONENTS.values() for field in fields} |
+                            set(PERFORMANCE_FIELDS)))
+
+def performance_of(inputs: Dict[str, object]) -> Dict[str, float]:
+    return {name: float(value) for name, value in memory_performance(*(inputs[f] for f in PERFORMANCE_FIELDS)).items()}
+
+def format_performance(performance: Dict[str, float]) -> str:
+    return (f"Read {performance['read']:,.0f} MB/s | Write {performance['write']:,.0f} MB/s | "
+            f"Copy {performance['copy']:,.0f} MB/s | Latency {performance['latency']:.1f} ns")
+
+# SPD EEPROM dumps: a 512-byte DDR4 or 1024-byte DDR5 image per DIMM. Offsets
+# follow the JEDEC SPD layouts and the XMP 2.0/3.0 and EXPO profile blocks as
+# common SPD decoders read them. Times are in picoseconds; DDR4 stores them in
+# 125 ps medium timebase units plus a signed 1 ps fine correction.
+SPD_DEVICE_TYPES = {0x0C: MemoryType.DDR4, 0x12: MemoryType.DDR5}
+SPD_SIZES = {MemoryType.DDR4: 512, MemoryType.DDR5: 1024}
+SPD_U16 = struct.Struct("<H")
+DDR4_DENSITY_GBIT = (0.25, 0.5, 1, 2, 4, 8, 16, 32, 12, 24)
+DDR5_DENSITY_GBIT = (0, 4, 8, 12, 16, 24, 32, 48, 64)
+DDR4_XMP_PROFILE = 393
+DDR5_TIMINGS = struct.Struct("<H2x5Bx4H")  # tCK, (tCKmax), CAS mask, tAA, tRCD, tRP, tRAS
+# XMP 3.0 profiles start with VPP, VDD, VDDQ, a reserved byte and VMEMCTRL,
+# then repeat the base timing block
+DDR5_XMP_PROFILE = 704
+DDR5_EXPO_HEADER = 832
+DDR5_EXPO_PROFILE = 842
+DDR5_EXPO_TIMINGS = struct.Struct("<5H")  # tCK, tAA, tRCD, tRP, tRAS
+# JEP-106 (continuation count, ID) of common module and DRAM makers
+JEP106_MAKERS = {
+    (0, 0x2C): "Micron", (0, 0xAD): "SK Hynix", (0, 0xCE): "Samsung", (1, 0x98): "Kingston",
+    (2, 0x9E): "Corsair", (4, 0xCB): "ADATA", (4, 0xCD): "G.Skill", (4, 0xEF): "Team", (5, 0x9B): "Crucial",
+}
+# SPD doesn't name the die revision, so the IC is guessed from the DRAM maker
+# and die density, with a per-maker fallback
+SPD_IC_GUESSES = {
+    (MemoryType.DDR4, "Samsung", 8): MemoryIC.SAMSUNG_BDIE,
+    (MemoryType.DDR4, "Samsung", 16): MemoryIC.SAMSUNG_CDIE,
+    (MemoryType.DDR4, "Samsung", None): MemoryIC.SAMSUNG_EDIE,
+    (MemoryType.DDR4, "SK Hynix", 8): MemoryIC.HYNIX_CJR,
+    (MemoryType.DDR4, "SK Hynix", 16): MemoryIC.HYNIX_DJR,
+    (MemoryType.DDR4, "SK Hynix", None): MemoryIC.HYNIX_MFR,
+    (MemoryType.DDR4, "Micron", 16): MemoryIC.MICRON_BDIE,
+    (MemoryType.DDR4, "Micron", None): MemoryIC.MICRON_EDIE,
+    (MemoryType.DDR4, None, None): MemoryIC.HYNIX_MFR,
+    (MemoryType.DDR5, "Samsung", None): MemoryIC.SAMSUNG_EDIE,
+    (MemoryType.DDR5, "SK Hynix", None): MemoryIC.HYNIX_MFR,
+    (MemoryType.DDR5, None, None): MemoryIC.MICRON_BDIE,
+}
+
+def spd_clocks(t: int, tck: int) -> int:
+    # JEDEC rounding: round up, but forgive values within 2.6% of a clock
+    return (t * 1000 // tck + 974) // 1000
+
+def spd_cas_latency(taa: int, tck: int, mask: int, first: int, step: int) -> int:
+    # Lowest supported CAS latency covering tAA; bit i of the mask is CL first + step * i
+    cl = spd_clocks(taa, tck)
+    while mask:
+        if mask & 1 and first >= cl:
+            return first
+        mask >>= 1
+        first += step
+    return cl
+
+def spd_speed(tck: int) -> int:
+    # Data rate in MT/s, snapped to the 33/66/100 MHz grid speeds are sold on
+    return round(6e6 / tck / 100) * 100 // 3
+
+def spd_maker(view: memoryview, offset: int) -> Optional[str]:
+    return JEP106_MAKERS.get((view[offset] & 0x7F, view[offset + 1]))
+
+def parse_ddr4_spd(view: memoryview) -> Optional[tuple]:
+    signed = view.cast("b")
+    tck = view[18] * 125 + signed[125]
+    if binascii.crc_hqx(view[:126], 0) != SPD_U16.unpack_from(view, 126)[0] or tck <= 0:
+        return None
+
+    def timings(tck, taa, trcd, trp, tras, cas_mask):
+        # Bit 31 of the CAS mask selects the high CL range
+        first_cl = 23 if cas_mask >> 31 else 7
+        return [spd_cas_latency(taa, tck, cas_mask & 0x3FFFFFFF, first_cl, 1),
+                spd_clocks(trcd, tck), spd_clocks(trp, tck), spd_clocks(tras, tck)]
+
+    jedec = (spd_speed(tck), timings(tck, view[24] * 125 + signed[123], view[25] * 125 + signed[122],
+                                     view[26] * 125 + signed[121], ((view[27] & 0x0F) << 8 | view[28]) * 125,
+                                     int.from_bytes(view[20:24], "little")))
+    rated, voltage = jedec, 1.2
+    p = DDR4_XMP_PROFILE
+    if view[384] == 0x0C and view[385] == 0x4A and view[386] & 1:
+        xmp_tck = view[p + 3] * 125 + signed[p + 38]
+        if xmp_tck > 0:
+            rated = (spd_speed(xmp_tck), timings(xmp_tck, view[p + 8] * 125 + signed[p + 37],
+                                                 view[p + 9] * 125 + signed[p + 36], view[p + 10] * 125 + signed[p + 35],
+                                                 ((view[p + 11] & 0x0F) << 8 | view[p + 12]) * 125,
+                                                 int.from_bytes(view[p + 4:p + 8], "little")))
+            voltage = (view[p] >> 7) + (view[p] & 0x7F) / 100
+
+    if view[4] & 0x0F >= len(DDR4_DENSITY_GBIT):
+        return None  # Reserved density code
+    density = DDR4_DENSITY_GBIT[view[4] & 0x0F]
+    dies = ((view[6] >> 4) & 0x07) + 1 if view[6] & 0x03 == 0x02 else 1  # 3DS stacks
+    capacity = density / 8 * (8 << (view[13] & 0x07)) / (4 << (view[12] & 0x07)) * (((view[12] >> 3) & 0x07) + 1) * dies
+    return MemoryType.DDR4, spd_maker(view, 320), bytes(view[329:349]), spd_maker(view, 350), density, jedec, rated, voltage, capacity
+
+def parse_ddr5_spd(view: memoryview) -> Optional[tuple]:
+    if binascii.crc_hqx(view[:510], 0) != SPD_U16.unpack_from(view, 510)[0]:
+        return None
+
+    def timings(block: tuple):
+        tck, *cas, taa, trcd, trp, tras = block
+        if tck <= 0:
+            return None
+        mask = int.from_bytes(bytes(cas), "little")
+        return (spd_speed(tck), [spd_cas_latency(taa, tck, mask, 20, 2), spd_clocks(trcd, tck),
+                                 spd_clocks(trp, tck), spd_clocks(tras, tck)])
+
+    def volts(value: int) -> float:
+        return ((value >> 5) & 0x03) + (value & 0x1F) * 0.05
+
+    jedec = timings(DDR5_TIMINGS.unpack_from(view, 20))
+    if jedec is None:
+        return None
+    rated, voltage = jedec, 1.1
+    if view[640] == 0x0C and view[641] == 0x4A and view[642] & 1:
+        xmp = timings(DDR5_TIMINGS.unpack_from(view, DDR5_XMP_PROFILE + 5))
+        if xmp is not None:
+            rated, voltage = xmp, volts(view[DDR5_XMP_PROFILE + 1])
+    elif view[DDR5_EXPO_HEADER:DDR5_EXPO_HEADER + 4] == b"EXPO" and view[DDR5_EXPO_HEADER + 5] & 1:
+        tck, *rest = DDR5_EXPO_TIMINGS.unpack_from(view, DDR5_EXPO_PROFILE + 4)
+        expo = timings((tck, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, *rest))
+        if expo is not None:
+            rated, voltage = expo, volts(view[DDR5_EXPO_PROFILE])
+
+    density = DDR5_DENSITY_GBIT[min(view[4] & 0x1F, len(DDR5_DENSITY_GBIT) - 1)]
+    dies = (1, 1, 2, 4, 8, 16, 1, 1)[view[4] >> 5]
+    capacity = ((1 << ((view[235] >> 5) & 0x03)) * (8 << (view[235] & 0x07)) / (4 << (view[6] >> 5))
+                * dies * density / 8 * (((view[234] >> 3) & 0x07) + 1))
+    return MemoryType.DDR5, spd_maker(view, 512), bytes(view[521:551]), spd_maker(view, 552), density, jedec, rated, voltage, capacity
+
+def parse_spd(view: memoryview) -> Optional[tuple]:
+    # Catalog row for one SPD image, or None when it isn't a valid DDR4/DDR5 dump.
+    # The image is read in place through the view; only the part number is copied.
+    memory_type = SPD_DEVICE_TYPES.get(view[2]) if len(view) > 2 else None
+    if memory_type is None or len(view) != SPD_SIZES[memory_type]:
+        return None
+    parsed = (parse_ddr4_spd if memory_type == MemoryType.DDR4 else parse_ddr5_spd)(view)
+    if parsed is None:
+        return None
+    memory_type, maker, part, dram_maker, density, (jedec_speed, jedec_timings), (rated_speed, rated_timings), voltage, capacity = parsed
+    part = part.decode("ascii", "replace").strip(" \x00")
+    name = " ".join(filter(None, (maker, part))) or f"{dram_maker or 'Generic'} {memory_type.value}-{rated_speed}"
+    ic = (SPD_IC_GUESSES.get((memory_type, dram_maker, density))
+          or SPD_IC_GUESSES.get((memory_type, dram_maker, None))
+          or SPD_IC_GUESSES[(memory_type, None, None)])
+    # Bin by how far the rated profile reaches into the IC's frequency range
+    low, high = IC_PROFILES.frequency_range[IC_PROFILES.row(memory_type, ic)]
+    quality_bin = int(max(1, min(10, round(1 + 9 * (rated_speed - low) / max(1, high - low)))))
+    return (name, memory_type.value, ic.value, jedec_speed, jedec_timings, rated_speed, rated_timings,
+            round(voltage, 3), max(1, round(capacity)), 35.0 if memory_type == MemoryType.DDR4 else 40.0, quality_bin)
+
+def parse_spd_files(paths: List[str]) -> Tuple[List[tuple], int]:
+    # Parse a chunk of dump files through one reusable buffer. Returns the
+    # catalog rows and the number of files that weren't valid dumps.
+    buffer = bytearray(max(SPD_SIZES.values()) + 1)
+    view = memoryview(buffer)
+    rows, invalid = [], 0
+    for path in paths:
+        try:
+            with open(path, "rb", buffering=0) as f:
+                size = f.readinto(buffer)
+        except OSError:
+            invalid += 1
+            continue
+        row = parse_spd(view[:size])
+        if row is None:
+            invalid += 1
+        else:
+            rows.append(row)
+    return rows, invalid
+
+def import_spd_dumps(paths: List[str], workers: Optional[int] = None,
+                     chunk_size: int = 1024) -> Tuple[List[tuple], int, int]:
+    # Parse every dump under the given files and directories, in parallel for
+    # large imports. Returns the distinct catalog rows, the number of valid
+    # dumps and the number of invalid files.
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, names in os.walk(path):
+                files.extend(os.path.join(directory, name) for name in sorted(names))
+        else:
+            files.append(path)
+    chunks = [files[i:i + chunk_size] for i in range(0, len(files), chunk_size)]
+    results = run_pool("spd_import", parse_spd_files, chunks, workers)
+    rows = OrderedDict()
+    for chunk_rows, _ in results:
+        for row in chunk_rows:
+            rows.setdefault(json.dumps(row), row)
+    invalid = sum(invalid for _, invalid in results)
+    return list(rows.values()), len(files) - invalid, invalid
+
+# Kits imported from SPD dumps, added to the catalog after the built-in kits
+KIT_FILE = os.path.join(os.environ.get("XDG_DATA_HOME", os.path.join(os.path.expanduser("~"), ".local", "share")),
+                        "ramtimings", "kits.json")
+_imported_kits: Optional[List[tuple]] = None
+
+def imported_kit_rows() -> List[tuple]:
+    global _imported_kits
+    if _imported_kits is None:
+        try:
+            with open(KIT_FILE) as f:
+                _imported_kits = [tuple(row) for row in json.load(f)]
+        except (OSError, ValueError):
+            _imported_kits = []
+    return _imported_kits
+
+def add_imported_kits(rows: List[tuple]) -> int:
+    # Add new kits to the imported catalog; returns how many were new. A kit
+    # whose name is already taken by a different kit gets a numbered name.
+    global _imported_kits
+    kits = list(imported_kit_rows())
+    known = {json.dumps(list(row)) for row in kits}
+    names = {row[0] for row in kits} | {kit.name for kit in builtin_kits()}
+    added = 0
+    for row in rows:
+        row = json.loads(json.dumps(row))
+        name, suffix = row[0], 2
+        while json.dumps([name] + row[1:]) not in known:
+            if name not in names:
+                names.add(name)
+                known.add(json.dumps([name] + row[1:]))
+                kits.append(tuple([name] + row[1:]))
+                added += 1
+                break
+            name, suffix = f"{row[0]} #{suffix}", suffix + 1
+    os.makedirs(os.path.dirname(KIT_FILE), exist_ok=True)
+    tmp_path = KIT_FILE + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(kits, f)
+    os.replace(tmp_path, KIT_FILE)
+    _imported_kits = kits
+    return added
+
+def find_kit(spec: str) -> MemoryModule:
+    # 1-based catalog index or a case-insensitive part of the kit name
+    kits = kit_catalog()
+    if str(spec).isdigit() and 1 <= int(spec) <= len(kits):
+        return kits[int(spec) - 1]
+    matches = [kit for kit in kits if str(spec).lower() in kit.name.lower()]
+    if len(matches) != 1:
+        raise ValueError(f"Kit '{spec}' matches {len(matches)} catalog entries")
+    return matches[0]
+
+def find_controller(spec: str) -> Tuple[str, MemoryController]:
+    controllers = controller_catalog()
+    if str(spec).isdigit() and 1 <= int(spec) <= len(controllers):
+        return controllers[int(spec) - 1]
+    matches = [entry for entry in controllers if str(spec).lower() in entry[0].lower()]
+    if len(matches) != 1:
+        raise ValueError(f"Controller '{spec}' matches {len(matches)} catalog entries")
+    return matches[0]
+
+def parse_timings(value) -> List[int]:
+    timings = [int(t) for t in value.split("-")] if isinstance(value, str) else [int(t) for t in value]
+    if len(timings) != 4:
+        raise ValueError("Primary timings need four values: CL-tRCD-tRP-tRAS")
+    return timings
+
+def load_activity(load: str) -> float:
+    return ThermalModel.IDLE_ACTIVITY if load == "idle" else ThermalModel.STRESS_ACTIVITY[load]
+
+def configure(config: Dict[str, object]) -> Tuple[MemoryModule, str, MemoryController]:
+    # A kit and controller set up as the config describes. Speed, timings and
+    # voltage default to the kit's XMP profile, the controller to its stock
+    # settings, and the temperature is the steady state under the given load.
+    thermal = ThermalModel()
+    module = find_kit(config.get("kit", 1))
+    controller_name, controller = find_controller(config.get("controller", 1))
+    module.current_speed = int(config.get("speed", module.rated_speed))
+    module.current_timings = parse_timings(config.get("timings", module.rated_timings))
+    module.current_voltage = float(config.get("voltage", module.voltage))
+    if module.current_speed <= 0:
+        raise ValueError(f"Speed must be positive, not {module.current_speed}")
+    if min(module.current_timings) <= 0:
+        raise ValueError(f"Timings must be positive: {'-'.join(map(str, module.current_timings))}")
+    if not module.current_voltage > 0:
+        raise ValueError(f"Voltage must be positive, not {module.current_voltage}")
+    secondaries = config.get("secondaries", {})
+    if not isinstance(secondaries, dict) or not set(secondaries) <= set(SECONDARY_TIMING_NAMES):
+        raise ValueError(f"Secondaries must map timing names ({', '.join(SECONDARY_TIMING_NAMES)}) to values")
+    module.secondary_timings = {name: int(value) for name, value in secondaries.items()}
+    controller.current_command_rate = int(config.get("command_rate", controller.current_command_rate))
+    controller.current_gear_mode = int(config.get("gear", controller.current_gear_mode))
+    controller.vccio_voltage = float(config.get("vccio", controller.vccio_voltage))
+    controller.vccsa_voltage = float(config.get("vccsa", controller.vccsa_voltage))
+    power = thermal.module_power([module], load_activity(config.get("load", "heavy")))[0]
+    module.temperature = float(thermal.steady_state(power, float(config.get("ambient", 25.0)),
+                                                    thermal.resistance(config.get("cooling", "Stock"))))
+    return module, controller_name, controller
+
+def evaluate_configs(configs: List[Dict[str, object]],
+                     leaderboard: Optional["Leaderboard"] = None) -> List[Dict[str, object]]:
+    # Score any number of configurations (see configure) in one vectorized pass.
+    # With a leaderboard, stable results are offered to it.
+    started = time.perf_counter()
+    rows, results, hardware = [], [], []
+    for config in configs:
+        module, controller_name, controller = configure(config)
+        load = config.get("load", "heavy")
+        inputs = stability_inputs(module, controller)
+        rows.append(inputs)
+        if leaderboard is not None:
+            hardware.append((module, controller_name, controller))
+        results.append({
+            "kit": module.name,
+            "controller": controller_name,
+            "speed": module.current_speed,
+            "timings": module.current_timings,
+            "secondaries": dict(zip(SECONDARY_TIMING_NAMES, inputs["secondaries"])),
+            "voltage": module.current_voltage,
+            "load": load,
+            "temperature": round(module.temperature, 1),
+        })
+    if not rows:
+        return results
+
+    batch = {field: np.array([row[field] for row in rows]) for field in BATCH_FIELDS}
+    scores = score_batch(batch)
+    performance = memory_performance(*(batch[field] for field in PERFORMANCE_FIELDS))
+    for i, result in enumerate(results):
+        result["stability"] = round(float(scores["stability"][i]), 2)
+        result["penalties"] = {name: round(float(scores[name][i]), 2) for name in STABILITY_COMPONENTS}
+        result["performance"] = {name: round(float(values[i]), 1) for name, values in performance.items()}
+        if leaderboard is not None and result["stability"] >= LEADERBOARD_MIN_STABILITY:
+            leaderboard.insert(leaderboard_entry(*hardware[i], rows[i], result["stability"], "sweep",
+                                                 {name: values[i] for name, values in performance.items()}))
+    EVALUATION_SECONDS.labels("evaluate").observe(time.perf_counter() - started)
+    return results
+
+def sensitivity_knobs(inputs: Dict[str, object]) -> List[Tuple[str, str, float]]:
+    # (label, input field or secondary timing name, step) for every knob a user can turn
+    knobs = [("Frequency", "speed", 200 if inputs["ddr5"] else 100)]
+    knobs += [(name, field, 1) for name, field in zip(PRIMARY_TIMING_NAMES, AutoTuner.TIMING_FIELDS)]
+    knobs += [(name, name, max(1, round(value * 0.05))) for name, value in zip(SECONDARY_TIMING_NAMES, inputs["secondaries"])]
+    knobs += [("DRAM Voltage", "dram_voltage", 0.01), ("VCCIO", "vccio_offset", 0.025), ("VCCSA", "vccsa_offset", 0.025)]
+    return knobs
+
+def perturbed(inputs: Dict[str, object], knob: str, value) -> Dict[str, object]:
+    # Copy of `inputs` with one knob set; Auto secondaries follow speed and primaries
+    if knob in SECONDARY_TIMING_NAMES:
+        overrides = dict(inputs["secondary_overrides"], **{knob: value})
+        result = dict(inputs, secondary_overrides=tuple(sorted(overrides.items())))
+    else:
+        result = dict(inputs, **{knob: value})
+    result["secondaries"] = derived_secondaries(result)
+    return result
+
+def sensitivity_analysis(inputs: Dict[str, object], ambient: float, resistance: float,
+                         activity: float) -> List[Dict[str, object]]:
+    # Central differences for every knob, with all 2 * knobs + 1 configs scored in
+    # one batch. Stability is taken before clipping to 10..100, so the margin
+    # still moves when the displayed score is pinned at 100%.
+    started = time.perf_counter()
+    thermal = ThermalModel()
+    knobs = sensitivity_knobs(inputs)
+    current = dict(zip(SECONDARY_TIMING_NAMES, inputs["secondaries"]))
+    constraints = TIMING_CONSTRAINTS[MemoryType.DDR5 if inputs["ddr5"] else MemoryType.DDR4]
+    rows, spans = [inputs], []
+    for label, knob, step in knobs:
+        value = current[knob] if knob in SECONDARY_TIMING_NAMES else inputs[knob]
+        low = value - step
+        if label in constraints.INDEX:  # Timings stay at or above the clocks the BIOS accepts
+            low = max(constraints.min_clocks[constraints.INDEX[label]], low)
+        elif knob == "speed":
+            low = max(1, low)
+        rows += [perturbed(inputs, knob, low), perturbed(inputs, knob, value + step)]
+        spans.append((value + step - low) / step)
+
+    batch = {field: np.array([row[field] for row in rows]) for field in BATCH_FIELDS}
+    power = thermal.power(batch["speed"], batch["dram_voltage"], activity, batch["ddr5"])
+    batch["temperature"] = thermal.steady_state(power, ambient, resistance)
+    scores = score_batch(batch)
+    metrics = {
+        "stability": 100 - sum(scores[name] for name in STABILITY_COMPONENTS),
+        "temperature": batch["temperature"],
+        "latency": memory_performance(*(batch[field] for field in PERFORMANCE_FIELDS))["latency"],
+    }
+    results = []
+    for i, ((label, knob, step), span) in enumerate(zip(knobs, spans)):
+        result = {"knob": label, "step": step}
+        for metric, values in metrics.items():
+            result[metric] = float(values[2 * i + 2] - values[2 * i + 1]) / span
+        results.append(result)
+    results.sort(key=lambda result: (abs(result["stability"]), abs(result["latency"])), reverse=True)
+    EVALUATION_SECONDS.labels("sensitivity").observe(time.perf_counter() - started)
+    return results
+
+class StabilityHeatmap:
+    # Stability over two knobs, computed in square tiles aligned to an absolute
+    # grid (cell k holds value k * step). Tiles are cached by axes, tile position
+    # and a hash of every other input, so switching views or moving the window
+    # along an axis only computes tiles that were never seen; all missing tiles
+    # of one request are scored as a single batch.
+    AXES = {  # name -> (input field, label, step for DDR4, step for DDR5)
+        "frequency": ("speed", "MHz", 100, 200),
+        "cl": ("cl", "CL", 1, 1),
+        "trcd": ("trcd", "tRCD", 1, 1),
+        "voltage": ("dram_voltage", "V", 0.02, 0.02),
+    }
+    VIEWS = (("frequency", "cl"), ("frequency", "voltage"), ("voltage", "trcd"))
+    TILE = 8
+    SHADES = ((95, "█"), (90, "▓"), (80, "▒"), (60, "░"), (0, "·"))
+
+    def __init__(self, max_tiles: int = 512):
+        self.max_tiles = max_tiles
+        self.tiles: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self.computed_tiles = 0
+        self.cached_tiles = 0
+
+    def step(self, axis: str, inputs: Dict[str, object]) -> float:
+        return self.AXES[axis][3 if inputs["ddr5"] else 2]
+
+    def value(self, axis: str, inputs: Dict[str, object], k: int):
+        value = k * self.step(axis, inputs)
+        return round(value, 3) if isinstance(value, float) else value
+
+    def context(self, inputs: Dict[str, object], axes: Tuple[str, str], environment: tuple) -> str:
+        # Everything except the two axes; Auto secondaries and temperature are recomputed per cell
+        skip = {self.AXES[axis][0] for axis in axes} | {"secondaries", "temperature"}
+        fields = tuple((field, inputs[field]) for field in sorted(inputs) if field not in skip)
+        return hashlib.sha1(repr((fields, environment)).encode()).hexdigest()
+
+    def grid(self, inputs: Dict[str, object], axes: Tuple[str, str], environment: tuple,
+             width: int = 32, height: int = 16):
+        # Stability for a width x height window centred on the current settings.
+        # Returns (x grid indices, y grid indices, stability array [y, x]).
+        x_axis, y_axis = axes
+        centre = [round(inputs[self.AXES[axis][0]] / self.step(axis, inputs)) for axis in axes]
+        x0, y0 = max(1, centre[0] - width // 2), max(1, centre[1] - height // 2)
+        xs, ys = range(x0, x0 + width), range(y0, y0 + height)
+        context = self.context(inputs, axes, environment)
+
+        needed = [(tx, ty) for ty in range(y0 // self.TILE, (y0 + height - 1) // self.TILE + 1)
+                  for tx in range(x0 // self.TILE, (x0 + width - 1) // self.TILE + 1)]
+        # Take the cached tiles first: computing the missing ones may evict them
+        window = {}
+        for tile in needed:
+            key = (axes, tile, context)
+            if key in self.tiles:
+                self.tiles.move_to_end(key)
+                window[tile] = self.tiles[key]
+        missing = [tile for tile in needed if tile not in window]
+        self.cached_tiles += len(window)
+        CACHE_REQUESTS.labels("heatmap", "hit").inc(len(window))
+        CACHE_REQUESTS.labels("heatmap", "miss").inc(len(missing))
+        if missing:
+            started = time.perf_counter()
+            window.update(self._compute(inputs, axes, environment, context, missing))
+            EVALUATION_SECONDS.labels("heatmap").observe(time.perf_counter() - started)
+
+        result = np.empty((height, width))
+        for (tx, ty) in needed:
+            tile = window[(tx, ty)]
+            for ky in range(max(y0, ty * self.TILE), min(y0 + height, (ty + 1) * self.TILE)):
+                for kx in range(max(x0, tx * self.TILE), min(x0 + width, (tx + 1) * self.TILE)):
+                    result[ky - y0, kx - x0] = tile[ky - ty * self.TILE, kx - tx * self.TILE]
+        return xs, ys, result
+
+    def _compute(self, inputs, axes, environment, context, tiles):
+        x_field, y_field = (self.AXES[axis][0] for axis in axes)
+        cells = [(tile, kx, ky) for tile in tiles
+                 for ky in range(tile[1] * self.TILE, (tile[1] + 1) * self.TILE)
+                 for kx in range(tile[0] * self.TILE, (tile[0] + 1) * self.TILE)]
+        batch = {field: np.full(len(cells), inputs[field]) for field in BATCH_FIELDS if field != "secondaries"}
+        batch[x_field] = np.array([max(self.value(axes[0], inputs, kx), 0) for _, kx, _ in cells])
+        batch[y_field] = np.array([max(self.value(axes[1], inputs, ky), 0) for _, _, ky in cells])
+        batch["speed"] = np.maximum(batch["speed"], 1)
+
+        # Auto secondaries only depend on speed and primaries, so derive each combination once
+        derived = {}
+        secondaries = []
+        for i in range(len(cells)):
+            key = tuple(int(batch[field][i]) for field in ("speed", "cl", "trcd", "trp", "tras"))
+            if key not in derived:
+                cell = dict(inputs, speed=key[0], cl=key[1], trcd=key[2], trp=key[3], tras=key[4])
+                derived[key] = derived_secondaries(cell)
+            secondaries.append(derived[key])
+        batch["secondaries"] = np.array(secondaries)
+
+        thermal = ThermalModel()
+        ambient, resistance, activity = environment
+        power = thermal.power(batch["speed"], batch["dram_voltage"], activity, batch["ddr5"])
+        batch["temperature"] = thermal.steady_state(power, ambient, resistance)
+        stability = score_batch(batch)["stability"].reshape(len(tiles), self.TILE, self.TILE)
+        for tile, values in zip(tiles, stability):
+            self.tiles[(axes, tile, context)] = values
+            if len(self.tiles) > self.max_tiles:
+                self.tiles.popitem(last=False)
+        self.computed_tiles += len(tiles)
+        return dict(zip(tiles, stability))
+
+    def render(self, inputs: Dict[str, object], axes: Tuple[str, str], environment: tuple,
+               width: int = 32, height: int = 16) -> List[str]:
+        xs, ys, values = self.grid(inputs, axes, environment, width, height)
+        current = [round(inputs[self.AXES[axis][0]] / self.step(axis, inputs)) for axis in axes]
+        x_label, y_label = (self.AXES[axis][1] for axis in axes)
+        lines = []
+        for row, ky in reversed(list(enumerate(ys))):
+            cells = "".join("◆" if (kx, ky) == tuple(current) else
+                            next(char for threshold, char in self.SHADES if values[row, col] >= threshold)
+                            for col, kx in enumerate(xs))
+            lines.append(f"{self.value(axes[1], inputs, ky):>7} {y_label:<5}|{cells}")
+        lines.append(" " * 13 + "+" + "-" * len(xs))
+        ticks = list(xs[::8])
+        lines.append(" " * 14 + "".join(f"{self.value(axes[0], inputs, k):<8}" for k in ticks) + x_label)
+        lines.append("Stability: " + "  ".join(f"{char} >={threshold}%" for threshold, char in self.SHADES[:-1]) +
+                     "  · lower  ◆ current")
+        return lines
+
+class AutoTuner:
+    # Best-improvement hill climb over speed, primary timings, DRAM voltage and
+    # the controller's command rate, gear and VCCIO/VCCSA.
+    # Neighbors differ from the current point in one knob (or a speed step with
+    # proportionally scaled timings), so the incremental engine only recomputes
+    # the components that knob feeds. Feasible points are ranked by the modeled
+    # latency or read bandwidth, with the other as the tie-breaker.
+    TIMING_FIELDS = ("cl", "trcd", "trp", "tras")
+    GOALS = ("latency", "bandwidth")
+    MAX_RAIL_OFFSET = 0.15  # Where extra VCCIO/VCCSA stops buying headroom
+
+    def __init__(self, inputs: Dict[str, object], temperature_fn, min_stability: float = 90.0,
+                 engine: Optional[StabilityEngine] = None, max_steps: int = 200, goal: str = "latency"):
+        if goal not in self.GOALS:
+            raise ValueError(f"Unknown tuning goal: {goal}")
+        self.goal = goal
+        self.start = dict(inputs)
+        self.temperature_fn = temperature_fn  # (speed, voltage) -> °C under load
+        self.min_stability = min_stability
+        self.engine = engine or StabilityEngine()
+        self.max_steps = max_steps
+        profile = inputs["profile"]
+        self.speed_step = 200 if inputs["ddr5"] else 100
+        self.max_voltage = round(float(IC_PROFILES.voltage[profile, 1]), 3)  # Stay within the daily limit
+        self.evaluations = 0
+
+    def score(self, inputs: Dict[str, object]) -> tuple:
+        inputs["secondaries"] = derived_secondaries(inputs)
+        inputs["temperature"] = round(float(self.temperature_fn(inputs["speed"], inputs["dram_voltage"])), 1)
+        stability = self.engine.evaluate(inputs)
+        self.evaluations += 1
+        if stability < self.min_stability:
+            return (0, stability, 0)
+        performance = performance_of(inputs)
+        if self.goal == "bandwidth":
+            return (1, round(performance["read"]), -performance["latency"])
+        return (1, -round(performance["latency"], 2), performance["read"])
+
+    def neighbors(self, inputs: Dict[str, object]):
+        for field in self.TIMING_FIELDS:
+            for delta in (-1, 1):
+                if inputs[field] + delta >= 1:
+                    yield dict(inputs, **{field: inputs[field] + delta})
+        for delta in (-0.01, 0.01):
+            voltage = round(inputs["dram_voltage"] + delta, 3)
+            if voltage <= self.max_voltage:
+                yield dict(inputs, dram_voltage=voltage)
+        if inputs["supports_1t"]:
+            yield dict(inputs, command_rate=3 - inputs["command_rate"])
+        if inputs["ddr5"]:
+            yield dict(inputs, gear=3 - inputs["gear"])
+        for rail in ("vccio_offset", "vccsa_offset"):
+            for delta in (-0.025, 0.025):
+                offset = round(inputs[rail] + delta, 3)
+                if -0.1 <= offset <= self.MAX_RAIL_OFFSET:
+                    yield dict(inputs, **{rail: offset})
+        for direction in (-1, 1):
+            speed = inputs["speed"] + direction * self.speed_step
+            yield dict(inputs, speed=speed)
+            ratio = speed / inputs["speed"]
+            yield dict(inputs, speed=speed, **{field: max(1, math.ceil(inputs[field] * ratio)) for field in self.TIMING_FIELDS})
+
+    def run(self) -> Tuple[Dict[str, object], float]:
+        started = time.perf_counter()
+        current = dict(self.start)
+        current_score = self.score(current)
+        self.path = [current]  # Every accepted step, so callers can replay the climb
+        for _ in range(self.max_steps):
+            best, best_score = self.step(current, current_score)
+            if best is None:
+                break
+            current, current_score = best, best_score
+            self.path.append(current)
+        EVALUATION_SECONDS.labels("auto_tune").observe(time.perf_counter() - started)
+        return current, self.engine.evaluate(current)
+
+    def step(self, current: Dict[str, object], current_score: tuple) -> Tuple[Optional[Dict[str, object]], tuple]:
+        # One search iteration: the best neighbor that beats the current point, if any
+        best, best_score = None, current_score
+        for candidate in self.neighbors(current):
+            candidate_score = self.score(candidate)
+            if candidate_score > best_score:
+                best, best_score = candidate, candidate_score
+        return best, best_score
+
+class IslandTuner:
+    # Island-model genetic search over the whole space the hill climb only
+    # walks one knob at a time: speed, primaries, every secondary timing, DRAM
+    # voltage, VCCIO/VCCSA, command rate and gear. Each island evolves its own
+    # population for `migration_interval` generations in a worker process,
+    # scoring each generation as one batch, then sends copies of its elites to
+    # replace the worst of the next island around the ring. Islands draw from
+    # streams named by island and epoch, so the result doesn't depend on how
+    # many workers run them. Fitness ranks like the hill climb: any feasible
+    # point beats every infeasible one, which rank by stability.
+    GENES = ("speed",) + AutoTuner.TIMING_FIELDS + SECONDARY_TIMING_NAMES + (
+        "dram_voltage", "vccio_offset", "vccsa_offset", "command_rate", "gear")
+    TIMINGS = slice(1, 1 + len(PRIMARY_TIMING_NAMES) + len(SECONDARY_TIMING_NAMES))
+    SECONDARIES = slice(1 + len(PRIMARY_TIMING_NAMES), 1 + len(PRIMARY_TIMING_NAMES) + len(SECONDARY_TIMING_NAMES))
+
+    def __init__(self, inputs: Dict[str, object], environment: tuple, min_stability: float = 90.0,
+                 goal: str = "latency", islands: int = 4, population: int = 48, generations: int = 60,
+                 migration_interval: int = 5, migrants: int = 2, streams: Optional["RandomStreams"] = None):
+        if goal not in AutoTuner.GOALS:
+            raise ValueError(f"Unknown tuning goal: {goal}")
+        self.goal = goal
+        self.start = dict(inputs, secondaries=derived_secondaries(inputs))
+        self.environment = environment  # (ambient °C, cooling °C/W, load activity)
+        self.min_stability = min_stability
+        self.islands, self.population, self.generations = islands, population, generations
+        self.migration_interval, self.migrants = migration_interval, migrants
+        self.streams = streams or RandomStreams()
+        ddr5 = bool(inputs["ddr5"])
+        self.constraints = TIMING_CONSTRAINTS[MemoryType.DDR5 if ddr5 else MemoryType.DDR4]
+
+        # Bounds and mutation steps per gene; timings below their minimums are
+        # lifted by the constraint repair rather than clipped here
+        profile = inputs["profile"]
+        speed_step = 200 if ddr5 else 100
+        start = self.genome(self.start)
+        timings = start[self.TIMINGS]
+        ceilings = np.array(SECONDARY_IS_CEILING)
+        timing_high = np.concatenate([timings[:4] * 2, np.where(ceilings, 65535, timings[4:] * 2)])
+        self.low = np.concatenate([[speed_step], np.ones_like(timings),
+                                   [IC_PROFILES.voltage[profile, 0], -0.1, -0.1, 1 if inputs["supports_1t"] else 2, 1]])
+        self.high = np.concatenate([[max(IC_PROFILES.frequency_range[profile, 1], inputs["speed"]) + 2 * speed_step],
+                                    timing_high, [IC_PROFILES.voltage[profile, 1], AutoTuner.MAX_RAIL_OFFSET,
+                                                  AutoTuner.MAX_RAIL_OFFSET, 2, 2 if ddr5 else 1]])
+        self.steps = np.concatenate([[speed_step], np.ones(4), np.maximum(1, np.round(timings[4:] * 0.05)),
+                                     [0.01, 0.025, 0.025, 1, 1]])
+        self.mutation_rate = 2 / len(self.GENES)
+        self.generation = 0
+        self.evaluations = 0
+        self.best: Optional[Dict[str, object]] = None
+        self.best_fitness, self.best_stability = -np.inf, 0.0
+        self.elapsed = 0.0
+
+    def genome(self, inputs: Dict[str, object]) -> "np.ndarray":
+        return np.array([inputs["speed"], *(inputs[field] for field in AutoTuner.TIMING_FIELDS), *inputs["secondaries"],
+                         inputs["dram_voltage"], inputs["vccio_offset"], inputs["vccsa_offset"],
+                         inputs["command_rate"], inputs["gear"]], dtype=float)
+
+    def individual(self, genes) -> Dict[str, object]:
+        # Inputs for one genome; every secondary is set by hand
+        speed, cl, trcd, trp, tras = (int(value) for value in genes[:5])
+        secondaries = tuple(int(value) for value in genes[self.SECONDARIES])
+        voltage, vccio, vccsa, command_rate, gear = genes[self.SECONDARIES.stop:]
+        return dict(self.start, speed=speed, cl=cl, trcd=trcd, trp=trp, tras=tras, secondaries=secondaries,
+                    secondary_overrides=tuple(sorted(zip(SECONDARY_TIMING_NAMES, secondaries))),
+                    dram_voltage=round(float(voltage), 3), vccio_offset=round(float(vccio), 3),
+                    vccsa_offset=round(float(vccsa), 3), command_rate=int(command_rate), gear=int(gear))
+
+    def normalize(self, population):
+        # Onto the knobs' grids and bounds, with each timing set repaired to a valid one
+        population = np.clip(population, self.low, self.high)
+        population[:, :self.SECONDARIES.stop] = np.round(population[:, :self.SECONDARIES.stop])
+        population[:, 0] = np.maximum(self.low[0], np.round(population[:, 0] / self.steps[0]) * self.steps[0])
+        population[:, -5:-2] = np.round(population[:, -5:-2], 3)
+        population[:, -2:] = np.round(population[:, -2:])
+        for genes in population:
+            genes[self.TIMINGS] = self.constraints.repair([int(value) for value in genes[self.TIMINGS]])
+        return population
+
+    def fitness(self, population) -> Tuple["np.ndarray", "np.ndarray"]:
+        # The whole population as one batch
+        size = len(population)
+        batch = {field: np.full(size, self.start[field]) for field in BATCH_FIELDS if field != "secondaries"}
+        for i, field in enumerate(self.GENES[:5]):
+            batch[field] = population[:, i]
+        batch["secondaries"] = population[:, self.SECONDARIES]
+        for field, column in zip(self.GENES[-5:], population[:, -5:].T):
+            batch[field] = column
+        thermal = ThermalModel()
+        ambient, resistance, activity = self.environment
+        power = thermal.power(batch["speed"], batch["dram_voltage"], activity, batch["ddr5"])
+        batch["temperature"] = np.round(thermal.steady_state(power, ambient, resistance), 1)
+        stability = score_batch(batch)["stability"]
+        performance = memory_performance(*(batch[field] for field in PERFORMANCE_FIELDS))
+        if self.goal == "bandwidth":
+            metric = np.round(performance["read"]) - performance["latency"] * 1e-4
+        else:
+            metric = -np.round(performance["latency"], 2) + performance["read"] * 1e-8
+        return np.where(stability >= self.min_stability, metric, stability - 1e6), stability
+
+    def mutate(self, rng, population, rate: float):
+        hits = rng.random(population.shape) < rate
+        steps = rng.choice((-1, 1), size=population.shape) * rng.integers(1, 3, size=population.shape)
+        return population + hits * steps * self.steps
+
+    def evolve(self, island: int, epoch: int, population, generations: int):
+        # `generations` generations of one island: elites carry over, the rest are
+        # children of tournament winners by uniform crossover and mutation
+        rng = self.streams.stream("island", island, epoch)
+        fitness, stability = self.fitness(population)
+        size, elites = len(population), self.migrants
+        for _ in range(generations):
+            order = np.argsort(-fitness, kind="stable")
+            contenders = rng.integers(size, size=(2, size - elites, 3))
+            parents = np.take_along_axis(contenders, np.argmax(fitness[contenders], axis=-1)[..., None], -1)[..., 0]
+            mask = rng.random((size - elites, population.shape[1])) < 0.5
+            children = np.where(mask, population[parents[0]], population[parents[1]])
+            children = self.normalize(self.mutate(rng, children, self.mutation_rate))
+            population = np.concatenate([population[order[:elites]], children])
+            fitness, stability = self.fitness(population)
+        return population, fitness, stability
+
+    def run(self, workers: Optional[int] = None, progress=None) -> Tuple[Dict[str, object], float]:
+        # Returns the best inputs found and their stability. progress(self) is
+        # called after every migration.
+        started = time.perf_counter()
+        start = self.genome(self.start)
+        populations = []
+        for island in range(self.islands):
+            rng = self.streams.stream("init", island)
+            population = np.tile(start, (self.population, 1))
+            for _ in range(3):  # Spread the rest of the island around the start
+                population[1:] = self.mutate(rng, population[1:], 0.3)
+            populations.append(self.normalize(population))
+
+        workers = min(self.islands, workers or os.cpu_count() or 1)
+        pool = None
+        busy = 0.0
+        try:
+            if workers > 1:
+                from concurrent.futures import ProcessPoolExecutor
+                pool = ProcessPoolExecutor(workers)
+            for epoch in range(math.ceil(self.generations / self.migration_interval)):
+                generations = min(self.migration_interval, self.generations - self.generation)
+                tasks = [(evolve_island, (self, island, epoch, population, generations))
+                         for island, population in enumerate(populations)]
+                timed = list(pool.map(timed_job, tasks) if pool else map(timed_job, tasks))
+                busy += sum(elapsed for elapsed, _ in timed)
+                results = [result for _, result in timed]
+                self.generation += generations
+                self.evaluations += generations * self.islands * self.population
+                for population, fitness, stability in results:
+                    best = int(np.argmax(fitness))
+                    if fitness[best] > self.best_fitness:
+                        self.best_fitness, self.best_stability = float(fitness[best]), float(stability[best])
+                        self.best = self.individual(population[best])
+
+                # Ring migration: copies of each island's elites replace the next island's worst
+                populations = [population for population, _, _ in results]
+                for island, (population, fitness, _) in enumerate(results):
+                    target, (_, target_fitness, _) = populations[(island + 1) % self.islands], results[(island + 1) % self.islands]
+                    worst = np.argsort(target_fitness, kind="stable")[:self.migrants]
+                    target[worst] = population[np.argsort(-fitness, kind="stable")[:self.migrants]]
+                self.elapsed = time.perf_counter() - started
+                if progress:
+                    progress(self)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            available = (time.perf_counter() - started) * workers
+            WORKER_BUSY_SECONDS.labels("islands").inc(busy)
+            WORKER_AVAILABLE_SECONDS.labels("islands").inc(available)
+            WORKER_UTILIZATION.labels("islands").set(busy / available if available else 0.0)
+        CONFIGS_EVALUATED.labels("islands").inc(self.evaluations)
+        EVALUATION_SECONDS.labels("island_tune").observe(self.elapsed)
+        best = dict(self.best)
+        self.path = [self.start, best]  # Applied as one step, like a hill climb's path
+        ambient, resistance, activity = self.environment
+        thermal = ThermalModel()
+        best["temperature"] = round(float(thermal.steady_state(
+            thermal.power(best["speed"], best["dram_voltage"], activity, best["ddr5"]), ambient, resistance)), 1)
+        return best, self.best_stability
+
+    @property
+    def generations_per_s(self) -> float:
+        return self.generation / self.elapsed if self.elapsed else 0.0
+
+def evolve_island(job: tuple):
+    # Pool entry point: (tuner, island, epoch, population, generations)
+    tuner, island, epoch, population, generations = job
+    return tuner.evolve(island, epoch, population, generations)
+
+# Ranked kit x controller comparisons, keyed by a hash of the hardware catalog
+COMPARE_CACHE_PATH = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+                                  "ramtimings", "compare.json")
+
+def catalog_hash() -> str:
+    # Changes whenever a kit, controller or IC profile does
+    kits = [asdict(kit) for kit in kit_catalog()]
+    controllers = [(name, asdict(controller)) for name, controller in controller_catalog()]
+    return hashlib.sha1(json.dumps([kits, controllers, IC_PROFILES.rows()], default=str).encode()).hexdigest()
+
+def tune_pair(job: Tuple[int, int, str, float, float, str]) -> Dict[str, object]:
+    # Auto-tune one kit on one controller from its XMP profile, the way the
+    # assistant does under heavy load
+    kit, controller_index, goal, min_stability, ambient, cooling = job
+    module, controller_name, controller = configure({"kit": kit, "controller": controller_index,
+                                                     "ambient": ambient, "cooling": cooling})
+    thermal = ThermalModel()
+    activity = ThermalModel.STRESS_ACTIVITY["heavy"]
+    resistance = thermal.resistance(cooling)
+    ddr5 = module.memory_type == MemoryType.DDR5
+    temperature_fn = lambda speed, voltage: thermal.steady_state(
+        thermal.power(speed, voltage, activity, ddr5), ambient, resistance)
+    tuner = AutoTuner(stability_inputs(module, controller), temperature_fn, min_stability, goal=goal)
+    best, stability = tuner.run()
+    performance = performance_of(best)
+    return {
+        "entry": leaderboard_entry(module, controller_name, controller, best, stability, "compare", performance)
+                 if stability >= min_stability else None,
+        "kit": module.name,
+        "controller": controller_name,
+        "stable": stability >= min_stability,
+        "speed": best["speed"],
+        "timings": [best["cl"], best["trcd"], best["trp"], best["tras"]],
+        "voltage": best["dram_voltage"],
+        "command_rate": best["command_rate"],
+        "gear": best["gear"],
+        "vccio": round(controller.stock_vccio + best["vccio_offset"], 3),
+        "vccsa": round(controller.stock_vccsa + best["vccsa_offset"], 3),
+        "stability": round(stability, 1),
+        "performance": {name: round(value, 1) for name, value in performance.items()},
+    }
+
+def compare_hardware(goal: str = "latency", min_stability: float = 90.0, ambient: float = 25.0,
+                     cooling: str = "Stock", workers: Optional[int] = None,
+                     use_cache: bool = True, resume: bool = True) -> Tuple[List[Dict[str, object]], bool]:
+    # Every kit auto-tuned on every controller, tuned in parallel and ranked by
+    # best stable latency or read bandwidth. Returns the ranking and whether it
+    # came from the cache.
+    if goal not in AutoTuner.GOALS:
+        raise ValueError(f"Unknown tuning goal: {goal}")
+    catalog = catalog_hash()
+    key = f"{catalog}:{goal}:{min_stability:g}:{ambient:g}:{cooling}"
+    try:
+        with open(COMPARE_CACHE_PATH) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    if use_cache and key in cache:
+        CACHE_REQUESTS.labels("compare", "hit").inc()
+        return cache[key], True
+    CACHE_REQUESTS.labels("compare", "miss").inc()
+    started = time.perf_counter()
+
+    jobs = [(kit, controller, goal, min_stability, ambient, cooling)
+            for kit in range(1, len(kit_catalog()) + 1) for controller in range(1, len(controller_catalog()) + 1)]
+    # Each finished pair is checkpointed, so an interrupted run only tunes the rest
+    checkpoint = Checkpoint("compare", key, resume=resume)
+    results = run_pool("compare", tune_pair, jobs, workers, checkpoint=checkpoint)
+    update_leaderboard([entry for entry in (r.pop("entry") for r in results) if entry])
+    if goal == "bandwidth":
+        results.sort(key=lambda r: (not r["stable"], -r["performance"]["read"], r["performance"]["latency"]))
+    else:
+        results.sort(key=lambda r: (not r["stable"], r["performance"]["latency"], -r["performance"]["read"]))
+
+    EVALUATION_SECONDS.labels("compare").observe(time.perf_counter() - started)
+
+    # Entries for an older catalog can never be hit again
+    cache = {k: v for k, v in cache.items() if k.startswith(catalog)}
+    cache[key] = results
+    try:
+        os.makedirs(os.path.dirname(COMPARE_CACHE_PATH), exist_ok=True)
+        tmp_path = COMPARE_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, COMPARE_CACHE_PATH)
+    except OSError:
+        pass  # Read-only home; the ranking is still returned
+    checkpoint.complete()
+    return results, False
+
+def format_comparison(results: List[Dict[str, object]], limit: Optional[int] = None) -> List[str]:
+    # Unstable pairs (best effort below the target) are marked with "!"
+    lines = [f"{'#':>3}  {'Kit':<30} {'Controller':<20} {'Settings':<23} {'Stab':>6} {'Latency':>9} {'Read':>12}"]
+    for rank, r in enumerate(results[:limit], 1):
+        settings = f"{r['speed']} {'-'.join(map(str, r['timings']))} {r['command_rate']}T"
+        mark = "" if r["stable"] else " !"
+        lines.append(f"{rank:>3}  {r['kit'][:30]:<30} {r['controller'][:20]:<20} {settings:<23} "
+                     f"{r['stability']:>5.1f}% {r['performance']['latency']:>6.1f} ns "
+                     f"{r['performance']['read']:>7,.0f} MB/s{mark}")
+    return lines
+
+# Best stable results across sessions, searches and fleet runs
+LEADERBOARD_FILE = os.path.join(os.environ.get("XDG_DATA_HOME", os.path.join(os.path.expanduser("~"), ".local", "share")),
+                                "ramtimings", "leaderboard.json")
+LEADERBOARD_SIZE = 25
+LEADERBOARD_MIN_STABILITY = 90.0  # Sweep results below this are not "stable"
+LEADERBOARD_METRICS = {"latency": -1, "frequency": 1, "bandwidth": 1}  # Sign that makes larger better
+LEADERBOARD_SCOPES = [(kit, ic, controller) for kit in (True, False) for ic in (True, False)
+                      for controller in (True, False)]
+
+def leaderboard_entry(module: MemoryModule, controller_name: str, controller: MemoryController,
+                      inputs: Dict[str, object], stability: float, source: str,
+                      performance: Optional[Dict[str, float]] = None) -> Dict[str, object]:
+    performance = performance or performance_of(inputs)
+    return {
+        "kit": module.name,
+        "ic": module.ic_type.value,
+        "memory_type": module.memory_type.value,
+        "controller": controller_name,
+        "speed": int(inputs["speed"]),
+        "timings": [int(inputs[field]) for field in AutoTuner.TIMING_FIELDS],
+        "voltage": round(float(inputs["dram_voltage"]), 3),
+        "command_rate": int(inputs["command_rate"]),
+        "gear": int(inputs["gear"]),
+        "vccio": round(controller.stock_vccio + float(inputs["vccio_offset"]), 3),
+        "vccsa": round(controller.stock_vccsa + float(inputs["vccsa_offset"]), 3),
+        "secondaries": [int(value) for value in inputs["secondaries"]],
+        "stability": round(float(stability), 1),
+        "latency": round(float(performance["latency"]), 2),
+        "bandwidth": round(float(performance["read"])),
+        "source": source,
+    }
+
+class Leaderboard:
+    # Bounded min-heaps of the best entries per metric and scope, where a scope
+    # is a (kit, IC, controller) filter with "*" for any. An insert offers the
+    # entry to its eight scopes per metric: a full heap whose worst entry beats
+    # it rejects it in O(1), otherwise it is swapped in with heappushpop in
+    # O(log K). A query reads one heap of at most K entries.
+    def __init__(self, size: int = LEADERBOARD_SIZE):
+        self.size = size
+        self.heaps: Dict[tuple, List[tuple]] = {}
+        self.members: Dict[tuple, set] = {}
+        self.entries: Dict[str, Dict[str, object]] = {}
+
+    @staticmethod
+    def entry_key(entry: Dict[str, object]) -> str:
+        return json.dumps([entry[field] for field in ("kit", "controller", "speed", "timings", "voltage",
+                                                      "command_rate", "gear", "vccio", "vccsa", "secondaries")])
+
+    def insert(self, entry: Dict[str, object]) -> bool:
+        # Returns whether the entry made any board
+        fields = (entry["kit"], entry["ic"], entry["controller"])
+        values = {"latency": entry["latency"], "frequency": entry["speed"], "bandwidth": entry["bandwidth"]}
+        key = None
+        for metric, sign in LEADERBOARD_METRICS.items():
+            score = sign * values[metric]
+            for scope in LEADERBOARD_SCOPES:
+                board = (metric,) + tuple(field if used else "*" for field, used in zip(fields, scope))
+                heap = self.heaps.get(board)
+                if heap is None:
+                    heap = self.heaps[board] = []
+                    self.members[board] = set()
+                elif len(heap) >= self.size and score <= heap[0][0]:
+                    continue
+                if key is None:
+                    key = self.entry_key(entry)
+                members = self.members[board]
+                if key in members:
+                    continue
+                members.add(key)
+                if len(heap) < self.size:
+                    heapq.heappush(heap, (score, key))
+                else:
+                    members.discard(heapq.heappushpop(heap, (score, key))[1])
+                self.entries[key] = entry
+        return key is not None and key in self.entries
+
+    def top(self, metric: str = "latency", kit: str = "*", ic: str = "*", controller: str = "*",
+            limit: Optional[int] = None) -> List[Dict[str, object]]:
+        heap = self.heaps.get((metric, kit, ic, controller), [])
+        return [self.entries[key] for _, key in sorted(heap, reverse=True)[:limit]]
+
+    def live_entries(self) -> List[Dict[str, object]]:
+        # Entries still on some board; ones pushed off every board are dropped
+        keys = set().union(*self.members.values()) if self.members else set()
+        return [entry for key, entry in self.entries.items() if key in keys]
+
+def read_leaderboard(path: str = LEADERBOARD_FILE) -> Leaderboard:
+    leaderboard = Leaderboard()
+    try:
+        with open(path) as f:
+            entries = json.load(f)["entries"]
+    except (OSError, ValueError, KeyError):
+        entries = []
+    for entry in entries:
+        leaderboard.insert(entry)
+    return leaderboard
+
+def update_leaderboard(entries, path: str = LEADERBOARD_FILE) -> Leaderboard:
+    # Merge new entries into the saved leaderboard. The file is re-read first so
+    # results recorded by another session in the meantime are kept.
+    leaderboard = read_leaderboard(path)
+    for entry in entries:
+        leaderboard.insert(entry)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"format": 1, "entries": leaderboard.live_entries()}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Read-only home; the results are still returned
+    return leaderboard
+
+def format_leaderboard(entries: List[Dict[str, object]]) -> List[str]:
+    lines = [f"{'#':>3}  {'Kit':<30} {'Controller':<20} {'Settings':<23} {'Stab':>6} {'Latency':>9} {'Read':>12}  Source"]
+    for rank, entry in enumerate(entries, 1):
+        settings = f"{entry['speed']} {'-'.join(map(str, entry['timings']))} {entry['command_rate']}T"
+        lines.append(f"{rank:>3}  {entry['kit'][:30]:<30} {entry['controller'][:20]:<20} {settings:<23} "
+                     f"{entry['stability']:>5.1f}% {entry['latency']:>6.1f} ns {entry['bandwidth']:>7,.0f} MB/s  "
+                     f"{entry['source']}")
+    return lines
+
+def sparkline(values) -> str:
+    blocks = " ▁▂▃▄▅▆▇█"
+    values = np.asarray(values, dtype=float)
+    if not len(values):
+        return ""
+    low = values.min()
+    span = max(1.0, values.max() - low)
+    return "".join(blocks[int((v - low) / span * (len(blocks) - 1))] for v in values)
+
+class TelemetryBuffer:
+    # Fixed-size telemetry rings at 1s / 10s / 1min resolution. Raw samples fold
+    # into the current 1s bucket; each completed bucket is pushed into its ring and
+    # rolled up into the next resolution, so memory stays constant however long
+    # the simulation runs. Every bucket keeps min/max/mean per DIMM and channel.
+    CHANNELS = ("temperature", "voltage", "errors")
+    RESOLUTIONS = (1, 10, 60)  # seconds per bucket
+    CAPACITIES = (3600, 2160, 1440)  # 1 hour, 6 hours and 24 hours of history
+
+    def __init__(self, n_dimms: int):
+        self.n_dimms = n_dimms
+        shape = (n_dimms, len(self.CHANNELS))
+        self.times = [np.zeros(cap) for cap in self.CAPACITIES]
+        self.counts = [np.zeros(cap, dtype=np.int64) for cap in self.CAPACITIES]
+        self.mins = [np.zeros((cap,) + shape) for cap in self.CAPACITIES]
+        self.maxs = [np.zeros((cap,) + shape) for cap in self.CAPACITIES]
+        self.means = [np.zeros((cap,) + shape) for cap in self.CAPACITIES]
+        self.heads = [0] * len(self.CAPACITIES)
+        self.sizes = [0] * len(self.CAPACITIES)
+
+        # Bucket currently being filled at each resolution
+        self.pending_bucket = [None] * len(self.RESOLUTIONS)
+        self.pending_count = [0] * len(self.RESOLUTIONS)
+        self.pending_min = [np.full(shape, np.inf) for _ in self.RESOLUTIONS]
+        self.pending_max = [np.full(shape, -np.inf) for _ in self.RESOLUTIONS]
+        self.pending_sum = [np.zeros(shape) for _ in self.RESOLUTIONS]
+
+    def record(self, t: float, temperatures, voltages, errors):
+        sample = np.stack([np.asarray(temperatures, dtype=float), np.asarray(voltages, dtype=float),
+                           np.asarray(errors, dtype=float)], axis=-1)
+        self._accumulate(0, t, sample, sample, sample, 1)
+
+    def _accumulate(self, tier: int, t: float, mn, mx, total, count: int):
+        bucket = int(t // self.RESOLUTIONS[tier])
+        if self.pending_count[tier] and bucket != self.pending_bucket[tier]:
+            self._flush(tier)
+        self.pending_bucket[tier] = bucket
+        self.pending_count[tier] += count
+        np.minimum(self.pending_min[tier], mn, out=self.pending_min[tier])
+        np.maximum(self.pending_max[tier], mx, out=self.pending_max[tier])
+        self.pending_sum[tier] += total
+
+    def _flush(self, tier: int):
+        start = self.pending_bucket[tier] * self.RESOLUTIONS[tier]
+        count = self.pending_count[tier]
+        mn, mx, total = self.pending_min[tier], self.pending_max[tier], self.pending_sum[tier]
+
+        head = self.heads[tier]
+        self.times[tier][head] = start
+        self.counts[tier][head] = count
+        self.mins[tier][head] = mn
+        self.maxs[tier][head] = mx
+        self.means[tier][head] = total / count
+        self.heads[tier] = (head + 1) % self.CAPACITIES[tier]
+        self.sizes[tier] = min(self.sizes[tier] + 1, self.CAPACITIES[tier])
+
+        if tier + 1 < len(self.RESOLUTIONS):
+            self._accumulate(tier + 1, start, mn, mx, total, count)
+
+        self.pending_count[tier] = 0
+        self.pending_min[tier] = np.full_like(mn, np.inf)
+        self.pending_max[tier] = np.full_like(mx, -np.inf)
+        self.pending_sum[tier] = np.zeros_like(total)
+
+    def history(self, resolution: int = 1, last: Optional[int] = None, include_pending: bool = True):
+        # Buckets in chronological order as (times, counts, mins, maxs, means); the
+        # value arrays are shaped (buckets, dimms, channels)
+        tier = self.RESOLUTIONS.index(resolution)
+        size = self.sizes[tier]
+        order = (self.heads[tier] - size + np.arange(size)) % self.CAPACITIES[tier]
+        times, counts = self.times[tier][order], self.counts[tier][order]
+        mins, maxs, means = self.mins[tier][order], self.maxs[tier][order], self.means[tier][order]
+        if include_pending and self.pending_count[tier]:
+            count = self.pending_count[tier]
+            times = np.append(times, self.pending_bucket[tier] * resolution)
+            counts = np.append(counts, count)
+            mins = np.concatenate([mins, self.pending_min[tier][None]])
+            maxs = np.concatenate([maxs, self.pending_max[tier][None]])
+            means = np.concatenate([means, (self.pending_sum[tier] / count)[None]])
+        if last is not None:
+            times, counts, mins, maxs, means = times[-last:], counts[-last:], mins[-last:], maxs[-last:], means[-last:]
+        return times, counts, mins, maxs, means
+
+    def window(self, start: float, end: float, channel: str = "temperature"):
+        # Min/max/mean of one channel per DIMM over [start, end] at 1s resolution
+        times, counts, mins, maxs, means = self.history(1)
+        selected = (times >= math.floor(start)) & (times <= end)
+        if not selected.any():
+            return None
+        c = self.CHANNELS.index(channel)
+        weights = counts[selected][:, None]
+        return (mins[selected, :, c].min(axis=0), maxs[selected, :, c].max(axis=0),
+                (means[selected, :, c] * weights).sum(axis=0) / weights.sum())
+
+    def export_csv(self, path: str, resolution: int = 1):
+        times, counts, mins, maxs, means = self.history(resolution)
+        with open(path, "w") as f:
+            header = ["time_s", "samples"]
+            for dimm in range(self.n_dimms):
+                for channel in self.CHANNELS:
+                    header += [f"dimm{dimm + 1}_{channel}_{stat}" for stat in ("min", "max", "mean")]
+            f.write(",".join(header) + "\n")
+            for i in range(len(times)):
+                row = [f"{times[i]:.0f}", str(counts[i])]
+                for dimm in range(self.n_dimms):
+                    for c in range(len(self.CHANNELS)):
+                        row += [f"{mins[i, dimm, c]:.3f}", f"{maxs[i, dimm, c]:.3f}", f"{means[i, dimm, c]:.3f}"]
+                f.write(",".join(row) + "\n")
+        return len(times)
+
+class RandomStreams:
+    # Independent random streams keyed by a name path such as ("stress", 3, "dimm", 1).
+    # Each path gets its own SeedSequence made from the root seed with the path
+    # hashed into its spawn key, so a stream's values depend only on the seed and
+    # its name, never on which other streams exist, the order they were created
+    # in or which worker process draws from them.
+    def __init__(self, seed: Optional[int] = None, path: tuple = ()):
+        self.seed = seed if seed is not None else int.from_bytes(os.urandom(4), "little")
+        if self.seed < 0:
+            raise ValueError("seed must be non-negative")
+        self.path = path
+        self.streams = {}
+
+    @staticmethod
+    def key(name) -> int:
+        return int.from_bytes(hashlib.sha256(repr(name).encode()).digest()[:4], "little")
+
+    def spawn(self, *path) -> "RandomStreams":
+        return RandomStreams(self.seed, self.path + path)
+
+    def stream(self, *path) -> "np.random.Generator":
+        path = self.path + path
+        if path not in self.streams:
+            sequence = np.random.SeedSequence(self.seed, spawn_key=tuple(self.key(name) for name in path))
+            self.streams[path] = np.random.Generator(np.random.PCG64(sequence))
+        return self.streams[path]
+
+class StressTestRun:
+    # One stress test advanced a tick at a time, so the blocking test screen and
+    # the live dashboard can drive the same simulation. Every DIMM slot draws its
+    # errors from its own stream.
+    INTENSITY_MULTIPLIERS = {"light": 0.5, "medium": 1.0, "heavy": 1.5, "extreme": 2.0}
+
+    def __init__(self, game: "RAMOverclockGame", test_name: str, duration: int, intensity: str):
+        self.game = game
+        self.module = module = game.current_modules[0]
+        streams = game.event_streams("stress")
+        self.dimm_rngs = [streams.stream("dimm", slot) for slot in range(len(game.current_modules))]
+        self.test_name = test_name
+        self.duration = duration
+        self.intensity = intensity
+        self.elapsed = 0
+        self.errors_found = 0
+        self.errors_per_dimm = [0] * len(game.current_modules)
+        self.result = None
+
+        # Calculate failure probability based on stability score and intensity
+        self.failure_chance = (100 - module.stability_score) * self.INTENSITY_MULTIPLIERS[intensity] / 100
+
+        # Bring temperatures up to date before the load starts
+        game.update_thermals()
+        self.start_time = game.sim_time
+
+    @property
+    def progress(self) -> float:
+        return self.elapsed / self.duration * 100
+
+    @property
+    def done(self) -> bool:
+        return self.result is not None or self.elapsed >= self.duration
+
+    def step(self):
+        if self.done:
+            return
+        self.elapsed += 1
+
+        # The failure chance is shared between the slots, each checking its own DIMM
+        modules = self.game.current_modules
+        share = len(modules)
+        critical = IC_PROFILES.thermal[IC_PROFILES.row(self.module.memory_type, self.module.ic_type), 1]
+        per_dimm = [0] * share
+        for slot, (module, rng) in enumerate(zip(modules, self.dimm_rngs)):
+            if rng.random() < self.failure_chance / self.duration / share:
+                per_dimm[slot] += 1
+            # Temperature can cause additional instability
+            if module.temperature > critical and rng.random() < 0.1 / share:  # High temp error chance
+                per_dimm[slot] += 1
+        self.errors_found += sum(per_dimm)
+        self.errors_per_dimm = [total + n for total, n in zip(self.errors_per_dimm, per_dimm)]
+
+        # Each tick is one second of test time at this intensity's load; errors are
+        # logged against the DIMM slot that reported them
+        self.game.update_thermals(dt=1.0, activity=ThermalModel.STRESS_ACTIVITY[self.intensity], errors=per_dimm)
+
+    def finish(self) -> str:
+        module = self.module
+        if self.errors_found == 0:
+            self.result = "passed"
+        elif self.errors_found < 5:
+            self.result = "unstable"
+            module.errors += self.errors_found
+        else:
+            self.result = "failed"
+            module.errors += self.errors_found
+        if self.result == "passed":
+            self.game.stress_test_passed(self)
+        STRESS_TESTS.labels(self.intensity, self.result).inc()
+        return self.result
+
+    def abort(self) -> str:
+        self.result = "aborted"
+        STRESS_TESTS.labels(self.intensity, self.result).inc()
+        return self.result
+
+class LiveDashboard:
+    # Curses dashboard running the stress test, thermal simulation and graphs as
+    # concurrent asyncio tasks. Simulation ticks at SIM_HZ, the screen redraws at
+    # FRAME_RATE and keys are polled independently, so a long test never blocks input.
+    SIM_HZ = 10
+    FRAME_RATE = 20
+    INPUT_POLL = 1 / 60
+    TESTS = {
+        "1": ("MemTest86", 10, "light"),
+        "2": ("Prime95 Blend", 20, "medium"),
+        "3": ("AIDA64 Memory", 30, "heavy"),
+        "4": ("Y-Cruncher", 60, "extreme"),
+    }
+
+    def __init__(self, game: "RAMOverclockGame"):
+        self.game = game
+        self.running = False
+        self.stress_run: Optional[StressTestRun] = None
+        self.last_result = ""
+        self.display_temp = game.current_modules[0].temperature
+        self.sim_ticks = 0
+        self.frames = 0
+
+    def run(self):
+        import curses
+        curses.wrapper(self._curses_main)
+
+    def _curses_main(self, stdscr):
+        import curses
+        curses.curs_set(0)
+        stdscr.nodelay(True)
+        stdscr.keypad(True)
+        asyncio.run(self._main(stdscr))
+
+    async def _main(self, stdscr):
+        self.running = True
+        tasks = [
+            asyncio.create_task(self._simulate()),
+            asyncio.create_task(self._render(stdscr)),
+            asyncio.create_task(self._read_keys(stdscr)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if self.stress_run and not self.stress_run.done:
+                self.stress_run.abort()
+
+    async def _tick_at(self, hz: float, callback):
+        # Fixed-rate loop scheduled against absolute deadlines so slow frames
+        # don't accumulate drift.
+        loop = asyncio.get_running_loop()
+        interval = 1 / hz
+        deadline = loop.time()
+        while self.running:
+            callback()
+            deadline += interval
+            delay = deadline - loop.time()
+            if delay < 0:
+                deadline = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+
+    async def _simulate(self):
+        await self._tick_at(self.SIM_HZ, self._sim_tick)
+
+    def _sim_tick(self):
+        self.sim_ticks += 1
+        module = self.game.current_modules[0]
+
+        # The stress test advances one test-second per sim tick, like run_stress_test;
+        # otherwise the modules idle in real time
+        if self.stress_run and self.stress_run.result is None:
+            self.stress_run.step()
+            if self.stress_run.done:
+                self.last_result = f"{self.stress_run.test_name}: {self.stress_run.finish().upper()} ({self.stress_run.errors_found} errors)"
+        else:
+            self.game.update_thermals()
+
+        # Simulate small temperature fluctuations
+        self.display_temp = module.temperature + self.game.rng.stream("sensor").uniform(-1, 1)
+
+    async def _render(self, stdscr):
+        await self._tick_at(self.FRAME_RATE, lambda: self._draw(stdscr))
+
+    async def _read_keys(self, stdscr):
+        while self.running:
+            key = stdscr.getch()
+            while key != -1:
+                self._handle_key(key)
+                key = stdscr.getch()
+            await asyncio.sleep(self.INPUT_POLL)
+
+    def _handle_key(self, key: int):
+        char = chr(key) if 0 <= key < 256 else ""
+        if char in ("q", "Q"):
+            self.running = False
+        elif char in self.TESTS and (self.stress_run is None or self.stress_run.done):
+            test_name, duration, intensity = self.TESTS[char]
+            self.stress_run = StressTestRun(self.game, test_name, duration, intensity)
+            self.last_result = ""
+        elif char in ("a", "A") and self.stress_run and not self.stress_run.done:
+            self.stress_run.abort()
+            self.last_result = f"{self.stress_run.test_name}: ABORTED"
+
+    def _draw(self, stdscr):
+        import curses
+        self.frames += 1
+        module = self.game.current_modules[0]
+        height, width = stdscr.getmaxyx()
+        stdscr.erase()
+
+        lines = [
+            "═══ LIVE DASHBOARD ═══",
+            f"{module.name}",
+            f"{module.current_speed} MHz @ {'-'.join(map(str, module.current_timings[:4]))} | {module.current_voltage:.3f}V",
+            f"Stability: {module.stability_score:.1f}% | Errors: {module.errors}",
+            f"Ambient: {self.game.ambient_temperature:.1f}°C | Cooling: {self.game.cooling_solution}",
+            "",
+            f"Temp: {self.display_temp:5.1f}°C [{'█' * int(self.display_temp / 2):<40}]",
+        ]
+
+        # Temperature history from the telemetry buffer, newest bucket on the right
+        telemetry = self.game.telemetry
+        if telemetry is not None:
+            times, _, mins, maxs, means = telemetry.history(1, last=max(1, width - 2))
+            if len(times):
+                lines.append(sparkline(means[:, 0, 0]))
+                lines.append(f"History: {mins[:, 0, 0].min():.1f}°C - {maxs[:, 0, 0].max():.1f}°C over {times[-1] - times[0] + 1:.0f}s")
+        lines.append("")
+
+        run = self.stress_run
+        if run and run.result is None:
+            lines.append(f"{run.test_name} ({run.intensity.upper()}): [{('#' * int(run.progress / 5)).ljust(20)}] {run.progress:.1f}% | Errors: {run.errors_found}")
+        else:
+            lines.append("No stress test running")
+        if self.last_result:
+            lines.append(f"Last result: {self.last_result}")
+        lines.append("")
+        lines.append("1-4: Start MemTest86/Prime95/AIDA64/Y-Cruncher | A: Abort test | Q: Quit")
+
+        for row, text in enumerate(lines[:height]):
+            try:
+                stdscr.addstr(row, 0, text[:width - 1])
+            except curses.error:
+                pass
+        stdscr.refresh()
+
+# Knowledge base corpus, read on first use: (key, title, ((section heading, (lines...)), ...))
+KNOWLEDGE_BASE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "knowledge_base.json")
+_knowledge_base: Optional[tuple] = None
+
+def knowledge_base() -> tuple:
+    global _knowledge_base
+    if _knowledge_base is None:
+        with open(KNOWLEDGE_BASE_FILE, encoding="utf-8") as f:
+            topics = json.load(f)
+        _knowledge_base = tuple(
+            (topic["key"], topic["title"],
+             tuple((section["heading"], tuple(section["lines"])) for section in topic["sections"]))
+            for topic in topics)
+    return _knowledge_base
+
+class KnowledgeIndex:
+    # Inverted index over knowledge-base sections. Each section is a document;
+    # postings map a token to (document, weight) pairs, with heading tokens
+    # counted double and topic-title tokens at half weight. Ranking is BM25; a sorted vocabulary gives prefix search
+    # by bisection. Built once per corpus version and cached to disk.
+    VERSION = 1
+    HEADING_WEIGHT = 2.0
+    TITLE_WEIGHT = 0.5
+    K1 = 1.2
+    B = 0.75
+    TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+
+    def __init__(self, documents: List[Tuple[int, int]], postings: Dict[str, List[Tuple[int, float]]],
+                 lengths: List[float]):
+        self.documents = documents  # (topic index, section index)
+        self.postings = postings
+        self.lengths = lengths
+        self.average_length = sum(lengths) / len(lengths) if lengths else 1.0
+        self.vocabulary = sorted(postings)
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        tokens = []
+        for token in cls.TOKEN_PATTERN.findall(text.lower()):
+            tokens.append(token)
+            if "_" in token:
+                # tRRD_S is also found by "trrd"
+                tokens.extend(part for part in token.split("_") if part)
+        return tokens
+
+    @classmethod
+    def build(cls, corpus=None) -> "KnowledgeIndex":
+        corpus = knowledge_base() if corpus is None else corpus
+        documents, lengths = [], []
+        postings: Dict[str, List[Tuple[int, float]]] = {}
+        for topic_index, (_, title, sections) in enumerate(corpus):
+            for section_index, (heading, lines) in enumerate(sections):
+                weights: Dict[str, float] = {}
+                for token in cls.tokenize(title):
+                    weights[token] = weights.get(token, 0.0) + cls.TITLE_WEIGHT
+                for token in cls.tokenize(heading):
+                    weights[token] = weights.get(token, 0.0) + cls.HEADING_WEIGHT
+                for line in lines:
+                    for token in cls.tokenize(line):
+                        weights[token] = weights.get(token, 0.0) + 1.0
+                doc_id = len(documents)
+                documents.append((topic_index, section_index))
+                lengths.append(sum(weights.values()))
+                for token, weight in weights.items():
+                    postings.setdefault(token, []).append((doc_id, weight))
+        return cls(documents, postings, lengths)
+
+    @staticmethod
+    def corpus_hash(corpus=None) -> str:
+        corpus = knowledge_base() if corpus is None else corpus
+        settings = [KnowledgeIndex.VERSION, KnowledgeIndex.HEADING_WEIGHT, KnowledgeIndex.TITLE_WEIGHT]
+        payload = json.dumps([settings, corpus], ensure_ascii=False).encode()
+        return hashlib.sha256(payload).hexdigest()
+
+    def save(self, path: str, corpus_hash: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = {"hash": corpus_hash, "documents": self.documents, "postings": self.postings, "lengths": self.lengths}
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, corpus_hash: str) -> Optional["KnowledgeIndex"]:
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("hash") != corpus_hash:
+            return None
+        postings = {token: [tuple(p) for p in plist] for token, plist in data["postings"].items()}
+        return cls([tuple(d) for d in data["documents"]], postings, data["lengths"])
+
+    def expand(self, term: str) -> List[str]:
+        # Exact match, or every vocabulary entry with the prefix when the term ends
+        # in "*" or has no exact match
+        prefix = term.endswith("*")
+        term = term.rstrip("*")
+        if not prefix and term in self.postings:
+            return [term]
+        start = bisect.bisect_left(self.vocabulary, term)
+        matches = []
+        for token in self.vocabulary[start:]:
+            if not token.startswith(term):
+                break
+            matches.append(token)
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[float, int, int]]:
+        # Ranked (score, topic index, section index) results
+        scores: Dict[int, float] = {}
+        n_docs = len(self.documents)
+        for raw in query.lower().split():
+            for term in self.tokenize(raw.rstrip("*")):
+                if raw.endswith("*"):
+                    term += "*"
+                for token in self.expand(term):
+                    plist = self.postings[token]
+                    idf = math.log(1 + (n_docs - len(plist) + 0.5) / (len(plist) + 0.5))
+                    for doc_id, tf in plist:
+                        norm = tf + self.K1 * (1 - self.B + self.B * self.lengths[doc_id] / self.average_length)
+                        scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.K1 + 1) / norm
+        ranked = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(score, *self.documents[doc_id]) for doc_id, score in ranked]
+
+KB_INDEX_PATH = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+                             "ramtimings", "kb_index.json")
+_kb_index: Optional[KnowledgeIndex] = None
+
+def knowledge_index() -> KnowledgeIndex:
+    # Load the cached index, rebuilding it when the corpus has changed
+    global _kb_index
+    if _kb_index is None:
+        corpus_hash = KnowledgeIndex.corpus_hash()
+        _kb_index = KnowledgeIndex.load(KB_INDEX_PATH, corpus_hash)
+        CACHE_REQUESTS.labels("kb_index", "miss" if _kb_index is None else "hit").inc()
+        if _kb_index is None:
+            _kb_index = KnowledgeIndex.build()
+            try:
+                _kb_index.save(KB_INDEX_PATH, corpus_hash)
+            except OSError:
+                pass  # Read-only home; the in-memory index still works
+    return _kb_index
+
+def format_kb_results(query: str, results: List[Tuple[float, int, int]]) -> List[str]:
+    terms = [t.rstrip("*") for t in KnowledgeIndex.tokenize(query.replace("*", ""))]
+    lines = []
+    for score, topic_index, section_index in results:
+        _, title, sections = knowledge_base()[topic_index]
+        heading, section_lines = sections[section_index]
+        lines.append(f"[{title}] {heading}  (score {score:.2f})")
+        matching = [line for line in section_lines
+                    if any(token.startswith(term) for term in terms for token in KnowledgeIndex.tokenize(line))]
+        for line in (matching or list(section_lines))[:3]:
+            lines.append(f"    {line}")
+    return lines
+
+def share_structure(new, old):
+    # `new` with every subtree equal to one in `old` replaced by the old object,
+    # so consecutive snapshots only own the parts that changed
+    if new == old:
+        return old
+    if isinstance(new, tuple) and isinstance(old, tuple) and len(new) == len(old):
+        return tuple(share_structure(n, o) for n, o in zip(new, old))
+    return new
+
+def frozen(value):
+    # JSON lists back into the tuples snapshots are made of
+    return tuple(frozen(v) for v in value) if isinstance(value, list) else value
+
+class SettingsHistory:
+    # Unlimited undo/redo and named checkpoints over immutable snapshots of the
+    # tunable state: ((module state per slot), controller state), all tuples.
+    # Each snapshot shares every unchanged subtree with the one before it, so a
+    # step that changes one timing costs a new timings tuple and the spine above
+    # it, no matter how long the session or how many steps a search replays.
+    def __init__(self):
+        self.current: Optional[tuple] = None
+        self.undo_stack: List[tuple] = []
+        self.redo_stack: List[tuple] = []
+        self.checkpoints: Dict[str, tuple] = {}
+
+    def record(self, snapshot: tuple) -> bool:
+        if snapshot == self.current:
+            return False
+        if self.current is not None:
+            self.undo_stack.append(self.current)
+            snapshot = share_structure(snapshot, self.current)
+        self.current = snapshot
+        self.redo_stack.clear()
+        return True
+
+    def undo(self) -> Optional[tuple]:
+        if not self.undo_stack:
+            return None
+        self.redo_stack.append(self.current)
+        self.current = self.undo_stack.pop()
+        return self.current
+
+    def redo(self) -> Optional[tuple]:
+        if not self.redo_stack:
+            return None
+        self.undo_stack.append(self.current)
+        self.current = self.redo_stack.pop()
+        return self.current
+
+    def checkpoint(self, name: str):
+        self.checkpoints[name] = self.current
+
+# Tuned profiles in a compact binary library: a header followed by fixed-size
+# records, so large libraries are read through a memory map without parsing.
+# Secondary timings left on Auto are stored as 0, voltages in millivolts.
+PROFILE_FILE = os.path.join(os.environ.get("XDG_DATA_HOME", os.path.join(os.path.expanduser("~"), ".local", "share")),
+                            "ramtimings", "profiles.rtp")
+PROFILE_MAGIC = b"RTPF"
+PROFILE_VERSION = 1
+PROFILE_HEADER = struct.Struct("<4sHHI")  # Magic, version, record size, record count
+
+PROFILE_TIMING_MAX = 0xFFFF  # Timings are stored as unsigned 16-bit values
+
+def profile_dtype() -> "np.dtype":
+    return np.dtype([
+        ("kit", "S64"), ("label", "S32"), ("memory_type", "u1"), ("speed", "<u2"),
+        ("timings", "<u2", (len(PRIMARY_TIMING_NAMES),)), ("secondaries", "<u2", (len(SECONDARY_TIMING_NAMES),)),
+        ("voltage_mv", "<u2"), ("command_rate", "u1"), ("gear", "u1"),
+        ("vccio_offset_mv", "<i2"), ("vccsa_offset_mv", "<i2"), ("stability", "<u2"),  # Tenths of a percent
+    ])
+
+_profile_limits = None
+
+def profile_limits() -> Dict[str, Tuple[int, int]]:
+    # Range of each numeric record field, worked out once from the dtype
+    global _profile_limits
+    if _profile_limits is None:
+        dtype = profile_dtype()
+        _profile_limits = {name: (int(np.iinfo(dtype[name].base).min), int(np.iinfo(dtype[name].base).max))
+                           for name in dtype.names if dtype[name].base.kind in "iu"}
+    return _profile_limits
+
+def profile_record(module: MemoryModule, controller: MemoryController, label: str,
+                   stability: float) -> "np.ndarray":
+    # Raises ValueError for settings the fixed-size fields can't hold
+    dtype = profile_dtype()
+    values = {
+        "memory_type": 5 if module.memory_type == MemoryType.DDR5 else 4,
+        "speed": module.current_speed,
+        "timings": module.current_timings[:4],
+        "secondaries": [module.secondary_timings.get(name, 0) for name in SECONDARY_TIMING_NAMES],
+        "voltage_mv": round(module.current_voltage * 1000),
+        "command_rate": controller.current_command_rate,
+        "gear": controller.current_gear_mode,
+        "vccio_offset_mv": round((controller.vccio_voltage - controller.stock_vccio) * 1000),
+        "vccsa_offset_mv": round((controller.vccsa_voltage - controller.stock_vccsa) * 1000),
+        "stability": round(stability * 10),
+    }
+    for name, (low, high) in profile_limits().items():
+        value = values[name]
+        if not (low <= min(value) and max(value) <= high if isinstance(value, list) else low <= value <= high):
+            raise ValueError(f"{name} {value} is outside the profile range {low}-{high}")
+    record = np.zeros((), dtype=dtype)
+    record["kit"] = module.name.encode()[:64]
+    record["label"] = label.encode()[:32]
+    for name, value in values.items():
+        record[name] = value
+    return record
+
+def read_profiles(path: str) -> "np.ndarray":
+    # Read-only memory map over every record in a library
+    dtype = profile_dtype()
+    with open(path, "rb") as f:
+        header = f.read(PROFILE_HEADER.size)
+        size = os.fstat(f.fileno()).st_size
+    if len(header) < PROFILE_HEADER.size:
+        raise ValueError(f"{path} is not a profile library")
+    magic, version, record_size, count = PROFILE_HEADER.unpack(header)
+    if magic != PROFILE_MAGIC or version != PROFILE_VERSION or record_size != dtype.itemsize:
+        raise ValueError(f"{path} is not a version {PROFILE_VERSION} profile library")
+    if size < PROFILE_HEADER.size + count * record_size:
+        raise ValueError(f"{path} is truncated")
+    if not count:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=PROFILE_HEADER.size, shape=(count,))
+
+def write_profiles(path: str, records) -> int:
+    # Replace a library with `records`, streamed straight from their buffer
+    records = np.ascontiguousarray(records, dtype=profile_dtype()).reshape(-1)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(PROFILE_HEADER.pack(PROFILE_MAGIC, PROFILE_VERSION, records.dtype.itemsize, len(records)))
+        records.tofile(f)
+    os.replace(tmp_path, path)
+    return len(records)
+
+def append_profiles(path: str, records) -> int:
+    # Add records to the end of a library in place. The count in the header is
+    # only raised once the records are written, so an interrupted append leaves
+    # the library as it was. Returns the new record count.
+    records = np.ascontiguousarray(records, dtype=profile_dtype()).reshape(-1)
+    if not os.path.exists(path):
+        return write_profiles(path, records)
+    count = len(read_profiles(path))
+    with open(path, "r+b") as f:
+        f.seek(PROFILE_HEADER.size + count * records.dtype.itemsize)
+        records.tofile(f)
+        f.truncate()
+        f.flush()
+        os.fsync(f.fileno())
+        f.seek(0)
+        f.write(PROFILE_HEADER.pack(PROFILE_MAGIC, PROFILE_VERSION, records.dtype.itemsize, count + len(records)))
+    return count + len(records)
+
+def format_profile(record) -> str:
+    timings = "-".join(map(str, record["timings"].tolist()))
+    return (f"{record['label'].decode(errors='replace')}: {int(record['speed'])} MHz @ {timings} | "
+            f"{record['voltage_mv'] / 1000:.3f}V | {int(record['command_rate'])}T | "
+            f"stability {record['stability'] / 10:.1f}%")
+
+@dataclass(frozen=True)
+class Achievement:
+    key: str
+    name: str
+    description: str
+    event: str  # The engine event that can unlock it
+    condition: Callable[[Dict[str, object]], bool] = lambda event: True
+
+# Events: test_passed (test, intensity, speed, ddr5), frequency_record (speed, ddr5),
+# voltage_above_limit (voltage, limit), cl_reached (cl, ddr5) and
+# thermal_critical (temperature, critical)
+ACHIEVEMENTS = [
+    Achievement("first_pass", "Stable Ground", "Pass any stress test", "test_passed"),
+    Achievement("extreme_pass", "Torture Survivor", "Pass Y-Cruncher at extreme intensity", "test_passed",
+                lambda event: event["test"] == "Y-Cruncher" and event["intensity"] == "extreme"),
+    Achievement("new_record", "Personal Best", "Pass a stress test at your highest frequency yet",
+                "frequency_record"),
+    Achievement("ddr4_4000", "Four Thousand", "Pass a stress test with DDR4 at 4000 MHz or more",
+                "frequency_record", lambda event: not event["ddr5"] and event["speed"] >= 4000),
+    Achievement("ddr5_7200", "Seven Two", "Pass a stress test with DDR5 at 7200 MHz or more",
+                "frequency_record", lambda event: event["ddr5"] and event["speed"] >= 7200),
+    Achievement("tight_cl", "Tight Timings", "Run CL14 or lower on DDR4, CL30 or lower on DDR5", "cl_reached",
+                lambda event: event["cl"] <= (30 if event["ddr5"] else 14)),
+    Achievement("extreme_cl", "Razor's Edge", "Run CL12 or lower on DDR4, CL26 or lower on DDR5", "cl_reached",
+                lambda event: event["cl"] <= (26 if event["ddr5"] else 12)),
+    Achievement("over_limit", "Living Dangerously", "Set DRAM voltage above the daily limit",
+                "voltage_above_limit"),
+    Achievement("way_over_limit", "Magic Smoke", "Set DRAM voltage 0.1V or more above the daily limit",
+                "voltage_above_limit", lambda event: event["voltage"] >= event["limit"] + 0.1),
+    Achievement("thermal_critical", "Too Hot to Handle", "Push a module past its critical temperature",
+                "thermal_critical"),
+]
+
+class AchievementEngine:
+    # Rules are indexed by the event they listen for, so an event only checks
+    # the locked rules waiting on it. Unlocked rules leave the index, and an
+    # event nothing waits on any more costs one dict lookup, however often the
+    # engine emits it.
+    def __init__(self, unlocked: List[str] = (), rules: List[Achievement] = ACHIEVEMENTS):
+        self.rules = {rule.key: rule for rule in rules}
+        self.unlocked = [key for key in unlocked if key in self.rules]
+        self.pending: Dict[str, List[Achievement]] = {}
+        for rule in rules:
+            if rule.key not in self.unlocked:
+                self.pending.setdefault(rule.event, []).append(rule)
+
+    def emit(self, event: str, **payload) -> List[Achievement]:
+        rules = self.pending.get(event)
+        if not rules:
+            return []
+        unlocked = [rule for rule in rules if rule.condition(payload)]
+        if unlocked:
+            remaining = [rule for rule in rules if rule not in unlocked]
+            if remaining:
+                self.pending[event] = remaining
+            else:
+                del self.pending[event]
+            self.unlocked.extend(rule.key for rule in unlocked)
+        return unlocked
+
+# Save games live in the user's data directory
+SAVE_FILE = os.path.join(os.environ.get("XDG_DATA_HOME", os.path.join(os.path.expanduser("~"), ".local", "share")),
+                         "ramtimings", "savegame.json")
+
+class RAMOverclockGame:
+    def __init__(self, rng: Optional[RandomStreams] = None, headless: bool = False):
+        # Headless games (fleet runs) neither read the savegame nor record to the leaderboard
+        self.player_name = ""
+        self.experience_level = 0
+        self.achievements = AchievementEngine()
+        self.records: Dict[str, int] = {}  # Highest stable speed per memory type
+        self.new_achievements: List[Achievement] = []
+        self.leaderboard_file: Optional[str] = None if headless else LEADERBOARD_FILE
+        self.current_modules: List[MemoryModule] = []
+        self.memory_controller = None
+        self.ambient_temperature = 25.0
+        self.cooling_solution = "Stock"
+        self.stress_test_running = False
+        self.thermal = ThermalModel()
+        self.thermal_clock = time.monotonic()
+        self.sim_time = 0.0
+        self.telemetry: Optional[TelemetryBuffer] = None
+        self.stability = StabilityEngine()
+        self.heatmaps = StabilityHeatmap()
+        self.history = SettingsHistory()
+        self.controller_name = None
+        if rng is None:
+            self.set_seed(None)
+        else:
+            self.rng, self.event_counts = rng, {}
+        self.game_data = {} if headless else self.load_game_data()
+
+    def set_seed(self, seed: Optional[int]):
+        # Every random event in the session comes from streams of this seed
+        self.rng = RandomStreams(seed)
+        self.event_counts: Dict[str, int] = {}
+
+    def event_streams(self, kind: str) -> RandomStreams:
+        # Streams for the next event of a kind; events are numbered in order, so
+        # replaying a session with the same seed draws the same values
+        index = self.event_counts.get(kind, 0)
+        self.event_counts[kind] = index + 1
+        return self.rng.spawn(kind, index)
+
+    def emit(self, event: str, **payload):
+        # Achievements unlocked by an event are announced at the next menu
+        self.new_achievements.extend(self.achievements.emit(event, **payload))
+
+    def announce_achievements(self):
+        for achievement in self.new_achievements:
+            print(f"🏆 Achievement unlocked: {achievement.name} - {achievement.description}")
+        if self.new_achievements:
+            print()
+        self.new_achievements = []
+
+    def stress_test_passed(self, run: "StressTestRun"):
+        module = run.module
+        ddr5 = module.memory_type == MemoryType.DDR5
+        self.emit("test_passed", test=run.test_name, intensity=run.intensity, speed=module.current_speed, ddr5=ddr5)
+        if module.current_speed > self.records.get(module.memory_type.value, 0):
+            self.records[module.memory_type.value] = module.current_speed
+            self.emit("frequency_record", speed=module.current_speed, ddr5=ddr5)
+        if self.leaderboard_file:
+            inputs = stability_inputs(module, self.memory_controller)
+            update_leaderboard([leaderboard_entry(module, self.controller_name, self.memory_controller, inputs,
+                                                  module.stability_score, "stress")], self.leaderboard_file)
+        
+    def update_thermals(self, dt: Optional[float] = None, activity: float = ThermalModel.IDLE_ACTIVITY,
+                        errors: Optional[List[int]] = None):
+        # Advance module temperatures by dt seconds of simulated time, or by the
+        # wall-clock time since the last update when dt is omitted, and log a
+        # telemetry sample
+        now = time.monotonic()
+        if dt is None:
+            dt = now - self.thermal_clock
+        self.thermal_clock = now
+        if not self.current_modules:
+            return
+        temps = np.array([m.temperature for m in self.current_modules], dtype=float)
+        power = self.thermal.module_power(self.current_modules, activity)
+        temps = self.thermal.integrate(temps, power, self.ambient_temperature,
+                                       self.thermal.resistance(self.cooling_solution), dt)
+        for module, temp in zip(self.current_modules, temps):
+            module.temperature = float(temp)
+        module = self.current_modules[0]
+        critical = float(IC_PROFILES.thermal[IC_PROFILES.row(module.memory_type, module.ic_type), 1])
+        if temps.max() > critical:
+            self.emit("thermal_critical", temperature=float(temps.max()), critical=critical)
+        if math.isfinite(dt):
+            self.sim_time += dt
+        self.record_telemetry(errors)
+        self.refresh_stability()
+
+    def refresh_stability(self):
+        # Stability is derived state; only components whose inputs changed are recomputed
+        if not self.current_modules or self.memory_controller is None:
+            return
+        for module in self.current_modules:
+            module.stability_score = self.stability.evaluate(stability_inputs(module, self.memory_controller))
+
+    def capture_state(self) -> tuple:
+        # Snapshot of everything the player tunes; DIMM slots holding the same
+        # module object share one state
+        states = {}
+        for module in self.current_modules:
+            if id(module) not in states:
+                states[id(module)] = (module.current_speed, tuple(module.current_timings), module.current_voltage,
+                                      tuple(sorted(module.secondary_timings.items())))
+        controller = self.memory_controller
+        return (tuple(states[id(module)] for module in self.current_modules),
+                (controller.current_command_rate, controller.current_gear_mode,
+                 controller.vccio_voltage, controller.vccsa_voltage))
+
+    def apply_state(self, snapshot: tuple):
+        modules, controller = snapshot
+        self.update_thermals()
+        for module, (speed, timings, voltage, secondaries) in zip(self.current_modules, modules):
+            module.current_speed = speed
+            module.current_timings = list(timings)
+            module.current_voltage = voltage
+            module.secondary_timings = dict(secondaries)
+        (self.memory_controller.current_command_rate, self.memory_controller.current_gear_mode,
+         self.memory_controller.vccio_voltage, self.memory_controller.vccsa_voltage) = controller
+        self.refresh_stability()
+
+    def record_history(self):
+        # Every settings change passes through here, so it is also where the
+        # setting events are emitted
+        if self.current_modules and self.memory_controller is not None:
+            if self.history.record(self.capture_state()):
+                module = self.current_modules[0]
+                self.emit("cl_reached", cl=module.current_timings[0], ddr5=module.memory_type == MemoryType.DDR5)
+                limit = float(IC_PROFILES.voltage[IC_PROFILES.row(module.memory_type, module.ic_type), 1])
+                if module.current_voltage > limit:
+                    self.emit("voltage_above_limit", voltage=module.current_voltage, limit=limit)
+
+    def record_telemetry(self, errors: Optional[List[int]] = None):
+        modules = self.current_modules
+        if self.telemetry is None or self.telemetry.n_dimms != len(modules):
+            self.telemetry = TelemetryBuffer(len(modules))
+        self.telemetry.record(self.sim_time,
+                              [m.temperature for m in modules],
+                              [m.current_voltage for m in modules],
+                              errors if errors is not None else [0] * len(modules))
+
+    def thermal_target(self, activity: float = ThermalModel.IDLE_ACTIVITY) -> float:
+        # Temperature the first module settles at under the given load
+        power = self.thermal.module_power(self.current_modules[:1], activity)
+        return float(self.thermal.steady_state(power, self.ambient_temperature,
+                                               self.thermal.resistance(self.cooling_solution))[0])
+
+    def clear_screen(self):
+        os.system('clear' if os.name == 'posix' else 'cls')
+        
+    def print_banner(self):
+        print("╔══════════════════════════════════════════════════════════════╗")
+        print("║                   RAM OVERCLOCKING SIMULATOR                 ║")
+        print("║              Learn Real Memory Overclocking!                ║")
+        print("╚══════════════════════════════════════════════════════════════╝")
+        print()
+        
+    def main_menu(self):
+        while True:
+            self.clear_screen()
+            self.print_banner()
+            self.announce_achievements()
+            
+            if self.player_name:
+                print(f"Welcome back, {self.player_name}! (Level {self.experience_level})")
+                print()
+            
+            print("1. Start New Game")
+            print("2. Load Game")
+            print("3. Memory Overview")
+            print("4. Overclocking Lab")
+            print("5. Stress Testing")
+            print("6. Temperature Monitor")
+            print("7. Knowledge Base")
+            print("8. Achievements")
+            print("9. Settings")
+            print("C. Compare All Hardware")
+            print("L. Leaderboard")
+            print("S. Save Game")
+            print("0. Exit")
+            print()
+            
+            choice = input("Select option: ").strip()
+            
+            if choice == "1":
+                self.new_game()
+            elif choice == "2":
+                self.load_game()
+            elif choice == "3" and self.current_modules:
+                self.memory_overview()
+            elif choice == "4" and self.current_modules:
+                self.overclocking_lab()
+            elif choice == "5" and self.current_modules:
+                self.stress_testing_menu()
+            elif choice == "6" and self.current_modules:
+                self.temperature_monitor()
+            elif choice == "7":
+                self.knowledge_base()
+            elif choice == "8":
+                self.show_achievements()
+            elif choice == "9":
+                self.settings_menu()
+            elif choice.lower() == "c":
+                self.compare_all_hardware()
+            elif choice.lower() == "l":
+                self.leaderboard_view()
+            elif choice.lower() == "s" and self.current_modules:
+                self.save_game()
+                print(f"Game saved to {SAVE_FILE}")
+                input("Press Enter to continue...")
+            elif choice == "0":
+                print("Thanks for playing!")
+                sys.exit(0)
+            else:
+                print("Invalid option or no memory installed!")
+                input("Press Enter to continue...")
+                
+    def new_game(self):
+        self.clear_screen()
+        self.print_banner()
+        
+        print("Starting new game...")
+        print()
+        
+        self.player_name = input("Enter your overclocker name: ").strip()
+        if not self.player_name:
+            self.player_name = "Anonymous OC'er"
+            
+        print()
+        print("Choose your experience level:")
+        print("1. Beginner (Safe settings, guided experience)")
+        print("2. Intermediate (Some freedom, moderate risk)")
+        print("3. Expert (Full control, high risk/reward)")
+        
+        level_choice = input("Select level (1-3): ").strip()
+        self.experience_level = max(1, min(3, int(level_choice) if level_choice.isdigit() else 1))
+        
+        print()
+        print("Choose your starting memory kit:")
+        self.choose_memory_kit()
+        
+        print()
+        print("Choose your memory controller:")
+        self.choose_memory_controller()
+        self.refresh_stability()
+        self.history = SettingsHistory()
+        self.record_history()
+        
+        self.save_game()
+        print(f"\nWelcome to RAM overclocking, {self.player_name}!")
+        input("Press Enter to continue...")
+        
+    def choose_memory_kit(self):
+        kits = kit_catalog()
+        
+        print("Available memory kits:")
+        print("\nDDR4 Kits:")
+        ddr4_count = 0
+        for i, kit in enumerate(kits, 1):
+            if kit.memory_type == MemoryType.DDR4:
+                ddr4_count += 1
+                print(f"{i}. {kit.name}")
+                print(f"   Type: {kit.memory_type.value}, IC: {kit.ic_type.value}")
+                print(f"   JEDEC: {kit.jedec_speed} MHz, Rated: {kit.rated_speed} MHz")
+                print(f"   Capacity: {kit.capacity}GB x2, Quality: {kit.quality_bin}/10")
+                print()
+        
+        print("\nDDR5 Kits:")
+        for i, kit in enumerate(kits, 1):
+            if kit.memory_type == MemoryType.DDR5:
+                print(f"{i}. {kit.name}")
+                print(f"   Type: {kit.memory_type.value}, IC: {kit.ic_type.value}")
+                print(f"   JEDEC: {kit.jedec_speed} MHz, Rated: {kit.rated_speed} MHz")
+                print(f"   Capacity: {kit.capacity}GB x2, Quality: {kit.quality_bin}/10")
+                print()
+            
+        choice = input(f"Select kit (1-{len(kits)}): ").strip()
+        kit_index = max(0, min(len(kits)-1, int(choice) - 1 if choice.isdigit() else 0))
+        
+        selected_kit = kits[kit_index]
+        self.current_modules = [selected_kit, selected_kit]  # Dual channel
+        print(f"Selected: {selected_kit.name}")
+        
+    def choose_memory_controller(self):
+        controllers = controller_catalog()
+        
+        print("Available memory controllers:")
+        for i, (name, controller) in enumerate(controllers, 1):
+            print(f"{i}. {name} (Quality: {controller.imc_quality}/10)")
+            
+        choice = input("Select controller (1-4): ").strip()
+        controller_index = max(0, min(3, int(choice) - 1 if choice.isdigit() else 0))
+        
+        self.controller_name, self.memory_controller = controllers[controller_index]
+        print(f"Selected: {controllers[controller_index][0]}")
+
+    def memory_overview(self):
+        while True:
+            self.clear_screen()
+            self.print_banner()
+            print("═══ MEMORY OVERVIEW ═══")
+            print()
+            
+            for i, module in enumerate(self.current_modules, 1):
+                print(f"DIMM {i}: {module.name}")
+                print(f"  Type: {module.memory_type.value} | IC: {module.ic_type.value}")
+                print(f"  Current: {module.current_speed} MHz @ {module.current_voltage:.3f}V")
+                print(f"  Timings: {'-'.join(map(str, module.current_timings))} | Temp: {module.temperature:.1f}°C")
+                print(f"  Stability: {module.stability_score:.1f}% | Errors: {module.errors}")
+                print()
+                
+            print("Memory Controller Info:")
+            print(f"  Quality: {self.memory_controller.imc_quality}/10")
+            print(f"  Command Rate: {self.memory_controller.current_command_rate}T")
+            if self.current_modules[0].memory_type == MemoryType.DDR5:
+                print(f"  Gear Mode: {self.memory_controller.current_gear_mode}")
+            print(f"  VCCIO: {self.memory_controller.vccio_voltage:.3f}V")
+            print(f"  VCCSA: {self.memory_controller.vccsa_voltage:.3f}V")
+            print()
+            
+            print("1. Back to Main Menu")
+            choice = input("Select option: ").strip()
+            
+            if choice == "1":
+                break
+
+    def load_game_data(self, path: str = SAVE_FILE):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+    def save_game(self, path: str = SAVE_FILE):
+        if not self.current_modules or self.memory_controller is None:
+            return
+        self.record_history()
+        data = {
+            "player_name": self.player_name,
+            "experience_level": self.experience_level,
+            "achievements": self.achievements.unlocked,
+            "records": self.records,
+            "kit": self.current_modules[0].name,
+            "controller": self.controller_name,
+            "ambient_temperature": self.ambient_temperature,
+            "cooling_solution": self.cooling_solution,
+            "seed": self.rng.seed,
+            "errors": self.current_modules[0].errors,
+            "state": self.history.current,
+            "checkpoints": self.history.checkpoints,
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+        self.game_data = data
+        
+    def load_game(self):
+        self.game_data = data = self.load_game_data()
+        if not data:
+            print("No saved game found.")
+            input("Press Enter to continue...")
+            return
+        
+        kits = {kit.name: kit for kit in kit_catalog()}
+        controllers = dict(controller_catalog())
+        if data.get("kit") not in kits or data.get("controller") not in controllers:
+            print("Saved game refers to hardware that is no longer in the catalog.")
+            input("Press Enter to continue...")
+            return
+        
+        self.player_name = data.get("player_name", "")
+        self.experience_level = data.get("experience_level", 1)
+        self.achievements = AchievementEngine(data.get("achievements", []))
+        self.records = dict(data.get("records", {}))
+        self.ambient_temperature = data.get("ambient_temperature", 25.0)
+        self.cooling_solution = data.get("cooling_solution", "Stock")
+        self.set_seed(data.get("seed"))
+        kit = kits[data["kit"]]
+        kit.errors = data.get("errors", 0)
+        self.current_modules = [kit, kit]  # Dual channel
+        self.controller_name, self.memory_controller = data["controller"], controllers[data["controller"]]
+        
+        # Start from the idle equilibrium with the saved settings
+        self.history = SettingsHistory()
+        self.apply_state(frozen(data["state"]))
+        self.update_thermals(dt=float("inf"))
+        self.record_history()
+        self.history.checkpoints = {name: frozen(state) for name, state in data.get("checkpoints", {}).items()}
+        
+        module = self.current_modules[0]
+        print(f"Welcome back, {self.player_name}!")
+        print(f"Loaded: {module.name} on {self.controller_name} | {module.current_speed} MHz @ "
+              f"{'-'.join(map(str, module.current_timings[:4]))}")
+        input("Press Enter to continue...")
+        
+    def overclocking_lab(self):
+        while True:
+            self.clear_screen()
+            self.print_banner()
+            print("═══ OVERCLOCKING LABORATORY ═══")
+            print()
+            self.announce_achievements()
+            
+            module = self.current_modules[0]  # Focus on first module
+            print(f"Current Settings - {module.name}")
+            print(f"Frequency: {module.current_speed} MHz")
+            print(f"Primary Timings: {'-'.join(map(str, module.current_timings[:4]))}")
+            secondaries = dict(zip(SECONDARY_TIMING_NAMES, module_timings(module)[len(PRIMARY_TIMING_NAMES):]))
+            print(f"Secondary: tRRD_S {secondaries['tRRD_S']} | tFAW {secondaries['tFAW']} | "
+                  f"tRFC {secondaries['tRFC']} | tREFI {secondaries['tREFI']}")
+            print(f"Voltage: {module.current_voltage:.3f}V")
+            print(f"Temperature: {module.temperature:.1f}°C")
+            print(f"Stability: {module.stability_score:.1f}%")
+            performance = performance_of(stability_inputs(module, self.memory_controller))
+            print(f"Performance: {performance['read'] / 1000:.1f} GB/s read | {performance['latency']:.1f} ns")
+            print(f"History: {len(self.history.undo_stack)} undo | {len(self.history.redo_stack)} redo | "
+                  f"{len(self.history.checkpoints)} checkpoints")
+            print()
+            
+            print("Overclocking Options:")
+            print("1. Adjust Frequency")
+            print("2. Adjust Primary Timings")
+            print("3. Adjust Voltage")
+            print("4. Secondary Timings (Advanced)")
+            print("5. XMP / Saved Profiles")
+            print("6. Auto-Overclock Assistant")
+            print("7. Reset to JEDEC")
+            print("8. Quick Stability Test")
+            print("9. Memory Benchmark")
+            print("10. Memory Controller (Gear / Command Rate)")
+            print("11. Sensitivity Analysis")
+            print("12. Stability Heatmap")
+            print("13. Back to Main Menu")
+            print("U. Undo | R. Redo | C. Checkpoints")
+            print()
+            
+            choice = input("Select option: ").strip().lower()
+            
+            if choice == "1":
+                self.adjust_frequency()
+            elif choice == "2":
+                self.adjust_primary_timings()
+            elif choice == "3":
+                self.adjust_voltage()
+            elif choice == "4":
+                self.adjust_secondary_timings()
+            elif choice == "5":
+                self.profiles_menu()
+            elif choice == "6":
+                self.auto_overclock_assistant()
+            elif choice == "7":
+                self.reset_to_jedec()
+            elif choice == "8":
+                self.quick_stability_test()
+            elif choice == "9":
+                self.memory_benchmark()
+            elif choice == "10":
+                self.adjust_memory_controller()
+            elif choice == "11":
+                self.sensitivity_view()
+            elif choice == "12":
+                self.stability_heatmap_view()
+            elif choice == "13":
+                break
+            elif choice == "u":
+                snapshot = self.history.undo()
+                if snapshot is not None:
+                    self.apply_state(snapshot)
+            elif choice == "r":
+                snapshot = self.history.redo()
+                if snapshot is not None:
+                    self.apply_state(snapshot)
+            elif choice == "c":
+                self.checkpoints_menu()
             else:
                 print("Invalid option!")
                 input("Press Enter to continue...")
+            # Whatever the option changed becomes one undo step
+            self.record_history()
+                
+    def checkpoints_menu(self):
+        self.clear_screen()
+        print("═══ CHECKPOINTS ═══")
+        print()
+        
+        names = sorted(self.history.checkpoints)
+        for i, name in enumerate(names, 1):
+            modules, _ = self.history.checkpoints[name]
+            speed, timings, voltage, _ = modules[0]
+            print(f"{i}. {name}: {speed} MHz @ {'-'.join(map(str, timings))} | {voltage:.3f}V")
+        if not names:
+            print("No checkpoints yet.")
+        print()
+        print("S. Save current settings as checkpoint")
+        print("Enter a number to restore that checkpoint, or press Enter to go back")
+        choice = input("Select option: ").strip()
+        
+        if choice.lower() == "s":
+            self.record_history()
+            name = input("Checkpoint name: ").strip()
+            if name:
+                self.history.checkpoint(name)
+                print(f"Checkpoint '{name}' saved.")
+                input("Press Enter to continue...")
+        elif choice.isdigit() and 1 <= int(choice) <= len(names):
+            # Restoring is itself a step, so it can be undone
+            self.apply_state(self.history.checkpoints[names[int(choice) - 1]])
+            self.record_history()
+            print(f"Restored '{names[int(choice) - 1]}'.")
+            input("Press Enter to continue...")
                 
     def adjust_frequency(self):
         self.clear_screen()
@@ -357,19 +3289,8 @@ class RAMOverclockGame:
         print(f"XMP/DOCP Rating: {module.rated_speed} MHz")
         print()
         
-        # Calculate safe ranges based on IC type
-        safe_ranges = {
-            MemoryIC.SAMSUNG_BDIE: (3200, 4400),
-            MemoryIC.SAMSUNG_CDIE: (3000, 3800),
-            MemoryIC.SAMSUNG_EDIE: (2800, 3400),
-            MemoryIC.HYNIX_CJR: (3000, 3600),
-            MemoryIC.HYNIX_DJR: (3200, 3800),
-            MemoryIC.HYNIX_MFR: (2400, 3000),
-            MemoryIC.MICRON_EDIE: (3000, 3600),
-            MemoryIC.MICRON_BDIE: (4800, 6000) if module.memory_type == MemoryType.DDR5 else (3400, 4000),
-        }
-        
-        min_freq, max_freq = safe_ranges.get(module.ic_type, (2133, 3200))
+        # Safe ranges come from the IC profile table
+        min_freq, max_freq = (int(v) for v in IC_PROFILES.frequency_range[IC_PROFILES.row(module.memory_type, module.ic_type)])
         print(f"Typical Range for {module.ic_type.value}: {min_freq}-{max_freq} MHz")
         print()
         
@@ -381,20 +3302,15 @@ class RAMOverclockGame:
             elif new_freq > max_freq + 200:
                 print("Warning: Very aggressive overclock! High chance of instability.")
             
-            # Update frequency and recalculate stability
-            old_freq = module.current_speed
+            # Update frequency and recalculate stability; heat built up under the
+            # old frequency is integrated first
+            self.update_thermals()
             module.current_speed = new_freq
-            
-            # Calculate stability impact
-            freq_stress = abs(new_freq - module.rated_speed) / module.rated_speed
-            stability_penalty = min(50, freq_stress * 100)
-            
-            module.stability_score = max(10, 100 - stability_penalty)
-            module.temperature += (new_freq - old_freq) * 0.01  # Frequency affects temperature
+            self.refresh_stability()
             
             print(f"\nFrequency set to {new_freq} MHz")
             print(f"Estimated stability: {module.stability_score:.1f}%")
-            print(f"Temperature: {module.temperature:.1f}°C")
+            print(f"Temperature: {module.temperature:.1f}°C (settling toward {self.thermal_target():.1f}°C)")
             
         except ValueError:
             print("Invalid frequency!")
@@ -415,15 +3331,8 @@ class RAMOverclockGame:
         print()
         
         # Show typical ranges for current IC
-        typical_ranges = {
-            MemoryIC.SAMSUNG_BDIE: {"CL": (14, 19), "tRCD": (14, 21), "tRP": (14, 21), "tRAS": (28, 42)},
-            MemoryIC.SAMSUNG_CDIE: {"CL": (16, 22), "tRCD": (16, 24), "tRP": (16, 24), "tRAS": (32, 48)},
-            MemoryIC.HYNIX_CJR: {"CL": (16, 20), "tRCD": (18, 22), "tRP": (18, 22), "tRAS": (36, 44)},
-            MemoryIC.MICRON_BDIE: {"CL": (38, 46), "tRCD": (38, 48), "tRP": (38, 48), "tRAS": (76, 96)} if module.memory_type == MemoryType.DDR5 else {"CL": (15, 19), "tRCD": (17, 21), "tRP": (17, 21), "tRAS": (34, 42)}
-        }
-        
-        ranges = typical_ranges.get(module.ic_type, {"CL": (15, 20), "tRCD": (15, 22), "tRP": (15, 22), "tRAS": (30, 44)})
-        range_names = ["CL", "tRCD", "tRP", "tRAS"]
+        ranges = IC_PROFILES.timing_ranges(IC_PROFILES.row(module.memory_type, module.ic_type))
+        range_names = list(ICProfileTable.TIMING_NAMES)
         
         print("Typical ranges for your IC:")
         for i, name in enumerate(range_names):
@@ -449,16 +3358,8 @@ class RAMOverclockGame:
                 input("Press Enter to continue...")
                 return
                 
-            # Calculate stability based on timing aggressiveness
-            stability_bonus = 0
-            for i, (name, value) in enumerate(zip(range_names, module.current_timings)):
-                min_val, max_val = ranges[name]
-                if value < min_val:
-                    stability_bonus -= (min_val - value) * 5  # Penalty for too tight
-                elif value > max_val:
-                    stability_bonus += (value - max_val) * 2   # Bonus for loose timings
-                    
-            module.stability_score = max(10, min(100, module.stability_score + stability_bonus))
+            # Only the timing component is recomputed
+            self.refresh_stability()
             
             print(f"\nTimings updated: {'-'.join(map(str, module.current_timings))}")
             print(f"Estimated stability: {module.stability_score:.1f}%")
@@ -476,14 +3377,10 @@ class RAMOverclockGame:
         module = self.current_modules[0]
         print(f"Current DRAM Voltage: {module.current_voltage:.3f}V")
         
-        if module.memory_type == MemoryType.DDR4:
-            print("DDR4 Safe Range: 1.200V - 1.500V")
-            print("Daily Use Limit: 1.400V")
-            print("Extreme OC Limit: 1.500V")
-        else:
-            print("DDR5 Safe Range: 1.100V - 1.400V") 
-            print("Daily Use Limit: 1.300V")
-            print("Extreme OC Limit: 1.400V")
+        jedec_v, daily_v, max_v = IC_PROFILES.voltage[IC_PROFILES.row(module.memory_type, module.ic_type)]
+        print(f"{module.memory_type.value} {module.ic_type.value} Safe Range: {jedec_v:.3f}V - {max_v:.3f}V")
+        print(f"Daily Use Limit: {daily_v:.3f}V")
+        print(f"Extreme OC Limit: {max_v:.3f}V")
         print()
         
         print("Memory Controller Voltages:")
@@ -501,7 +3398,7 @@ class RAMOverclockGame:
         try:
             if choice == "1":
                 new_voltage = float(input("Enter new DRAM voltage: "))
-                max_safe = 1.5 if module.memory_type == MemoryType.DDR4 else 1.4
+                max_safe = float(max_v)
                 
                 if new_voltage > max_safe:
                     print(f"WARNING: Voltage exceeds safe limit of {max_safe}V!")
@@ -509,40 +3406,99 @@ class RAMOverclockGame:
                     if confirm != 'y':
                         return
                         
+                self.update_thermals()
                 module.current_voltage = new_voltage
-                
-                # Higher voltage improves stability but increases temperature
-                voltage_benefit = (new_voltage - 1.2) * 20 if module.memory_type == MemoryType.DDR4 else (new_voltage - 1.1) * 25
-                module.stability_score = min(100, module.stability_score + voltage_benefit)
-                module.temperature += (new_voltage - 1.2) * 15 if module.memory_type == MemoryType.DDR4 else (new_voltage - 1.1) * 18
+                self.refresh_stability()
                 
                 print(f"DRAM voltage set to {new_voltage:.3f}V")
+                print(f"Temperature: {module.temperature:.1f}°C (settling toward {self.thermal_target():.1f}°C)")
                 
             elif choice == "2":
                 new_vccio = float(input("Enter new VCCIO voltage: "))
                 self.memory_controller.vccio_voltage = new_vccio
+                self.refresh_stability()
                 print(f"VCCIO set to {new_vccio:.3f}V")
+                print(f"Estimated stability: {module.stability_score:.1f}%")
                 
             elif choice == "3":
                 new_vccsa = float(input("Enter new VCCSA voltage: "))
                 self.memory_controller.vccsa_voltage = new_vccsa
+                self.refresh_stability()
                 print(f"VCCSA set to {new_vccsa:.3f}V")
+                print(f"Estimated stability: {module.stability_score:.1f}%")
                 
         except ValueError:
             print("Invalid voltage!")
             
         input("\nPress Enter to continue...")
         
-    def apply_xmp_profile(self):
+    def profiles_menu(self):
         module = self.current_modules[0]
-        print(f"Applying XMP/DOCP profile for {module.name}...")
+        while True:
+            self.clear_screen()
+            print("═══ MEMORY PROFILES ═══")
+            print()
+            library = np.zeros(0, dtype=profile_dtype())
+            if os.path.exists(PROFILE_FILE):
+                try:
+                    library = read_profiles(PROFILE_FILE)
+                except (OSError, ValueError) as e:
+                    print(f"Profile library unreadable: {e}\n")
+            saved = library[library["kit"] == module.name.encode()[:64]]
+            
+            print(f"1. Apply XMP/DOCP profile ({module.rated_speed} MHz @ {'-'.join(map(str, module.rated_timings))})")
+            print("2. Save current settings as a profile")
+            if len(saved):
+                print(f"\nSaved profiles for {module.name}:")
+                for i, record in enumerate(saved, 3):
+                    print(f"{i}. {format_profile(record)}")
+            print("\n0. Back")
+            choice = input("\nSelect option: ").strip()
+            
+            if choice == "1":
+                self.apply_xmp_profile()
+            elif choice == "2":
+                label = input(f"Profile name (default: {self.controller_name}): ").strip() or self.controller_name
+                try:
+                    record = profile_record(module, self.memory_controller, label, module.stability_score)
+                except ValueError as e:
+                    print(f"Can't save these settings as a profile: {e}")
+                else:
+                    count = append_profiles(PROFILE_FILE, record)
+                    print(f"Saved '{label}' to {PROFILE_FILE} ({count} profiles)")
+                input("Press Enter to continue...")
+            elif choice.isdigit() and 3 <= int(choice) < 3 + len(saved):
+                self.apply_xmp_profile(saved[int(choice) - 3])
+            elif choice == "0":
+                break
         
-        module.current_speed = module.rated_speed
-        module.current_timings = list(module.rated_timings)
-        module.current_voltage = module.voltage
-        module.stability_score = 85  # XMP profiles are usually stable
+    def apply_xmp_profile(self, profile=None):
+        # The kit's own XMP profile, or a record from a profile library
+        module = self.current_modules[0]
+        controller = self.memory_controller
+        self.update_thermals()
+        if profile is None:
+            print(f"Applying XMP/DOCP profile for {module.name}...")
+            module.current_speed = module.rated_speed
+            module.current_timings = list(module.rated_timings)
+            module.secondary_timings = {}
+            module.current_voltage = module.voltage
+        else:
+            print(f"Applying saved profile '{profile['label'].decode(errors='replace')}'...")
+            module.current_speed = int(profile["speed"])
+            module.current_timings = profile["timings"].tolist()
+            module.secondary_timings = {name: int(value) for name, value in
+                                        zip(SECONDARY_TIMING_NAMES, profile["secondaries"].tolist()) if value}
+            module.current_voltage = int(profile["voltage_mv"]) / 1000
+            if controller.supports_command_rate_1t:
+                controller.current_command_rate = int(profile["command_rate"])
+            if module.memory_type == MemoryType.DDR5:
+                controller.current_gear_mode = int(profile["gear"])
+            controller.vccio_voltage = round(controller.stock_vccio + int(profile["vccio_offset_mv"]) / 1000, 3)
+            controller.vccsa_voltage = round(controller.stock_vccsa + int(profile["vccsa_offset_mv"]) / 1000, 3)
+        self.refresh_stability()
         
-        print(f"Profile applied: {module.rated_speed} MHz @ {'-'.join(map(str, module.rated_timings))}")
+        print(f"Profile applied: {module.current_speed} MHz @ {'-'.join(map(str, module.current_timings))}")
         input("Press Enter to continue...")
         
     def reset_to_jedec(self):
@@ -551,9 +3507,11 @@ class RAMOverclockGame:
         
         module.current_speed = module.jedec_speed
         module.current_timings = list(module.jedec_timings)
+        module.secondary_timings = {}
         module.current_voltage = 1.2 if module.memory_type == MemoryType.DDR4 else 1.1
-        module.stability_score = 100
-        module.temperature = self.ambient_temperature + 10
+        
+        # A reset implies a reboot, so the modules start from their idle equilibrium
+        self.update_thermals(dt=float("inf"))
         
         print("Reset complete. All settings at JEDEC defaults.")
         input("Press Enter to continue...")
@@ -570,25 +3528,305 @@ class RAMOverclockGame:
         # Determine if settings are stable
         if module.stability_score > 80:
             print("✓ STABLE - No errors detected!")
+            STRESS_TESTS.labels("quick", "passed").inc()
         elif module.stability_score > 60:
             print("⚠ UNSTABLE - Minor errors detected")
-            module.errors += random.randint(1, 5)
+            module.errors += int(self.event_streams("quick").stream().integers(1, 6))
+            STRESS_TESTS.labels("quick", "unstable").inc()
         else:
             print("✗ FAILED - System would crash!")
-            module.errors += random.randint(5, 20)
+            module.errors += int(self.event_streams("quick").stream().integers(5, 21))
+            STRESS_TESTS.labels("quick", "failed").inc()
             
         input("Press Enter to continue...")
         
+    def stability_heatmap_view(self):
+        view = 0
+        while True:
+            self.clear_screen()
+            print("═══ STABILITY HEATMAP ═══")
+            print()
+            
+            module = self.current_modules[0]
+            inputs = stability_inputs(module, self.memory_controller)
+            environment = (self.ambient_temperature, self.thermal.resistance(self.cooling_solution),
+                           ThermalModel.STRESS_ACTIVITY["heavy"])
+            axes = StabilityHeatmap.VIEWS[view]
+            computed, cached = self.heatmaps.computed_tiles, self.heatmaps.cached_tiles
+            started = time.perf_counter()
+            lines = self.heatmaps.render(inputs, axes, environment)
+            elapsed = time.perf_counter() - started
+            
+            x_label, y_label = (StabilityHeatmap.AXES[axis][1] for axis in axes)
+            print(f"{module.name} | {y_label} vs {x_label} under heavy load")
+            print()
+            for line in lines:
+                print(line)
+            print()
+            print(f"Tiles: {self.heatmaps.computed_tiles - computed} computed, {self.heatmaps.cached_tiles - cached} "
+                  f"from cache ({elapsed * 1000:.1f} ms)")
+            print()
+            for i, (x_axis, y_axis) in enumerate(StabilityHeatmap.VIEWS, 1):
+                print(f"{i}. {StabilityHeatmap.AXES[y_axis][1]} vs {StabilityHeatmap.AXES[x_axis][1]}")
+            choice = input("Select view (Enter to go back): ").strip()
+            if not choice:
+                return
+            if choice.isdigit() and 1 <= int(choice) <= len(StabilityHeatmap.VIEWS):
+                view = int(choice) - 1
+        
+    def sensitivity_view(self):
+        self.clear_screen()
+        print("═══ SENSITIVITY ANALYSIS ═══")
+        print()
+        
+        module = self.current_modules[0]
+        self.update_thermals()
+        inputs = stability_inputs(module, self.memory_controller)
+        started = time.perf_counter()
+        results = sensitivity_analysis(inputs, self.ambient_temperature, self.thermal.resistance(self.cooling_solution),
+                                       ThermalModel.STRESS_ACTIVITY["heavy"])
+        elapsed = time.perf_counter() - started
+        
+        print(f"{module.current_speed} MHz @ {'-'.join(map(str, module.current_timings[:4]))} | "
+              f"{module.current_voltage:.3f}V | under heavy load")
+        print(f"Effect of raising each knob by one step ({2 * len(results) + 1} configs in one batch, {elapsed * 1000:.1f} ms):")
+        print()
+        print(f"{'Knob':<14} {'Step':>7} {'Stability':>10} {'Temp °C':>8} {'Latency ns':>11}")
+        for result in results:
+            step = f"{result['step']:g}" + ("V" if isinstance(result["step"], float) else "")
+            print(f"{result['knob']:<14} {step:>7} {result['stability']:>+10.2f} {result['temperature']:>+8.2f} "
+                  f"{result['latency']:>+11.2f}")
+        print()
+        print("Stability is the margin before clipping, so it still moves when the score reads 100%.")
+        input("\nPress Enter to continue...")
+        
+    def adjust_memory_controller(self):
+        self.clear_screen()
+        print("═══ MEMORY CONTROLLER SETTINGS ═══")
+        print()
+        
+        module = self.current_modules[0]
+        controller = self.memory_controller
+        ddr5 = module.memory_type == MemoryType.DDR5
+        inputs = stability_inputs(module, controller)
+        ceiling = float(imc_ceiling(*(inputs[field] for field in ("ddr5", "imc_quality", "command_rate", "gear",
+                                                                  "gear_down", "vccio_offset", "vccsa_offset"))))
+        print(f"IMC Quality: {controller.imc_quality}/10 | Estimated ceiling: {ceiling:.0f} MHz")
+        print(f"Command Rate: {inputs['command_rate']}T" + ("" if controller.supports_command_rate_1t else " (1T not supported)"))
+        if ddr5:
+            print(f"Gear Mode: {controller.current_gear_mode}")
+        print(f"Gear Down Mode: {'Available' if controller.supports_gear_down else 'Not supported'}")
+        print(f"VCCIO: {controller.vccio_voltage:.3f}V (stock {controller.stock_vccio:.3f}V) | "
+              f"VCCSA: {controller.vccsa_voltage:.3f}V (stock {controller.stock_vccsa:.3f}V)")
+        print()
+        
+        print("1. Toggle Command Rate (1T/2T)")
+        print("2. Toggle Gear Mode (DDR5)")
+        print("3. Back")
+        choice = input("Select option: ").strip()
+        
+        if choice == "1":
+            if not controller.supports_command_rate_1t:
+                print("This memory controller only runs 2T.")
+            else:
+                controller.current_command_rate = 3 - controller.current_command_rate
+                print(f"Command rate set to {controller.current_command_rate}T")
+        elif choice == "2":
+            if not ddr5:
+                print("Gear modes only apply to DDR5.")
+            else:
+                controller.current_gear_mode = 3 - controller.current_gear_mode
+                print(f"Gear mode set to {controller.current_gear_mode}")
+        else:
+            return
+        
+        # Only the IMC component is recomputed
+        self.refresh_stability()
+        print(f"Estimated stability: {module.stability_score:.1f}% | {format_performance(performance_of(stability_inputs(module, controller)))}")
+        input("\nPress Enter to continue...")
+        
+    def memory_benchmark(self):
+        self.clear_screen()
+        print("═══ MEMORY BENCHMARK ═══")
+        print()
+        
+        # Current settings against the kit's XMP and JEDEC profiles, scored in one batch
+        module = self.current_modules[0]
+        base = stability_inputs(module, self.memory_controller)
+        profiles = [("Current", base)]
+        for label, speed, timings in (("XMP", module.rated_speed, module.rated_timings),
+                                      ("JEDEC", module.jedec_speed, module.jedec_timings)):
+            profile = dict(base, speed=speed, cl=timings[0], trcd=timings[1], trp=timings[2], tras=timings[3],
+                           secondary_overrides=())
+            profile["secondaries"] = derived_secondaries(profile)
+            profiles.append((label, profile))
+        batch = {field: np.array([inputs[field] for _, inputs in profiles]) for field in PERFORMANCE_FIELDS}
+        results = memory_performance(*(batch[field] for field in PERFORMANCE_FIELDS))
+        
+        print(f"{'Profile':<9} {'Speed':>6} {'Read MB/s':>10} {'Write MB/s':>11} {'Copy MB/s':>10} {'Latency':>9}")
+        for i, (label, inputs) in enumerate(profiles):
+            print(f"{label:<9} {inputs['speed']:>6} {results['read'][i]:>10,.0f} {results['write'][i]:>11,.0f} "
+                  f"{results['copy'][i]:>10,.0f} {results['latency'][i]:>7.1f}ns")
+        print()
+        print(f"Command rate {base['command_rate']}T | Gear {base['gear']}")
+        print("Secondary timings on Auto follow each profile's speed; run the AIDA64 test to measure under load.")
+        input("\nPress Enter to continue...")
+        
     def adjust_secondary_timings(self):
-        print("Advanced secondary timing adjustment coming soon...")
-        print("This will include tRRD, tWTR, tRFC, and other critical timings.")
-        input("Press Enter to continue...")
+        module = self.current_modules[0]
+        constraints = TIMING_CONSTRAINTS[module.memory_type]
+        primaries = len(PRIMARY_TIMING_NAMES)
+        
+        while True:
+            self.clear_screen()
+            print("═══ SECONDARY & TERTIARY TIMINGS ═══")
+            print()
+            
+            timings = module_timings(module)
+            limits = secondary_limits(module)
+            print(f"{module.current_speed} MHz @ {'-'.join(map(str, timings[:primaries]))} | {module.ic_type.value}")
+            print()
+            print(f"    {'Timing':<10} {'Value':>6}  {'Mode':<7} IC limit")
+            for i, (name, value, limit) in enumerate(zip(SECONDARY_TIMING_NAMES, timings[primaries:], limits)):
+                mode = "Manual" if name in module.secondary_timings else "Auto"
+                bound = f"<= {limit}" if name == "tREFI" else f">= {limit}"
+                print(f"{i+1:>2}. {name:<10} {value:>6}  {mode:<7} {bound}")
+            print()
+            
+            problems = constraints.violations(timings)
+            if problems:
+                print("Constraint violations:")
+                for problem in problems:
+                    print(f"  ✗ {problem}")
+            else:
+                print("✓ All timing relations satisfied")
+            print(f"Estimated stability: {module.stability_score:.1f}%")
+            print()
+            
+            print("Enter 1-14 to set a timing, A = all to Auto, T = tighten to IC limits,")
+            choice = input("F = fix violations, Enter = back: ").strip().lower()
+            
+            if not choice:
+                return
+            elif choice == "a":
+                module.secondary_timings = {}
+            elif choice == "t":
+                # Every secondary at its limit, then loosened just enough to satisfy the relations
+                tightened = constraints.repair(list(module.current_timings) + limits, fixed=range(primaries))
+                module.secondary_timings = dict(zip(SECONDARY_TIMING_NAMES, tightened[primaries:]))
+            elif choice == "f":
+                repaired = constraints.repair(timings)
+                module.current_timings[3] = repaired[3]  # tRAS may need to cover the other primaries
+                module.secondary_timings = {name: repaired[constraints.INDEX[name]] for name in module.secondary_timings}
+            elif choice.isdigit() and 1 <= int(choice) <= len(SECONDARY_TIMING_NAMES):
+                name = SECONDARY_TIMING_NAMES[int(choice) - 1]
+                value = input(f"New value for {name} (blank for Auto): ").strip()
+                try:
+                    if value:
+                        if not 1 <= int(value) <= PROFILE_TIMING_MAX:
+                            raise ValueError(value)
+                        module.secondary_timings[name] = int(value)
+                    else:
+                        module.secondary_timings.pop(name, None)
+                except ValueError:
+                    print("Invalid input!")
+                    input("Press Enter to continue...")
+                    continue
+            else:
+                print("Invalid choice!")
+                input("Press Enter to continue...")
+                continue
+            
+            # Only the timing component is recomputed
+            self.refresh_stability()
         
     def auto_overclock_assistant(self):
-        print("Auto-overclock assistant coming soon...")
-        print("This will provide guided overclocking based on your hardware.")
+        self.clear_screen()
+        print("═══ AUTO-OVERCLOCK ASSISTANT ═══")
+        print()
+        
+        module = self.current_modules[0]
+        print(f"Starting point: {module.current_speed} MHz @ {'-'.join(map(str, module.current_timings[:4]))} | {module.current_voltage:.3f}V")
+        print("The assistant searches frequency, primary timings, DRAM voltage (up to the daily limit),")
+        print("command rate, gear mode and VCCIO/VCCSA for the best modeled performance that stays")
+        print("above your stability target under heavy load.")
+        print()
+        
+        try:
+            target = input("Minimum stability target (50-100, default 90): ").strip()
+            target = max(50.0, min(100.0, float(target))) if target else 90.0
+        except ValueError:
+            print("Invalid target!")
+            input("Press Enter to continue...")
+            return
+        goal = "bandwidth" if input("Optimize for 1. Latency or 2. Bandwidth (default 1): ").strip() == "2" else "latency"
+        print("Search strategy:")
+        print("1. Hill climb (fast, keeps secondaries on Auto)")
+        print("2. Island evolutionary search (every timing and rail, parallel populations)")
+        evolutionary = input("Select strategy (default 1): ").strip() == "2"
+        
+        self.update_thermals()
+        activity = ThermalModel.STRESS_ACTIVITY["heavy"]
+        resistance = self.thermal.resistance(self.cooling_solution)
+        ddr5 = module.memory_type == MemoryType.DDR5
+        inputs = stability_inputs(module, self.memory_controller)
+        started = time.perf_counter()
+        if evolutionary:
+            tuner = IslandTuner(inputs, (self.ambient_temperature, resistance, activity), target, goal,
+                                streams=self.event_streams("islands"))
+            best, stability = tuner.run(progress=self.report_island_progress)
+            print()
+        else:
+            temperature_fn = lambda speed, voltage: self.thermal.steady_state(
+                self.thermal.power(speed, voltage, activity, ddr5), self.ambient_temperature, resistance)
+            tuner = AutoTuner(inputs, temperature_fn, target, self.stability, goal=goal)
+            best, stability = tuner.run()
+        elapsed = time.perf_counter() - started
+        
+        print()
+        print(f"Searched {tuner.evaluations} configurations in {elapsed * 1000:.1f} ms")
+        if evolutionary:
+            secondaries = dict(best["secondary_overrides"])
+            print("Secondaries: " + " | ".join(f"{name} {secondaries[name]}" for name in SECONDARY_TIMING_NAMES[:6]))
+        controller = self.memory_controller
+        print(f"Suggested: {best['speed']} MHz @ {best['cl']}-{best['trcd']}-{best['trp']}-{best['tras']} | {best['dram_voltage']:.3f}V")
+        print(f"Controller: {best['command_rate']}T | Gear {best['gear']} | "
+              f"VCCIO {controller.stock_vccio + best['vccio_offset']:.3f}V | VCCSA {controller.stock_vccsa + best['vccsa_offset']:.3f}V")
+        print(f"Stability under load: {stability:.1f}%")
+        print(f"Expected: {format_performance(performance_of(best))}")
+        if stability >= target:
+            update_leaderboard([leaderboard_entry(module, self.controller_name, controller, best, stability, "tune")],
+                               self.leaderboard_file)
+        
+        if input("Apply these settings? (y/N): ").lower() == 'y':
+            # Replay the climb into the history so each step can be undone on its own
+            self.record_history()
+            for step in tuner.path[1:]:
+                module.current_speed = step["speed"]
+                module.current_timings = [step["cl"], step["trcd"], step["trp"], step["tras"]]
+                module.secondary_timings = dict(step["secondary_overrides"])
+                module.current_voltage = step["dram_voltage"]
+                if controller.supports_command_rate_1t:
+                    controller.current_command_rate = step["command_rate"]
+                if ddr5:
+                    controller.current_gear_mode = step["gear"]
+                controller.vccio_voltage = round(controller.stock_vccio + step["vccio_offset"], 3)
+                controller.vccsa_voltage = round(controller.stock_vccsa + step["vccsa_offset"], 3)
+                self.record_history()
+            self.refresh_stability()
+            print(f"Settings applied in {len(tuner.path) - 1} undoable steps. Run a stress test to confirm!")
         input("Press Enter to continue...")
         
+    def report_island_progress(self, tuner: IslandTuner):
+        best = tuner.best
+        if best is None:
+            return
+        performance = performance_of(best)
+        result = (f"{performance['read']:,.0f} MB/s" if tuner.goal == "bandwidth" else f"{performance['latency']:.1f} ns")
+        print(f"\rGeneration {tuner.generation}/{tuner.generations} | {tuner.generations_per_s:.0f} gen/s | "
+              f"best {result} @ {best['speed']} {best['cl']}-{best['trcd']}-{best['trp']}-{best['tras']} "
+              f"({tuner.best_stability:.1f}%)   ", end="", flush=True)
+        
     def stress_testing_menu(self):
         while True:
             self.clear_screen()
@@ -600,7 +3838,7 @@ class RAMOverclockGame:
             print(f"Current Configuration:")
             print(f"  {module.current_speed} MHz @ {'-'.join(map(str, module.current_timings[:4]))}")
             print(f"  Voltage: {module.current_voltage:.3f}V | Temp: {module.temperature:.1f}°C")
-            print(f"  Stability Score: {module.stability_score}% | Errors: {module.errors}")
+            print(f"  Stability Score: {module.stability_score:.1f}% | Errors: {module.errors}")
             print()
             
             print("Available Stress Tests:")
@@ -610,7 +3848,8 @@ class RAMOverclockGame:
             print("4. Y-Cruncher Stress Test (Extreme)")
             print("5. Custom Test Duration")
             print("6. View Test History")
-            print("7. Back to Main Menu")
+            print("7. Live Dashboard (Test + Temperature)")
+            print("8. Back to Main Menu")
             print()
             
             choice = input("Select test: ").strip()
@@ -628,6 +3867,8 @@ class RAMOverclockGame:
             elif choice == "6":
                 self.view_test_history()
             elif choice == "7":
+                self.live_dashboard()
+            elif choice == "8":
                 break
             else:
                 print("Invalid option!")
@@ -644,62 +3885,50 @@ class RAMOverclockGame:
         print(f"Intensity: {intensity.upper()}")
         print()
         
-        # Calculate failure probability based on stability score and intensity
-        intensity_multipliers = {"light": 0.5, "medium": 1.0, "heavy": 1.5, "extreme": 2.0}
-        failure_chance = (100 - module.stability_score) * intensity_multipliers[intensity] / 100
-        
-        # Temperature rises during testing
-        temp_increase = {"light": 5, "medium": 10, "heavy": 15, "extreme": 20}[intensity]
-        original_temp = module.temperature
-        module.temperature += temp_increase
+        run = StressTestRun(self, test_name, duration, intensity)
         
         print("Starting test...")
         print("Press Ctrl+C to abort (may cause instability!)")
         print()
         
         try:
-            errors_found = 0
-            for i in range(duration):
-                progress = (i + 1) / duration * 100
-                print(f"\rProgress: [{('#' * int(progress/5)).ljust(20)}] {progress:.1f}% | Temp: {module.temperature:.1f}°C", end="", flush=True)
-                
-                # Check for errors based on failure chance
-                if random.random() < failure_chance / duration:
-                    errors_found += 1
-                    
-                # Temperature can cause additional instability
-                if module.temperature > 85:
-                    if random.random() < 0.1:  # High temp error chance
-                        errors_found += 1
-                        
+            while not run.done:
+                run.step()
+                print(f"\rProgress: [{('#' * int(run.progress/5)).ljust(20)}] {run.progress:.1f}% | Temp: {module.temperature:.1f}°C", end="", flush=True)
                 time.sleep(0.1)  # Speed up for demo
                 
             print("\n")
             
             # Test results
-            if errors_found == 0:
+            result = run.finish()
+            if result == "passed":
                 print("✓ TEST PASSED - No errors detected!")
                 print("Your overclock is stable for this workload.")
-                module.stability_score = min(100, module.stability_score + 2)
-            elif errors_found < 5:
-                print(f"⚠ TEST UNSTABLE - {errors_found} errors detected")
+            elif result == "unstable":
+                print(f"⚠ TEST UNSTABLE - {run.errors_found} errors detected")
                 print("Consider reducing frequency or loosening timings.")
-                module.errors += errors_found
-                module.stability_score = max(10, module.stability_score - 5)
             else:
-                print(f"✗ TEST FAILED - {errors_found} errors detected!")
+                print(f"✗ TEST FAILED - {run.errors_found} errors detected!")
                 print("This overclock is not stable. Reduce settings immediately.")
-                module.errors += errors_found
-                module.stability_score = max(10, module.stability_score - 15)
-                
-            # Cool down after test
-            module.temperature = original_temp + 2  # Slight residual heat
+            print()
+            self.announce_achievements()
+            
+            if test_name == "AIDA64 Memory" and result != "failed":
+                # Run-to-run variation of a real benchmark pass
+                performance = performance_of(stability_inputs(module, self.memory_controller))
+                rng = self.event_streams("benchmark").stream()
+                measured = {name: value * rng.uniform(0.99, 1.01) for name, value in performance.items()}
+                print(f"Benchmark: {format_performance(measured)}")
+            
+            summary = self.telemetry.window(run.start_time, self.sim_time)
+            if summary is not None:
+                low, high, mean = summary
+                print(f"Temperature during test: min {low.min():.1f}°C | max {high.max():.1f}°C | mean {mean.mean():.1f}°C")
             
         except KeyboardInterrupt:
             print("\n\nTest aborted by user!")
             print("Aborting stress tests can cause system instability.")
-            module.stability_score = max(10, module.stability_score - 10)
-            module.temperature = original_temp
+            run.abort()
             
         input("\nPress Enter to continue...")
         
@@ -742,15 +3971,12 @@ class RAMOverclockGame:
             
             module = self.current_modules[0]
             
-            # Calculate heat generation from overclock
-            base_temp = self.ambient_temperature + 10
-            freq_heat = (module.current_speed - module.jedec_speed) * 0.005
-            voltage_heat = (module.current_voltage - 1.2) * 20 if module.memory_type == MemoryType.DDR4 else (module.current_voltage - 1.1) * 25
-            
-            module.temperature = base_temp + freq_heat + voltage_heat
+            # Integrate heat generated by the overclock since the last reading
+            self.update_thermals()
             
             print("Current Temperatures:")
             print(f"  Memory Modules: {module.temperature:.1f}°C")
+            print(f"  Idle Equilibrium: {self.thermal_target():.1f}°C")
             print(f"  Ambient: {self.ambient_temperature:.1f}°C")
             print()
             
@@ -775,8 +4001,9 @@ class RAMOverclockGame:
             print()
             
             # Temperature effects on stability
-            if module.temperature > 75:
-                temp_penalty = (module.temperature - 75) * 2
+            warn_temp = IC_PROFILES.thermal[IC_PROFILES.row(module.memory_type, module.ic_type), 0]
+            if module.temperature > warn_temp:
+                temp_penalty = (module.temperature - warn_temp) * 2
                 print(f"High temperature reducing stability by {temp_penalty:.1f}%")
             print()
             
@@ -789,10 +4016,13 @@ class RAMOverclockGame:
             print("5. Add Case Fans")
             print("6. Adjust Ambient Temperature")
             print("7. Live Temperature Graph")
-            print("8. Back to Main Menu")
+            print("8. Live Dashboard (Test + Temperature)")
+            print("9. Export Telemetry (CSV)")
+            print("10. Back to Main Menu")
             print()
             
             choice = input("Select option: ").strip()
+            self.update_thermals()  # Time spent on this screen passed under the old cooling
             
             if choice == "1":
                 self.cooling_solution = "Stock Cooler"
@@ -817,6 +4047,10 @@ class RAMOverclockGame:
             elif choice == "7":
                 self.live_temp_graph()
             elif choice == "8":
+                self.live_dashboard()
+            elif choice == "9":
+                self.export_telemetry()
+            elif choice == "10":
                 break
             else:
                 print("Invalid option!")
@@ -824,6 +4058,20 @@ class RAMOverclockGame:
             if choice in ["1", "2", "3", "4"]:
                 input("Press Enter to continue...")
                 
+    def export_telemetry(self):
+        print("Export resolution:")
+        print("1. 1 second (last hour)")
+        print("2. 10 seconds (last 6 hours)")
+        print("3. 1 minute (last 24 hours)")
+        resolution = {"1": 1, "2": 10, "3": 60}.get(input("Select resolution (1-3): ").strip(), 1)
+        path = input("Output file [telemetry.csv]: ").strip() or "telemetry.csv"
+        try:
+            rows = self.telemetry.export_csv(path, resolution)
+            print(f"Exported {rows} samples to {path}")
+        except OSError as e:
+            print(f"Export failed: {e}")
+        input("Press Enter to continue...")
+        
     def add_case_fans(self):
         print("Adding case fans...")
         print("Better airflow reduces ambient temperature by 2-3°C")
@@ -850,13 +4098,15 @@ class RAMOverclockGame:
         print("Monitoring for 30 seconds... Press Ctrl+C to stop early")
         print()
         
+        start_time = self.sim_time
         try:
             for i in range(30):
-                module = self.current_modules[0]
+                self.update_thermals()
+                _, _, _, _, means = self.telemetry.history(1, last=1)
                 
                 # Simulate small temperature fluctuations
-                temp_variation = random.uniform(-1, 1)
-                display_temp = module.temperature + temp_variation
+                temp_variation = self.rng.stream("sensor").uniform(-1, 1)
+                display_temp = means[-1, 0, 0] + temp_variation
                 
                 # Create simple ASCII graph
                 bar_length = int(display_temp / 2)  # Scale for display
@@ -869,8 +4119,21 @@ class RAMOverclockGame:
             pass
             
         print("\n\nTemperature monitoring stopped.")
+        _, _, _, _, means = self.telemetry.history(1, last=max(1, int(self.sim_time - start_time) + 1))
+        print(f"History: {sparkline(means[:, 0, 0])}")
+        summary = self.telemetry.window(start_time, self.sim_time)
+        if summary is not None:
+            low, high, mean = summary
+            print(f"Min {low[0]:.1f}°C | Max {high[0]:.1f}°C | Mean {mean[0]:.1f}°C")
         input("Press Enter to continue...")
         
+    def live_dashboard(self):
+        try:
+            LiveDashboard(self).run()
+        except ImportError:
+            print("The live dashboard needs the curses module (pip install windows-curses on Windows).")
+            input("Press Enter to continue...")
+        
     def knowledge_base(self):
         while True:
             self.clear_screen()
@@ -890,448 +4153,1397 @@ class RAMOverclockGame:
             print("8. Binning & Quality Assessment")
             print("9. Advanced Techniques")
             print("10. Troubleshooting Guide")
-            print("11. Back to Main Menu")
+            print("11. Search Knowledge Base")
+            print("12. Back to Main Menu")
             print()
             
             choice = input("Select topic: ").strip()
             
-            if choice == "1":
-                self.kb_memory_ics()
-            elif choice == "2":
-                self.kb_primary_timings()
-            elif choice == "3":
-                self.kb_secondary_timings()
-            elif choice == "4":
-                self.kb_voltage_scaling()
-            elif choice == "5":
-                self.kb_temperature_mgmt()
-            elif choice == "6":
-                self.kb_stability_testing()
-            elif choice == "7":
-                self.kb_memory_controllers()
-            elif choice == "8":
-                self.kb_binning()
-            elif choice == "9":
-                self.kb_advanced_techniques()
-            elif choice == "10":
-                self.kb_troubleshooting()
+            if choice.isdigit() and 1 <= int(choice) <= 10:
+                self.show_kb_topic(knowledge_base()[int(choice) - 1][0])
             elif choice == "11":
+                self.search_knowledge_base()
+            elif choice == "12":
                 break
             else:
                 print("Invalid option!")
                 input("Press Enter to continue...")
                 
-    def kb_memory_ics(self):
+    def show_kb_topic(self, key: str):
         self.clear_screen()
-        print("═══ MEMORY IC TYPES & CHARACTERISTICS ═══")
-        print()
-        print("SAMSUNG B-DIE (The Golden Standard)")
-        print("• Best overall scaling and tight timing capability")
-        print("• Loves voltage (1.45V+ for best results)")
-        print("• Can often do CL14 at 3200+ MHz")
-        print("• Responds well to TRCDRD/TRCDWR tuning")
-        print("• Found in premium kits, getting rare")
-        print()
-        print("SAMSUNG C-DIE")
-        print("• Decent frequency scaling, voltage sensitive")
-        print("• Can't take as much voltage as B-Die")
-        print("• Usually requires looser timings than B-Die")
-        print("• Good budget alternative")
-        print()
-        print("HYNIX CJR/DJR")
-        print("• CJR: Budget option, limited OC potential")
-        print("• DJR: Improved version, better scaling")
-        print("• Both prefer lower voltages (1.35V range)")
-        print("• Can achieve good results with patience")
-        print()
-        print("MICRON E-DIE & B-DIE")
-        print("• E-Die: Rev.E, solid performer")
-        print("• B-Die: Different from Samsung, DDR5 focus")
-        print("• Temperature sensitive")
-        print("• Good price/performance ratio")
-        print()
-        print("How to identify your IC:")
-        print("• Use Thaiphoon Burner or similar tools")
-        print("• Check kit specifications and reviews")
-        print("• Look at die revision codes")
+        _, title, sections = next(topic for topic in knowledge_base() if topic[0] == key)
+        print(f"═══ {title} ═══")
         print()
+        for heading, lines in sections:
+            print(heading)
+            for line in lines:
+                print(line)
+            print()
         input("Press Enter to continue...")
         
-    def kb_primary_timings(self):
+    def search_knowledge_base(self):
         self.clear_screen()
-        print("═══ PRIMARY TIMINGS EXPLAINED ═══")
-        print()
-        print("CL (CAS Latency)")
-        print("• Time between read command and data output")
-        print("• Most important for performance")
-        print("• Lower = better, but harder to achieve")
-        print("• Buildzoid's rule: Start loose, tighten gradually")
-        print()
-        print("tRCD (RAS to CAS Delay)")
-        print("• Time between row activation and column access")
-        print("• Often = CL on good ICs")
-        print("• Can sometimes be tighter than CL")
-        print("• DDR5 splits into TRCDRD/TRCDWR")
+        print("═══ SEARCH KNOWLEDGE BASE ═══")
+        print("Keywords are matched exactly; end a word with * for prefix search (e.g. trrd*)")
         print()
-        print("tRP (RAS Precharge)")
-        print("• Time to close a row before opening another")
-        print("• Usually matches tRCD")
-        print("• Critical for stability")
-        print("• Affects sequential access patterns")
-        print()
-        print("tRAS (Row Active Time)")
-        print("• Minimum time a row must stay open")
-        print("• Usually tRCD + tRP + 2-4")
-        print("• Higher values sometimes improve stability")
-        print("• Less performance impact than other primaries")
-        print()
-        print("Tuning Strategy:")
-        print("1. Start with XMP/JEDEC timings")
-        print("2. Tighten CL first")
-        print("3. Match tRCD to CL if possible")
-        print("4. Set tRP = tRCD")
-        print("5. Calculate tRAS = tRCD + tRP + 2")
-        print()
-        input("Press Enter to continue...")
         
-    def kb_secondary_timings(self):
-        self.clear_screen()
-        print("═══ SECONDARY & TERTIARY TIMINGS ═══")
-        print()
-        print("KEY SECONDARY TIMINGS:")
-        print()
-        print("tRRD_S/tRRD_L (Row to Row Delay)")
-        print("• Time between activating rows in same/different bank groups")
-        print("• S = Same bank group, L = Different bank group")
-        print("• Lower = better, but can cause instability")
-        print("• Often 4/6 or 6/8 for tight setups")
-        print()
-        print("tWTR_S/tWTR_L (Write to Read Delay)")
-        print("• Time between write and read commands")
-        print("• Critical for mixed workloads")
-        print("• Samsung B-Die can often do 4/8")
-        print("• Other ICs may need 4/12 or higher")
-        print()
-        print("tRFC (Refresh Cycle Time)")
-        print("• Time for complete refresh operation")
-        print("• Varies by density (8Gb, 16Gb, etc.)")
-        print("• Can often be reduced from JEDEC values")
-        print("• 8Gb: ~312ns, 16Gb: ~560ns typical")
-        print()
-        print("tFAW (Four Bank Activate Window)")
-        print("• Maximum row activations in time window")
-        print("• Usually 16-20 for most setups")
-        print("• Can sometimes be tightened to 12-16")
-        print()
-        print("TERTIARY TIMINGS:")
-        print("• tREFI, tRTP, tWR, tCWL, etc.")
-        print("• Fine-tuning for last % of performance")
-        print("• Require extensive testing")
-        print("• Often unstable if too aggressive")
-        print()
-        input("Press Enter to continue...")
+        query = input("Search: ").strip()
+        if query:
+            index = knowledge_index()
+            started = time.perf_counter()
+            results = index.search(query)
+            elapsed = time.perf_counter() - started
+            print()
+            if results:
+                for line in format_kb_results(query, results):
+                    print(line)
+            else:
+                print("No matches found.")
+            print(f"\n{len(results)} results in {elapsed * 1000:.3f} ms")
+        input("\nPress Enter to continue...")
         
-    def kb_voltage_scaling(self):
+    def compare_all_hardware(self):
         self.clear_screen()
-        print("═══ VOLTAGE SCALING & SAFETY ═══")
+        print("═══ COMPARE ALL HARDWARE ═══")
         print()
-        print("DDR4 VOLTAGE GUIDELINES:")
-        print("• JEDEC: 1.20V")
-        print("• XMP: Usually 1.35V")
-        print("• Daily safe: Up to 1.40V")
-        print("• Extreme OC: 1.45-1.50V (cooling dependent)")
-        print("• Danger zone: 1.55V+ (risk of degradation)")
+        print(f"Auto-tunes every kit on every memory controller at {self.ambient_temperature:.0f}°C ambient with "
+              f"{self.cooling_solution} cooling")
+        print("and ranks the combinations by their best stable result.")
         print()
-        print("DDR5 VOLTAGE GUIDELINES:")
-        print("• JEDEC: 1.10V")
-        print("• XMP: Usually 1.25-1.35V")
-        print("• Daily safe: Up to 1.35V")
-        print("• Extreme OC: 1.40V (with good cooling)")
-        print("• Danger zone: 1.45V+ (high degradation risk)")
-        print()
-        print("VOLTAGE SCALING BEHAVIOR:")
-        print("• Samsung B-Die: Loves voltage, scales well to 1.5V+")
-        print("• Samsung C-Die: Voltage sensitive, 1.4V+ can hurt")
-        print("• Hynix: Generally prefers lower voltages")
-        print("• Micron: Temperature sensitive at high voltage")
-        print()
-        print("MEMORY CONTROLLER VOLTAGES:")
-        print("• VCCIO: IMC I/O voltage (0.95-1.2V typical)")
-        print("• VCCSA: System Agent voltage (1.0-1.3V typical)")
-        print("• Can help with high frequency stability")
-        print("• Start with small increases (0.05V steps)")
-        print()
-        print("BUILDZOID'S VOLTAGE WISDOM:")
-        print("• 'Voltage is the lazy man's timing adjustment'")
-        print("• Always try tightening timings before adding voltage")
-        print("• Temperature matters more than voltage for longevity")
-        print("• Some ICs respond better to frequency than voltage")
-        print()
-        input("Press Enter to continue...")
+        goal = "bandwidth" if input("Rank by 1. Latency or 2. Bandwidth (default 1): ").strip() == "2" else "latency"
         
-    def kb_temperature_mgmt(self):
-        self.clear_screen()
-        print("═══ TEMPERATURE MANAGEMENT ═══")
-        print()
-        print("TEMPERATURE TARGETS:")
-        print("• Excellent: <45°C")
-        print("• Good: 45-65°C")
-        print("• Acceptable: 65-75°C")
-        print("• Concerning: 75-85°C")
-        print("• Critical: >85°C (throttling/errors)")
-        print()
-        print("HEAT SOURCES:")
-        print("• Frequency: Each 100MHz ~1-2°C")
-        print("• Voltage: Each 0.1V ~5-8°C")
-        print("• Current: High-performance workloads")
-        print("• Ambient: Room temperature baseline")
-        print()
-        print("COOLING SOLUTIONS:")
-        print("• Passive: Heatspreaders (5-10°C improvement)")
-        print("• Active: Fans over RAM (10-15°C improvement)")
-        print("• Case airflow: Intake/exhaust balance")
-        print("• Extreme: Direct cooling, LN2 (competitive OC)")
-        print()
-        print("TEMPERATURE EFFECTS:")
-        print("• Stability: Higher temps = more errors")
-        print("• Performance: Thermal throttling at extremes")
-        print("• Longevity: <65°C for 24/7 use recommended")
-        print("• IC specific: Some ICs more temp sensitive")
-        print()
-        print("MONITORING TIPS:")
-        print("• Use HWiNFO64 or similar for real temps")
-        print("• Check during stress testing, not idle")
-        print("• Summer vs winter ambient differences")
-        print("• GPU heat can affect RAM temperatures")
-        print()
-        input("Press Enter to continue...")
+        print("Tuning...")
+        started = time.perf_counter()
+        results, cached = compare_hardware(goal, ambient=self.ambient_temperature, cooling=self.cooling_solution)
+        elapsed = time.perf_counter() - started
         
-    def kb_stability_testing(self):
-        self.clear_screen()
-        print("═══ STABILITY TESTING METHODS ═══")
-        print()
-        print("TESTING HIERARCHY (Buildzoid's approach):")
-        print("1. POST test - Does it boot?")
-        print("2. Quick test - MemTest86 1-2 passes")
-        print("3. Medium test - AIDA64 memory test 30+ min")
-        print("4. Heavy test - Prime95 Blend or Y-Cruncher")
-        print("5. Extreme test - 24h+ MemTest86")
-        print()
-        print("MEMTEST86:")
-        print("• Gold standard for memory testing")
-        print("• Boot from USB, runs outside OS")
-        print("• Comprehensive pattern testing")
-        print("• 1-2 passes usually sufficient for basic stability")
-        print()
-        print("PRIME95 BLEND:")
-        print("• Tests CPU + memory subsystem")
-        print("• Good for finding interaction issues")
-        print("• More stressful than pure memory tests")
-        print("• 30 minutes minimum, 2+ hours preferred")
-        print()
-        print("Y-CRUNCHER:")
-        print("• Mathematical calculations")
-        print("• Very memory intensive") 
-        print("• Good for finding subtle timing issues")
-        print("• Component stress test mode recommended")
-        print()
-        print("AIDA64 MEMORY TEST:")
-        print("• Built-in Windows testing")
-        print("• Convenient but less thorough")
-        print("• Good for quick validation")
-        print("• Not as reliable as MemTest86")
-        print()
-        print("TESTING PHILOSOPHY:")
-        print("• 'Stable enough' depends on use case")
-        print("• Gaming: Light testing often sufficient")
-        print("• Workstation: Heavy testing required")
-        print("• Server: Extreme testing mandatory")
-        print()
-        input("Press Enter to continue...")
+        limit = 20
+        while True:
+            self.clear_screen()
+            print(f"═══ BEST {goal.upper()} (stability ≥ 90%) ═══")
+            print()
+            for line in format_comparison(results, limit):
+                print(line)
+            print()
+            source = "cache" if cached else "a fresh run"
+            print(f"{len(results)} combinations from {source} in {elapsed * 1000:.0f} ms. ! = not stable at any setting tried.")
+            if limit is None or input("A to show all, Enter to go back: ").strip().lower() != "a":
+                break
+            limit = None
+        if limit is None:
+            input("Press Enter to continue...")
         
-    def kb_memory_controllers(self):
-        self.clear_screen()
-        print("═══ MEMORY CONTROLLERS & COMPATIBILITY ═══")
-        print()
-        print("INTEL MEMORY CONTROLLERS:")
-        print("• Z690/Z790: Excellent DDR4/DDR5 support")
-        print("• Z590/Z490: Strong DDR4, very high frequency capable")
-        print("• Earlier gen: More limited, varies by chip quality")
-        print("• Gear modes: Gear 1 (1:1) vs Gear 2 (1:2)")
-        print()
-        print("AMD MEMORY CONTROLLERS:")
-        print("• Zen 3: Much improved over Zen 2")
-        print("• Zen 4: Native DDR5 support")
-        print("• Infinity Fabric: UCLK = MCLK preferred")
-        print("• More sensitive to trace quality")
-        print()
-        print("MEMORY CONTROLLER QUALITY:")
-        print("• Silicon lottery applies to IMCs too")
-        print("• Better IMCs = higher stable frequencies")
-        print("• Voltage scaling can help weaker IMCs")
-        print("• Motherboard trace quality matters")
-        print()
-        print("GEAR MODES (Intel):")
-        print("• Gear 1: 1:1 ratio, lower latency")
-        print("• Gear 2: 1:2 ratio, higher bandwidth potential")
-        print("• Crossover point ~DDR4-3600, DDR5-5600")
-        print("• Depends on workload and timings")
-        print()
-        print("COMMAND RATE:")
-        print("• 1T: Higher performance, harder to achieve")
-        print("• 2T: More relaxed, better stability")
-        print("• Some motherboards auto-adjust")
-        print("• Can be manually forced in BIOS")
-        print()
-        print("MOTHERBOARD FACTORS:")
-        print("• Layer count: More layers = better signaling")
-        print("• Trace layout: Shorter traces preferred")
-        print("• QVL lists: Tested configurations")
-        print("• DIMM slot count: 2 slots easier than 4")
-        print()
-        input("Press Enter to continue...")
+    def leaderboard_view(self):
+        # Best results for the installed IC on this controller, or across all hardware
+        leaderboard = read_leaderboard(self.leaderboard_file or LEADERBOARD_FILE)
+        scoped = bool(self.current_modules)
+        metric = "latency"
+        while True:
+            self.clear_screen()
+            if scoped:
+                module = self.current_modules[0]
+                scope, title = ("*", module.ic_type.value, self.controller_name), f"{module.ic_type.value} on {self.controller_name}"
+            else:
+                scope, title = ("*", "*", "*"), "all hardware"
+            print(f"═══ LEADERBOARD: BEST {metric.upper()} - {title} ═══")
+            print()
+            entries = leaderboard.top(metric, *scope, limit=10)
+            for line in format_leaderboard(entries):
+                print(line)
+            if not entries:
+                print("No stable results yet. Pass a stress test or run the auto-tuner to get on the board.")
+            print()
+            print("1. Latency  2. Frequency  3. Bandwidth" + ("  A. Toggle all hardware" if self.current_modules else ""))
+            choice = input("Select view, or press Enter to go back: ").strip().lower()
+            if choice in ("1", "2", "3"):
+                metric = list(LEADERBOARD_METRICS)[int(choice) - 1]
+            elif choice == "a" and self.current_modules:
+                scoped = not scoped
+            else:
+                break
         
-    def kb_binning(self):
+    def show_achievements(self):
         self.clear_screen()
-        print("═══ BINNING & QUALITY ASSESSMENT ═══")
-        print()
-        print("WHAT IS BINNING?")
-        print("• Manufacturers test and sort chips by quality")
-        print("• Better bins = higher performance potential")
-        print("• Reflected in XMP profiles and pricing")
-        print("• Not all chips of same IC are equal")
-        print()
-        print("IDENTIFYING GOOD BINS:")
-        print("• Low XMP voltage for given speed")
-        print("• Tight XMP timings")
-        print("• Premium kit pricing")
-        print("• Review/forum feedback")
+        print("═══ ACHIEVEMENTS ═══")
         print()
-        print("TESTING YOUR BIN:")
-        print("1. Start with loose timings at high frequency")
-        print("2. Or tight timings at moderate frequency")
-        print("3. Test voltage scaling response")
-        print("4. Compare to known good samples")
-        print()
-        print("BIN QUALITY INDICATORS:")
-        print("• Samsung B-Die examples:")
-        print("  - Golden: 3200 C14 at 1.35V")
-        print("  - Average: 3200 C16 at 1.35V")
-        print("  - Poor: 3000 C16 at 1.35V")
-        print()
-        print("• Hynix CJR examples:")
-        print("  - Good: 3600 C18 at 1.35V")
-        print("  - Average: 3200 C16 at 1.35V")
-        print("  - Poor: 3000 C16 at 1.35V")
-        print()
-        print("BIN LOTTERY TIPS:")
-        print("• Buy from retailers with good return policies")
-        print("• Check manufacturing dates (newer often better)")
-        print("• Consider buying multiple kits for best bin")
-        print("• Join overclocking communities for sample data")
+        unlocked = set(self.achievements.unlocked)
+        for achievement in self.achievements.rules.values():
+            mark = "✓" if achievement.key in unlocked else " "
+            print(f"[{mark}] {achievement.name:<20} {achievement.description}")
         print()
+        print(f"Unlocked {len(unlocked)} of {len(self.achievements.rules)}")
+        if self.records:
+            print("Frequency records: " + " | ".join(f"{kind} {speed} MHz" for kind, speed in sorted(self.records.items())))
         input("Press Enter to continue...")
         
-    def kb_advanced_techniques(self):
-        self.clear_screen()
-        print("═══ ADVANCED OVERCLOCKING TECHNIQUES ═══")
-        print()
-        print("RTL/IOL TUNING:")
-        print("• Round Trip Latency / I/O Latency")
-        print("• Fine-tunes memory controller timing")
-        print("• Can improve performance by 2-5%")
-        print("• Requires careful testing")
-        print()
-        print("POWERDOWN MODES:")
-        print("• Fast vs Slow exit modes")
-        print("• Affects idle power and response")
-        print("• Can impact stability")
-        print("• Usually auto-managed by BIOS")
-        print()
-        print("TRAINING ALGORITHMS:")
-        print("• Memory controller learns optimal settings")
-        print("• Can be overridden manually")
-        print("• ASUS: MaxxMEM, MSI: Memory Try It!")
-        print("• Understanding helps with troubleshooting")
-        print()
-        print("SKEW CONTROL:")
-        print("• Adjusts signal timing per bit")
-        print("• Helps with high-frequency stability")
-        print("• Usually automatic")
-        print("• Manual tuning for extreme overclocks")
-        print()
-        print("BUILDZOID'S ADVANCED TIPS:")
-        print("• 'Subtimings matter more than you think'")
-        print("• 'Every IC has its own personality'")
-        print("• 'Stability testing is never finished'")
-        print("• 'Document everything - memory is finicky'")
-        print()
-        print("EXTREME OVERCLOCKING:")
-        print("• LN2 cooling for competitions")
-        print("• Single-stick vs dual-stick tradeoffs")
-        print("• Cold boot bugs and workarounds")
-        print("• Validation software choices")
-        print()
-        input("Press Enter to continue...")
+    def settings_menu(self):
+        while True:
+            self.clear_screen()
+            print("═══ SETTINGS ═══")
+            print()
+            print(f"1. Random seed: {self.rng.seed}")
+            print(f"2. Profiling: {'ON' if TRACER.enabled else 'OFF'} (timing spans, written to {PROFILE_TRACE_FILE})")
+            print("3. Back")
+            choice = input("\nSelect option: ").strip()
+            
+            if choice == "1":
+                print("The same seed replays the same stress test errors and measurements.")
+                value = input("Enter seed (blank for a new random seed): ").strip()
+                try:
+                    self.set_seed(int(value) if value else None)
+                except ValueError:
+                    print("Invalid seed!")
+                    input("Press Enter to continue...")
+            elif choice == "2":
+                if not TRACER.enabled:
+                    TRACER.enable()
+                    print("Profiling on. Turn it off here to write the trace and see the summary.")
+                else:
+                    TRACER.disable()
+                    TRACER.write_chrome_trace(PROFILE_TRACE_FILE)
+                    print()
+                    for line in TRACER.format_summary():
+                        print(line)
+                    print(f"\nTrace of {len(TRACER.events)} spans written to {PROFILE_TRACE_FILE}")
+                    TRACER.events.clear()
+                input("Press Enter to continue...")
+            elif choice == "3":
+                break
+
+class Tracer:
+    # Opt-in timing spans around the calls listed in PROFILED_CALLS. Enabling
+    # swaps each one for a timing wrapper and disabling puts the original back,
+    # so with profiling off the code runs unmodified and the hooks cost nothing.
+    def __init__(self):
+        self.events: List[tuple] = []  # (name, category, start, duration, thread)
+        self.originals: List[tuple] = []
+        self.epoch = time.perf_counter()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.originals)
+
+    def wrap(self, name: str, category: str, function):
+        events, clock, thread = self.events, time.perf_counter, threading.get_ident
+
+        @functools.wraps(function)
+        def traced(*args, **kwargs):
+            started = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                events.append((name, category, started, clock() - started, thread()))
+        return traced
+
+    def enable(self):
+        if self.enabled:
+            return
+        module = sys.modules[__name__]
+        for category, holder, names in PROFILED_CALLS:
+            target = module if holder is None else holder
+            for name in names:
+                original = vars(target)[name]
+                label = name if holder is None else f"{holder.__name__}.{name}"
+                self.originals.append((target, name, original))
+                setattr(target, name, self.wrap(label, category, original))
+
+    def disable(self):
+        for target, name, original in reversed(self.originals):
+            setattr(target, name, original)
+        self.originals = []
+
+    def write_chrome_trace(self, path: str):
+        # Complete ("X") events in microseconds, loadable in chrome://tracing or Perfetto
+        pid = os.getpid()
+        events = [{"name": name, "cat": category, "ph": "X", "ts": round((start - self.epoch) * 1e6, 3),
+                   "dur": round(duration * 1e6, 3), "pid": pid, "tid": thread}
+                  for name, category, start, duration, thread in self.events]
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        os.replace(tmp_path, path)
+
+    def summary(self) -> List[Tuple[str, int, float, float, float]]:
+        # (name, calls, total s, self s, max s) per function, by total time. Self
+        # time leaves out the spans nested inside each call on the same thread.
+        totals: Dict[str, List[float]] = {}
+        stacks: Dict[int, List[list]] = {}
+        for name, _, start, duration, thread in sorted(self.events, key=lambda e: (e[4], e[2], -e[3])):
+            stack = stacks.setdefault(thread, [])
+            while stack and start >= stack[-1][1]:
+                stack.pop()
+            if stack:
+                totals[stack[-1][0]][2] -= duration
+            entry = totals.setdefault(name, [0, 0.0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += duration
+            entry[2] += duration
+            entry[3] = max(entry[3], duration)
+            stack.append([name, start + duration])
+        return sorted(((name, int(calls), total, own, longest) for name, (calls, total, own, longest) in totals.items()),
+                      key=lambda row: row[2], reverse=True)
+
+    def format_summary(self, limit: int = 25) -> List[str]:
+        lines = [f"{'Function':<44} {'Calls':>8} {'Total ms':>10} {'Self ms':>10} {'Mean us':>10} {'Max ms':>9}"]
+        for name, calls, total, own, longest in self.summary()[:limit]:
+            lines.append(f"{name[:44]:<44} {calls:>8} {total * 1e3:>10.2f} {own * 1e3:>10.2f} "
+                         f"{total / calls * 1e6:>10.1f} {longest * 1e3:>9.2f}")
+        return lines
+
+# (category, class or None for module functions, names) for each traced entry point
+PROFILED_CALLS = (
+    ("menu", RAMOverclockGame, ("new_game", "memory_overview", "overclocking_lab", "checkpoints_menu",
+                                "adjust_frequency", "adjust_primary_timings", "adjust_voltage", "profiles_menu",
+                                "apply_xmp_profile", "reset_to_jedec", "quick_stability_test",
+                                "stability_heatmap_view", "sensitivity_view", "adjust_memory_controller",
+                                "memory_benchmark", "adjust_secondary_timings", "auto_overclock_assistant",
+                                "stress_testing_menu", "custom_stress_test", "view_test_history",
+                                "temperature_monitor", "export_telemetry", "add_case_fans", "adjust_ambient_temp",
+                                "live_temp_graph", "live_dashboard", "knowledge_base", "search_knowledge_base",
+                                "compare_all_hardware", "leaderboard_view", "show_achievements", "settings_menu")),
+    ("stress", RAMOverclockGame, ("run_stress_test",)),
+    ("stress", StressTestRun, ("step",)),
+    ("io", RAMOverclockGame, ("save_game", "load_game", "load_game_data")),
+    ("thermal", RAMOverclockGame, ("update_thermals",)),
+    ("thermal", ThermalModel, ("integrate", "steady_state")),
+    ("stability", RAMOverclockGame, ("refresh_stability",)),
+    ("stability", StabilityEngine, ("evaluate",)),
+    ("stability", None, ("score_batch", "evaluate_configs", "sensitivity_analysis")),
+    ("stability", StabilityHeatmap, ("grid",)),
+    ("search", AutoTuner, ("run", "step")),
+    ("search", IslandTuner, ("run", "evolve")),
+    ("search", None, ("compare_hardware",)),
+)
+TRACER = Tracer()
+# Where the settings toggle writes its trace
+PROFILE_TRACE_FILE = "ramtimings-trace.json"
+
+# Cold start budget for one `evaluate` process, spawned per job by batch runners
+STARTUP_BUDGET_MS = 500
+
+def cmd_kb_search(args) -> int:
+    query = " ".join(args.query)
+    results = knowledge_index().search(query, args.limit)
+    for line in format_kb_results(query, results):
+        print(line)
+    if not results:
+        print("No matches found.")
+    return 0
+
+SWEEP_CHUNK = 4096  # Configs per checkpointed unit of a large batch
+
+def evaluate_chunk(job: Tuple[List[Dict[str, object]], bool]) -> List[Dict[str, object]]:
+    # One unit of a sweep. Its stable results reach the leaderboard before the
+    # unit is checkpointed; a unit run twice offers the same entries again,
+    # which the leaderboard ignores.
+    configs, record = job
+    leaderboard = Leaderboard() if record else None
+    results = evaluate_configs(configs, leaderboard)
+    if leaderboard is not None:
+        update_leaderboard(leaderboard.live_entries())
+    return results
+
+def cmd_evaluate(args) -> int:
+    if args.batch:
+        try:
+            source = sys.stdin if args.batch == "-" else open(args.batch)
+            with source:
+                configs = [json.loads(line) for line in source if line.strip()]
+        except (OSError, ValueError) as e:
+            print(f"Invalid batch: {e}", file=sys.stderr)
+            return 2
+    else:
+        configs = [{key: value for key, value in {
+            "kit": args.kit, "controller": args.controller, "speed": args.speed, "timings": args.timings,
+            "voltage": args.voltage, "ambient": args.ambient, "cooling": args.cooling, "load": args.load,
+        }.items() if value is not None}]
+    chunks = [configs[i:i + SWEEP_CHUNK] for i in range(0, len(configs), SWEEP_CHUNK)]
+    checkpoint = None
+    if len(chunks) > 1:
+        digest = hashlib.sha1(json.dumps(configs, sort_keys=True).encode()).hexdigest()
+        checkpoint = Checkpoint("evaluate", [digest, args.leaderboard], resume=not args.restart)
+        if checkpoint.resumed:
+            print(f"Resuming: {len(checkpoint.done)} of {len(chunks)} chunks already done", file=sys.stderr)
+    try:
+        chunk_results = run_pool("evaluate", evaluate_chunk, [(chunk, args.leaderboard) for chunk in chunks], 1,
+                                 checkpoint=checkpoint)
+    except (ValueError, KeyError) as e:
+        print(f"Invalid configuration: {e}", file=sys.stderr)
+        return 2
+    if checkpoint:
+        checkpoint.complete()
+    for results in chunk_results:
+        for result in results:
+            print(json.dumps(result))
+    return 0
+
+def cmd_sensitivity(args) -> int:
+    config = {key: value for key, value in {
+        "kit": args.kit, "controller": args.controller, "speed": args.speed, "timings": args.timings,
+        "voltage": args.voltage, "ambient": args.ambient, "cooling": args.cooling, "load": args.load,
+    }.items() if value is not None}
+    try:
+        module, _, controller = configure(config)
+    except (ValueError, KeyError) as e:
+        print(f"Invalid configuration: {e}", file=sys.stderr)
+        return 2
+    thermal = ThermalModel()
+    results = sensitivity_analysis(stability_inputs(module, controller), float(config.get("ambient", 25.0)),
+                                   thermal.resistance(config.get("cooling", "Stock")),
+                                   load_activity(config.get("load", "heavy")))
+    for result in results:
+        print(json.dumps(result))
+    return 0
+
+def fleet_stress_run(job: Tuple[Dict[str, object], str, int, int]) -> Dict[str, object]:
+    # One stress test on a fresh dual-channel system. Its streams are named by the
+    # run index rather than the worker, so a fleet gives the same results however
+    # it is split across processes.
+    config, test, seed, index = job
+    test_name, duration, intensity = LiveDashboard.TESTS[test]
+    module, _, controller = configure(dict(config, load="idle"))
+    game = RAMOverclockGame(RandomStreams(seed, ("fleet", index)), headless=True)  # Passes are recorded in the parent
+    game.current_modules = [module, module]
+    game.memory_controller = controller
+    game.ambient_temperature = float(config.get("ambient", 25.0))
+    game.cooling_solution = config.get("cooling", "Stock")
+    game.update_thermals(dt=float("inf"))
+    run = StressTestRun(game, test_name, duration, intensity)
+    peak = module.temperature
+    while not run.done:
+        run.step()
+        peak = max(peak, module.temperature)
+    return {"run": index, "test": test_name, "result": run.finish(), "errors": run.errors_found,
+            "errors_per_dimm": run.errors_per_dimm, "max_temperature": round(peak, 2)}
+
+def cmd_stress(args) -> int:
+    config = {key: value for key, value in {
+        "kit": args.kit, "controller": args.controller, "speed": args.speed, "timings": args.timings,
+        "voltage": args.voltage, "ambient": args.ambient, "cooling": args.cooling,
+    }.items() if value is not None}
+    try:
+        configure(config)
+        seed = RandomStreams(args.seed).seed
+    except (ValueError, KeyError) as e:
+        print(f"Invalid configuration: {e}", file=sys.stderr)
+        return 2
+    # A resumed fleet keeps the seed it started with, even when none was given
+    checkpoint = Checkpoint("stress", [config, args.test, args.seed, args.runs], {"seed": seed},
+                            resume=not args.restart)
+    seed = checkpoint.state["seed"]
+    if checkpoint.resumed:
+        print(f"Resuming: {len(checkpoint.done)} of {args.runs} runs already done", file=sys.stderr)
+    jobs = [(config, args.test, seed, index) for index in range(args.runs)]
+    results = run_pool("stress_fleet", fleet_stress_run, jobs, args.workers,
+                       chunksize=max(1, len(jobs) // (16 * args.workers)), checkpoint=checkpoint)
+    checkpoint.complete()
+    for result in results:
+        print(json.dumps(result))
+    if any(result["result"] == "passed" for result in results):
+        module, controller_name, controller = configure(config)
+        inputs = stability_inputs(module, controller)
+        update_leaderboard([leaderboard_entry(module, controller_name, controller, inputs,
+                                              StabilityEngine().evaluate(inputs), "fleet")])
+    outcomes = {outcome: sum(r["result"] == outcome for r in results) for outcome in ("passed", "unstable", "failed")}
+    print(f"Seed {seed}: " + " | ".join(f"{count} {outcome}" for outcome, count in outcomes.items()), file=sys.stderr)
+    return 0
+
+def find_ic(spec: str) -> MemoryIC:
+    # IC name or a case-insensitive part of it, e.g. "samsung b-die"
+    matches = [ic for ic in MemoryIC if ic.value.lower() == str(spec).lower()] or \
+              [ic for ic in MemoryIC if str(spec).lower() in ic.value.lower()]
+    if len(matches) != 1:
+        raise ValueError(f"IC '{spec}' matches {len(matches)} known ICs")
+    return matches[0]
+
+def cmd_leaderboard(args) -> int:
+    try:
+        kit = find_kit(args.kit).name if args.kit else "*"
+        ic = find_ic(args.ic).value if args.ic else "*"
+        controller = find_controller(args.controller)[0] if args.controller else "*"
+    except ValueError as e:
+        print(f"Invalid filter: {e}", file=sys.stderr)
+        return 2
+    entries = read_leaderboard().top(args.metric, kit, ic, controller, args.limit)
+    if args.json:
+        for rank, entry in enumerate(entries, 1):
+            print(json.dumps(dict(rank=rank, **entry)))
+    else:
+        for line in format_leaderboard(entries):
+            print(line)
+    return 0
+
+def cmd_compare(args) -> int:
+    try:
+        results, cached = compare_hardware(args.goal, args.min_stability, args.ambient, args.cooling,
+                                           args.workers, use_cache=not args.no_cache, resume=not args.restart)
+    except ValueError as e:
+        print(f"Invalid configuration: {e}", file=sys.stderr)
+        return 2
+    for rank, result in enumerate(results[:args.limit], 1):
+        print(json.dumps(dict(rank=rank, **result)))
+    print(f"{len(results)} combinations ({'cached' if cached else 'computed'})", file=sys.stderr)
+    return 0
+
+def cmd_import_spd(args) -> int:
+    started = time.perf_counter()
+    rows, parsed, invalid = import_spd_dumps(args.paths, args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"Parsed {parsed} dumps in {elapsed:.2f} s ({parsed / max(elapsed, 1e-9):,.0f}/s), "
+          f"skipped {invalid} invalid files")
+    if args.dry_run:
+        for row in rows:
+            print(f"  {row[0]}: {row[1]} {row[2]} | JEDEC {row[3]} {'-'.join(map(str, row[4]))} | "
+                  f"Rated {row[5]} {'-'.join(map(str, row[6]))} @ {row[7]:.2f}V | {row[8]}GB")
+        print(f"{len(rows)} distinct kits (dry run, catalog unchanged)")
+        return 0
+    added = add_imported_kits(rows) if rows else 0
+    print(f"{len(rows)} distinct kits, {added} new in {KIT_FILE}")
+    return 0
+
+def cmd_profiles(args) -> int:
+    try:
+        if args.action == "list":
+            records = read_profiles(args.library)
+            if args.kit:
+                records = records[np.char.find(np.char.lower(records["kit"]), args.kit.lower().encode()) >= 0]
+            for record in records:
+                print(f"[{record['kit'].decode(errors='replace')}] {format_profile(record)}")
+            print(f"{len(records)} profiles", file=sys.stderr)
+        elif args.action == "export":
+            # Configs use the evaluate keys plus an optional "label", so 'compare'
+            # output can be exported as it is
+            source = sys.stdin if args.batch == "-" else open(args.batch)
+            with source:
+                configs = [json.loads(line) for line in source if line.strip()]
+            results = evaluate_configs(configs)
+            records = np.zeros(len(configs), dtype=profile_dtype())
+            for i, (config, result) in enumerate(zip(configs, results)):
+                module, controller_name, controller = configure(config)
+                label = config.get("label") or controller_name
+                records[i] = profile_record(module, controller, label, result["stability"])
+            print(f"Wrote {write_profiles(args.output, records)} profiles to {args.output}", file=sys.stderr)
+        else:
+            for path in args.files:
+                count = append_profiles(args.library, read_profiles(path))
+            print(f"{args.library} now holds {count} profiles", file=sys.stderr)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Invalid profiles: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+class Columns:
+    # Struct-of-arrays table: one numpy array per field, rows appended at the
+    # end and capacity doubled as needed
+    __slots__ = ("fields", "arrays", "size")
+
+    def __init__(self, fields: Dict[str, tuple], capacity: int = 1024):
+        self.fields = fields  # name -> (dtype, per-row shape)
+        self.arrays = {name: np.zeros((capacity,) + shape, dtype) for name, (dtype, shape) in fields.items()}
+        self.size = 0
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        return self.arrays[name]
+
+    def append(self, count: int = 1) -> int:
+        # Index of the first of `count` new zeroed rows
+        start, self.size = self.size, self.size + count
+        capacity = len(next(iter(self.arrays.values())))
+        if self.size > capacity:
+            capacity = max(self.size, 2 * capacity)
+            for name, array in self.arrays.items():
+                grown = np.zeros((capacity,) + array.shape[1:], array.dtype)
+                grown[:start] = array[:start]
+                self.arrays[name] = grown
+        return start
+
+    def dtype(self) -> "np.dtype":
+        # One row as a record, the form rows take on disk
+        return np.dtype([(name, dtype, shape) for name, (dtype, shape) in self.fields.items()])
+
+    def records(self, rows) -> "np.ndarray":
+        records = np.empty(len(rows), self.dtype())
+        for name, array in self.arrays.items():
+            records[name] = array[rows]
+        return records
+
+# Evicted sessions: a header and the session's settings history as fixed-size records
+SESSION_DIR = os.path.join(os.environ.get("XDG_STATE_HOME", os.path.join(os.path.expanduser("~"), ".local", "state")),
+                           "ramtimings", "sessions")
+SESSION_MAGIC = b"RTSS"
+SESSION_VERSION = 1
+SESSION_HEADER = struct.Struct("<4sHhhBxfiiI")  # Magic, version, kit, controller, cooling, ambient, head, tip, count
+SESSION_STATE_FIELDS = {  # Encoded as in profile records: millivolts, 0 for an Auto secondary
+    "speed": ("<u2", ()), "timings": ("<u2", (4,)), "secondaries": ("<u2", (len(SECONDARY_TIMING_NAMES),)),
+    "voltage_mv": ("<u2", ()), "command_rate": ("u1", ()), "gear": ("u1", ()),
+    "vccio_offset_mv": ("<i2", ()), "vccsa_offset_mv": ("<i2", ()),
+    "parent": ("<i4", ()), "depth": ("<i4", ()),
+}
+SESSION_IDLE_TIMEOUT = 900.0
+# Settings a session request may carry (see configure). The kit and controller
+# are fixed when the session is created; other hardware means a new session.
+SESSION_SETTINGS = ("speed", "timings", "secondaries", "voltage", "command_rate", "gear", "vccio", "vccsa")
+SESSION_AMBIENT_RANGE = (15.0, 35.0)  # °C, as the game's ambient setting allows
+
+class SessionManager:
+    # Game state for many players in one process. A session is a row of small
+    # columns (hardware, environment, history pointers, last activity) and its
+    # settings are rows of a shared state journal: every change appends a row
+    # whose parent is the previous one, so undo and redo just move the
+    # session's head between its rows. Sessions idle for `idle_timeout`
+    # seconds are written to disk with their history and dropped from memory;
+    # the next request for one reads it back. Journal rows of evicted, closed
+    # or overwritten history are reclaimed by compaction.
+    __slots__ = ("sessions", "states", "ids", "slot_ids", "free", "directory", "idle_timeout",
+                 "garbage", "swept", "cooling_names", "scored")
+
+    def __init__(self, directory: str = SESSION_DIR, idle_timeout: float = SESSION_IDLE_TIMEOUT):
+        self.sessions = Columns({
+            "kit": ("<i2", ()), "controller": ("<i2", ()), "cooling": ("u1", ()), "ambient": ("<f4", ()),
+            "head": ("<i4", ()), "tip": ("<i4", ()), "last_active": ("<f8", ()), "active": ("?", ()),
+        })
+        self.states = Columns(SESSION_STATE_FIELDS, capacity=4096)
+        self.ids: Dict[str, int] = {}  # Session id -> slot, for sessions in memory
+        self.slot_ids: List[Optional[str]] = []
+        self.free: List[int] = []
+        self.directory = directory
+        self.idle_timeout = idle_timeout
+        self.garbage = 0  # Journal rows no session can reach any more
+        self.swept = time.monotonic()
+        self.cooling_names = sorted(ThermalModel.COOLING_RESISTANCE)
+        self.scored: Optional[tuple] = None  # (settings, evaluation) last scored, for the response
+
+    def path(self, session_id: str) -> str:
+        return os.path.join(self.directory, session_id + ".rts")
+
+    def slot(self, session_id: str) -> int:
+        # Slot of a session, reading it back from disk if it was evicted
+        slot = self.ids.get(session_id)
+        if slot is None:
+            if not re.fullmatch(r"[0-9a-f]{16}", session_id or ""):
+                raise KeyError(session_id)
+            slot = self.rehydrate(session_id)
+        self.sessions["last_active"][slot] = time.monotonic()
+        return slot
+
+    def allocate(self, session_id: str) -> int:
+        slot = self.free.pop() if self.free else self.sessions.append()
+        if slot == len(self.slot_ids):
+            self.slot_ids.append(None)
+        self.slot_ids[slot] = session_id
+        self.ids[session_id] = slot
+        self.sessions["active"][slot] = True
+        self.sessions["last_active"][slot] = time.monotonic()
+        return slot
+
+    def release(self, slot: int):
+        tip = self.sessions["tip"][slot]
+        self.garbage += int(self.states["depth"][tip]) + 1
+        del self.ids[self.slot_ids[slot]]
+        self.slot_ids[slot] = None
+        self.sessions["active"][slot] = False
+        self.free.append(slot)
+
+    def append_state(self, config: Dict[str, object], parent: int, hardware: Tuple[int, int],
+                     ambient: float, cooling: int) -> int:
+        # The config must configure, fit a record and score, as it will be stored,
+        # before it gets a row
+        try:
+            module, _, controller = configure(config)
+            record = profile_record(module, controller, "", 0.0)
+            settings = self.settings(record, *hardware, ambient, cooling)
+            self.scored = (settings, evaluate_configs([settings])[0])
+        except KeyError as e:
+            raise ValueError(f"unknown setting {e}") from None
+        except (ArithmeticError, AttributeError) as e:
+            raise ValueError(f"invalid settings: {e}") from None
+        row = self.states.append()
+        for name in SESSION_STATE_FIELDS:
+            if name not in ("parent", "depth"):
+                self.states[name][row] = record[name]
+        self.states["parent"][row] = parent
+        self.states["depth"][row] = self.states["depth"][parent] + 1 if parent >= 0 else 0
+        return row
+
+    def hardware(self, config: Dict[str, object]) -> Tuple[int, int]:
+        # Catalog positions of the kit and controller a config names
+        kit, controller = find_kit(config.get("kit", 1)), find_controller(config.get("controller", 1))[0]
+        return ([k.name for k in kit_catalog()].index(kit.name),
+                [name for name, _ in controller_catalog()].index(controller))
+
+    def environment(self, changes: Dict[str, object]) -> Dict[str, object]:
+        # Validated ambient and cooling from a request, for whichever of them it sets
+        environment = {}
+        if "ambient" in changes:
+            ambient = float(changes["ambient"])
+            low, high = SESSION_AMBIENT_RANGE
+            if not low <= ambient <= high:
+                raise ValueError(f"Ambient must be {low:g}-{high:g}°C")
+            environment["ambient"] = ambient
+        if "cooling" in changes:
+            if changes["cooling"] not in self.cooling_names:
+                raise ValueError(f"Unknown cooling: {changes['cooling']}")
+            environment["cooling"] = self.cooling_names.index(changes["cooling"])
+        return environment
+
+    def check_keys(self, changes: Dict[str, object], allowed: tuple):
+        unknown = sorted(set(changes) - set(allowed))
+        if unknown:
+            raise ValueError(f"Unknown setting: {', '.join(map(str, unknown))}")
+
+    def create(self, config: Dict[str, object]) -> str:
+        self.check_keys(config, SESSION_SETTINGS + ("kit", "controller", "ambient", "cooling"))
+        kit, controller = self.hardware(config)
+        environment = dict({"ambient": 25.0, "cooling": self.cooling_names.index("Stock")}, **self.environment(config))
+        head = self.append_state(config, -1, (kit, controller), environment["ambient"], environment["cooling"])
+        session_id = os.urandom(8).hex()
+        slot = self.allocate(session_id)
+        self.sessions["kit"][slot], self.sessions["controller"][slot] = kit, controller
+        self.sessions["cooling"][slot] = environment["cooling"]
+        self.sessions["ambient"][slot] = environment["ambient"]
+        self.sessions["head"][slot] = self.sessions["tip"][slot] = head
+        SESSION_EVENTS.labels("created").inc()
+        return session_id
+
+    def settings(self, state, kit: int, controller: int, ambient: float, cooling: int) -> Dict[str, object]:
+        # A journal row (or a record of one) with the session's hardware and
+        # environment, in the form configure() takes
+        _, model = controller_catalog()[controller]
+        return {
+            "kit": int(kit) + 1,
+            "controller": int(controller) + 1,
+            "speed": int(state["speed"]),
+            "timings": state["timings"].tolist(),
+            "secondaries": {name: value for name, value in zip(SECONDARY_TIMING_NAMES, state["secondaries"].tolist())
+                            if value},
+            "voltage": int(state["voltage_mv"]) / 1000,
+            "command_rate": int(state["command_rate"]),
+            "gear": int(state["gear"]),
+            "vccio": round(model.stock_vccio + int(state["vccio_offset_mv"]) / 1000, 3),
+            "vccsa": round(model.stock_vccsa + int(state["vccsa_offset_mv"]) / 1000, 3),
+            "ambient": round(float(np.float32(ambient)), 1),
+            "cooling": self.cooling_names[cooling],
+        }
+
+    def config(self, session_id: str) -> Dict[str, object]:
+        # The session's current settings
+        slot = self.slot(session_id)
+        sessions = self.sessions
+        return self.settings(self.states.records([sessions["head"][slot]])[0], sessions["kit"][slot],
+                             sessions["controller"][slot], sessions["ambient"][slot], sessions["cooling"][slot])
+
+    def score(self, session_id: str) -> Tuple[Dict[str, object], Dict[str, object]]:
+        # The session's settings and their evaluation, reusing the one done when they were stored
+        config = self.config(session_id)
+        if self.scored is None or self.scored[0] != config:
+            self.scored = (config, evaluate_configs([config])[0])
+        return self.scored
+
+    def update(self, session_id: str, changes: Dict[str, object]):
+        # Settings changes become a new history step, dropping anything that could
+        # be redone. Everything is validated before the session is touched.
+        slot = self.slot(session_id)
+        if "kit" in changes or "controller" in changes:
+            raise ValueError("the kit and controller are fixed for a session; start a new one")
+        self.check_keys(changes, SESSION_SETTINGS + ("ambient", "cooling", "session"))
+        environment = self.environment(changes)
+        settings = {key: changes[key] for key in SESSION_SETTINGS if key in changes}
+        if settings:
+            head, tip = self.sessions["head"][slot], self.sessions["tip"][slot]
+            candidate = dict(self.config(session_id), **settings)
+            candidate.update((key, changes[key]) for key in environment)
+            row = self.append_state(candidate, head, (self.sessions["kit"][slot], self.sessions["controller"][slot]),
+                                    environment.get("ambient", self.sessions["ambient"][slot]),
+                                    environment.get("cooling", self.sessions["cooling"][slot]))
+            self.garbage += int(self.states["depth"][tip] - self.states["depth"][head])
+            self.sessions["head"][slot] = self.sessions["tip"][slot] = row
+        for key, value in environment.items():
+            self.sessions[key][slot] = value
+
+    def undo(self, session_id: str) -> bool:
+        slot = self.slot(session_id)
+        parent = self.states["parent"][self.sessions["head"][slot]]
+        if parent < 0:
+            return False
+        self.sessions["head"][slot] = parent
+        return True
+
+    def redo(self, session_id: str) -> bool:
+        # The step after the head is the one on the path down from the tip
+        slot = self.slot(session_id)
+        head, row = self.sessions["head"][slot], self.sessions["tip"][slot]
+        if row == head:
+            return False
+        parents = self.states["parent"]
+        while parents[row] != head:
+            row = parents[row]
+        self.sessions["head"][slot] = row
+        return True
+
+    def close(self, session_id: str):
+        slot = self.slot(session_id)
+        self.release(slot)
+        try:
+            os.remove(self.path(session_id))
+        except OSError:
+            pass
+        SESSION_EVENTS.labels("closed").inc()
+        self.maybe_compact()
+
+    def chain(self, slot: int) -> List[int]:
+        # Journal rows of a session's history, oldest first
+        rows, row = [], self.sessions["tip"][slot]
+        parents = self.states["parent"]
+        while row >= 0:
+            rows.append(int(row))
+            row = parents[row]
+        return rows[::-1]
+
+    def evict(self, slot: int):
+        session_id, sessions = self.slot_ids[slot], self.sessions
+        rows = self.chain(slot)
+        records = self.states.records(rows)
+        records["parent"] = np.arange(len(rows)) - 1  # Positions within the file
+        header = SESSION_HEADER.pack(SESSION_MAGIC, SESSION_VERSION, sessions["kit"][slot], sessions["controller"][slot],
+                                     sessions["cooling"][slot], sessions["ambient"][slot],
+                                     rows.index(sessions["head"][slot]), len(rows) - 1, len(rows))
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(session_id)
+        with open(path + ".tmp", "wb") as f:
+            f.write(header)
+            f.write(records.tobytes())
+        os.replace(path + ".tmp", path)
+        self.release(slot)
+        SESSION_EVENTS.labels("evicted").inc()
+
+    def rehydrate(self, session_id: str) -> int:
+        try:
+            with open(self.path(session_id), "rb") as f:
+                data = f.read()
+        except OSError:
+            raise KeyError(session_id) from None
+        magic, version, kit, controller, cooling, ambient, head, tip, count = SESSION_HEADER.unpack_from(data)
+        if magic != SESSION_MAGIC or version != SESSION_VERSION:
+            raise KeyError(session_id)
+        records = np.frombuffer(data, self.states.dtype(), count, SESSION_HEADER.size)
+        start = self.states.append(count)
+        for name in SESSION_STATE_FIELDS:
+            self.states[name][start:start + count] = records[name]
+        self.states["parent"][start + 1:start + count] += start
+        slot = self.allocate(session_id)
+        sessions = self.sessions
+        sessions["kit"][slot], sessions["controller"][slot], sessions["cooling"][slot] = kit, controller, cooling
+        sessions["ambient"][slot] = ambient
+        sessions["head"][slot], sessions["tip"][slot] = start + head, start + tip
+        os.remove(self.path(session_id))  # Memory holds the only copy again
+        SESSION_EVENTS.labels("rehydrated").inc()
+        return slot
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        now = time.monotonic() if now is None else now
+        size = self.sessions.size
+        idle = np.flatnonzero(self.sessions["active"][:size] &
+                              (self.sessions["last_active"][:size] < now - self.idle_timeout))
+        for slot in idle.tolist():
+            self.evict(slot)
+        self.swept = now
+        self.maybe_compact()
+        return len(idle)
+
+    def maybe_evict(self):
+        # Called on each request; sweeps for idle sessions a few times per timeout
+        if time.monotonic() - self.swept > self.idle_timeout / 4:
+            self.evict_idle()
+
+    def maybe_compact(self):
+        if self.garbage > max(4096, self.states.size // 2):
+            self.compact()
+
+    def compact(self):
+        # Rebuild the journal from the rows live sessions can still reach
+        slots = [slot for slot, session_id in enumerate(self.slot_ids) if session_id is not None]
+        chains = [self.chain(slot) for slot in slots]
+        keep = np.array([row for rows in chains for row in rows], dtype=np.int64)
+        remap = np.full(self.states.size + 1, -1, dtype=np.int64)  # Index -1 maps a root's parent to -1
+        remap[keep] = np.arange(len(keep))
+        states = Columns(SESSION_STATE_FIELDS, capacity=max(4096, 2 * len(keep)))
+        states.append(len(keep))
+        for name in SESSION_STATE_FIELDS:
+            states[name][:len(keep)] = self.states[name][keep]
+        states["parent"][:len(keep)] = remap[self.states["parent"][keep]]
+        for slot in slots:
+            for column in ("head", "tip"):
+                self.sessions[column][slot] = remap[self.sessions[column][slot]]
+        self.states = states
+        self.garbage = 0
+
+    def stats(self) -> Dict[str, int]:
+        try:
+            evicted = sum(name.endswith(".rts") for name in os.listdir(self.directory))
+        except OSError:
+            evicted = 0
+        return {"active": len(self.ids), "evicted": evicted, "journal_rows": self.states.size}
+
+# The service's sessions; set up by `serve`
+_session_manager: Optional[SessionManager] = None
+SESSION_LOCK = threading.Lock()
+
+def session_manager() -> SessionManager:
+    global _session_manager
+    if _session_manager is None:
+        _session_manager = SessionManager()
+    return _session_manager
+
+def service_metrics(body: bytes) -> Tuple[int, str, str]:
+    if _session_manager is not None:
+        with SESSION_LOCK:
+            stats = _session_manager.stats()
+        SESSIONS.labels("active").set(stats["active"])
+        SESSIONS.labels("evicted").set(stats["evicted"])
+    return 200, "text/plain; version=0.0.4", METRICS.render()
+
+def service_evaluate(body: bytes) -> Tuple[int, str, str]:
+    # JSON-lines configs in, JSON-lines results out, as with `evaluate --batch`
+    try:
+        configs = [json.loads(line) for line in body.decode().splitlines() if line.strip()]
+        if not all(isinstance(config, dict) for config in configs):
+            raise ValueError("each line must be a JSON object")
+        results = evaluate_configs(configs)
+    except (ValueError, KeyError, TypeError) as e:
+        return 400, "text/plain", f"Invalid configuration: {e}\n"
+    return 200, "application/x-ndjson", "".join(json.dumps(result) + "\n" for result in results)
+
+def session_response(session_id: str) -> Tuple[int, str, str]:
+    # The session's settings and how they score
+    config, result = session_manager().score(session_id)
+    return 200, "application/json", json.dumps(dict(result, session=session_id, settings=config)) + "\n"
+
+def session_route(action):
+    # JSON object in, the session's settings and score out. Sessions share the
+    # manager's arrays, so requests take turns on one lock.
+    def route(body: bytes) -> Tuple[int, str, str]:
+        try:
+            request = json.loads(body or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("expected a JSON object")
+            with SESSION_LOCK:
+                manager = session_manager()
+                manager.maybe_evict()
+                session_id = action(manager, request)
+                if session_id is None:
+                    return 200, "application/json", "{}\n"
+                return session_response(session_id)
+        except KeyError as e:
+            return 404, "text/plain", f"Unknown session {e}\n"
+        except (ValueError, TypeError, ArithmeticError, AttributeError) as e:
+            return 400, "text/plain", f"Invalid request: {e}\n"
+    return route
+
+def requested_session(request: dict) -> str:
+    session_id = request.get("session")
+    if not isinstance(session_id, str):
+        raise ValueError("no session given")
+    return session_id
+
+def session_new(manager: SessionManager, request: dict) -> str:
+    return manager.create(request)
+
+def session_get(manager: SessionManager, request: dict) -> str:
+    return requested_session(request)
+
+def session_update(manager: SessionManager, request: dict) -> str:
+    manager.update(requested_session(request), request)
+    return request["session"]
+
+def session_undo(manager: SessionManager, request: dict) -> str:
+    manager.undo(requested_session(request))
+    return request["session"]
+
+def session_redo(manager: SessionManager, request: dict) -> str:
+    manager.redo(requested_session(request))
+    return request["session"]
+
+def session_close(manager: SessionManager, request: dict) -> None:
+    manager.close(requested_session(request))
+
+# (method, path) -> handler(request body) returning (status, content type, body)
+SERVICE_ROUTES = {
+    ("GET", "/metrics"): service_metrics,
+    ("POST", "/evaluate"): service_evaluate,
+    ("POST", "/session/new"): session_route(session_new),
+    ("POST", "/session/get"): session_route(session_get),
+    ("POST", "/session/update"): session_route(session_update),
+    ("POST", "/session/undo"): session_route(session_undo),
+    ("POST", "/session/redo"): session_route(session_redo),
+    ("POST", "/session/close"): session_route(session_close),
+}
+
+def cmd_serve(args) -> int:
+    global _session_manager
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+    _session_manager = SessionManager(args.session_dir, args.session_timeout)
+    
+    class Handler(BaseHTTPRequestHandler):
+        def handle_route(self, method: str):
+            path = self.path.split("?", 1)[0]
+            route = SERVICE_ROUTES.get((method, path))
+            if route is None:
+                code, content_type, body = 404, "text/plain", "Not found\n"
+            else:
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    code, content_type, body = route(self.rfile.read(length) if length else b"")
+                except Exception:
+                    # A bug in a route still gets an answer, and a count
+                    traceback.print_exc()
+                    code, content_type, body = 500, "text/plain", "Internal server error\n"
+            HTTP_REQUESTS.labels(path if route else "other", str(code)).inc()
+            data = body.encode()
+            self.send_response(code)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
         
-    def kb_troubleshooting(self):
-        self.clear_screen()
-        print("═══ TROUBLESHOOTING GUIDE ═══")
-        print()
-        print("COMMON ISSUES & SOLUTIONS:")
-        print()
-        print("WON'T POST / BOOT:")
-        print("• Clear CMOS, start with JEDEC")
-        print("• Check CPU memory controller support")
-        print("• Verify kit compatibility with motherboard")
-        print("• Try single stick to isolate bad DIMM")
-        print()
-        print("BOOTS BUT UNSTABLE:")
-        print("• Increase DRAM voltage by 0.05V")
-        print("• Loosen primary timings by 1-2")
-        print("• Check/increase VCCIO and VCCSA")
-        print("• Reduce frequency by 200MHz")
-        print()
-        print("PERFORMANCE REGRESSION:")
-        print("• Check for gear mode changes")
-        print("• Verify command rate (1T vs 2T)")
-        print("• Look for thermal throttling")
-        print("• Compare with known good settings")
-        print()
-        print("RANDOM ERRORS:")
-        print("• Usually timing-related")
-        print("• Increase tRAS, tRFC first")
-        print("• Check secondary timings")
-        print("• Test individual sticks")
-        print()
-        print("MEMORY TRAINING FAILURES:")
-        print("• Power cycle system completely")
-        print("• Update BIOS to latest version")
-        print("• Try different DIMM slots")
-        print("• Adjust PLL voltages")
-        print()
-        print("BUILDZOID'S DIAGNOSTIC APPROACH:")
-        print("1. Establish baseline (JEDEC works?)")
-        print("2. Isolate variables (change one thing)")
-        print("3. Test systematically")
-        print("4. Document everything")
-        print("5. When in doubt, add voltage")
-        print("6. If voltage doesn't help, loosen timings")
-        print()
-        input("Press Enter to continue...")
+        def do_GET(self):
+            self.handle_route("GET")
         
-    def show_achievements(self):
-        print("Achievements system will be implemented next.")
-        input("Press Enter to continue...")
+        def do_POST(self):
+            self.handle_route("POST")
         
-    def settings_menu(self):
-        print("Settings menu will be implemented next.")
-        input("Press Enter to continue...")
-
-if __name__ == "__main__":
-    game = RAMOverclockGame()
+        def log_message(self, format, *log_args):
+            if args.verbose:
+                super().log_message(format, *log_args)
+    
+    server = ThreadingHTTPServer((args.host, args.port), Handler)
+    routes = ", ".join(f"{method} {path}" for method, path in SERVICE_ROUTES)
+    print(f"Serving on http://{args.host}:{server.server_address[1]} ({routes})", flush=True)
     try:
-        game.main_menu()
+        server.serve_forever()
     except KeyboardInterrupt:
-        print("\n\nExiting game...")
-        sys.exit(0)
\ No newline at end of file
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+# Benchmarks: each one sets up its fixture and returns (operation, ops per call).
+# The operation is timed several times and the median is kept, so a result is
+# per-op latency plus the matching throughput.
+def bench_fixture() -> Tuple[MemoryModule, MemoryController, Dict[str, object]]:
+    module, _, controller = configure({"kit": 3, "controller": 1})
+    return module, controller, stability_inputs(module, controller)
+
+def bench_eval_cold():
+    _, _, inputs = bench_fixture()
+    return lambda: [StabilityEngine().evaluate(inputs) for _ in range(100)], 100
+
+def bench_eval_cached():
+    _, _, inputs = bench_fixture()
+    engine = StabilityEngine()
+    engine.evaluate(inputs)
+    return lambda: [engine.evaluate(inputs) for _ in range(10000)], 10000
+
+def bench_eval_config():
+    return lambda: [evaluate_configs([{"kit": 3, "controller": 1}]) for _ in range(20)], 20
+
+def bench_grid_score():
+    # 100k configs: frequency x CL x voltage around the fixture
+    _, _, inputs = bench_fixture()
+    speeds, cls, voltages = np.meshgrid(np.arange(3200, 4800, 16), np.arange(12, 22),
+                                        np.linspace(1.3, 1.5, 100), indexing="ij")
+    batch = {field: inputs[field] for field in BATCH_FIELDS}
+    batch.update(speed=speeds.ravel(), cl=cls.ravel(), dram_voltage=voltages.ravel(),
+                 secondaries=np.asarray(inputs["secondaries"], dtype=float))
+    return lambda: score_batch(batch), speeds.size
+
+def bench_grid_heatmap():
+    _, _, inputs = bench_fixture()
+    environment = (25.0, ThermalModel().resistance("Stock"), ThermalModel.STRESS_ACTIVITY["heavy"])
+    return lambda: StabilityHeatmap().grid(inputs, ("frequency", "cl"), environment), 1
+
+def bench_stress_sampling():
+    module, controller, _ = bench_fixture()
+    game = RAMOverclockGame(RandomStreams(0), headless=True)
+    game.current_modules, game.memory_controller = [module, module], controller
+    game.update_thermals(dt=float("inf"))
+
+    def run():
+        test = StressTestRun(game, "Benchmark", 1000, "heavy")
+        while not test.done:
+            test.step()
+    return run, 1000
+
+def bench_tune_search():
+    module, controller, inputs = bench_fixture()
+    thermal, activity = ThermalModel(), ThermalModel.STRESS_ACTIVITY["heavy"]
+    resistance = thermal.resistance("Stock")
+    temperature_fn = lambda speed, voltage: thermal.steady_state(
+        thermal.power(speed, voltage, activity, inputs["ddr5"]), 25.0, resistance)
+    return lambda: AutoTuner(inputs, temperature_fn).run(), 1
+
+def bench_tune_islands():
+    # Four islands of 48 for 20 generations, in-process so only the search is timed
+    _, _, inputs = bench_fixture()
+    environment = (25.0, ThermalModel().resistance("Stock"), ThermalModel.STRESS_ACTIVITY["heavy"])
+    run = lambda: IslandTuner(inputs, environment, generations=20, streams=RandomStreams(0)).run(workers=1)
+    return run, 20
+
+def bench_io_save_load():
+    import tempfile
+    module, controller, _ = bench_fixture()
+    game = RAMOverclockGame(headless=True)
+    game.current_modules, game.memory_controller, game.controller_name = [module, module], controller, "Benchmark"
+    for cl in range(16, 26):  # Some history and checkpoints to write out
+        module.current_timings[0] = cl
+        game.record_history()
+        game.history.checkpoint(f"CL{cl}")
+    path = os.path.join(tempfile.mkdtemp(), "savegame.json")
+
+    def run():
+        game.save_game(path)
+        game.apply_state(frozen(game.load_game_data(path)["state"]))
+    return run, 1
+
+def bench_history_record():
+    module, controller, _ = bench_fixture()
+    game = RAMOverclockGame(headless=True)
+    game.current_modules, game.memory_controller = [module, module], controller
+
+    def run():
+        game.history = SettingsHistory()
+        for step in range(1000):
+            module.current_timings[step % 4] += 1 if step % 8 < 4 else -1
+            game.history.record(game.capture_state())
+    return run, 1000
+
+def bench_events_dispatch():
+    # The engine's event mix during a long session: most events find their
+    # rules unlocked already, the rest check a rule that does not fire
+    achievements = AchievementEngine(["first_pass", "thermal_critical", "tight_cl", "over_limit"])
+
+    def run():
+        for step in range(10000):
+            achievements.emit("thermal_critical", temperature=90.0, critical=85.0)
+            achievements.emit("cl_reached", cl=16, ddr5=False)
+    return run, 20000
+
+def bench_leaderboard_insert():
+    # A sweep's worth of candidates offered to a full leaderboard
+    rng = np.random.default_rng(0)
+    kits, controllers = [kit.name for kit in kit_catalog()[:4]], [name for name, _ in controller_catalog()]
+    entries = [{"kit": kits[i % 4], "ic": f"IC {i % 4}", "controller": controllers[i % len(controllers)],
+                "speed": int(speed), "timings": [16, 18, 18, 36], "voltage": 1.35, "command_rate": 1, "gear": 1,
+                "vccio": 1.1, "vccsa": 1.2, "secondaries": [], "stability": 95.0, "latency": float(latency),
+                "bandwidth": float(bandwidth), "source": "bench"}
+               for i, (speed, latency, bandwidth) in enumerate(zip(rng.integers(3000, 4800, 20000),
+                                                                  rng.uniform(50, 80, 20000),
+                                                                  rng.uniform(40000, 60000, 20000)))]
+
+    def run():
+        leaderboard = Leaderboard()
+        for entry in entries:
+            leaderboard.insert(entry)
+    return run, len(entries)
+
+def bench_sessions_update():
+    # Settings changes spread over many resident sessions
+    import tempfile
+    manager = SessionManager(tempfile.mkdtemp())
+    sessions = [manager.create({"kit": 1 + i % 4, "controller": 1 + i % 3}) for i in range(2000)]
+
+    def run():
+        for i, session_id in enumerate(sessions):
+            manager.update(session_id, {"speed": 3200 + 100 * (i % 8)})
+            manager.undo(session_id)
+    return run, len(sessions)
+
+def bench_sessions_evict():
+    # Idle sessions moved to disk and read back
+    import tempfile
+    manager = SessionManager(tempfile.mkdtemp())
+    sessions = [manager.create({"kit": 1 + i % 4}) for i in range(2000)]
+    for session_id in sessions:
+        manager.update(session_id, {"voltage": 1.4})
+
+    def run():
+        manager.evict_idle(float("inf"))
+        for session_id in sessions:
+            manager.slot(session_id)
+    return run, len(sessions)
+
+def bench_history_undo_redo():
+    history = SettingsHistory()
+    for step in range(1000):
+        history.record(((step, step % 7), (1, 1)))
+
+    def run():
+        while history.undo() is not None:
+            pass
+        while history.redo() is not None:
+            pass
+    return run, 2000
+
+BENCHMARKS = {
+    "eval.cold": bench_eval_cold,
+    "eval.cached": bench_eval_cached,
+    "eval.config": bench_eval_config,
+    "grid.score": bench_grid_score,
+    "grid.heatmap": bench_grid_heatmap,
+    "stress.sampling": bench_stress_sampling,
+    "tune.search": bench_tune_search,
+    "tune.islands": bench_tune_islands,
+    "io.save_load": bench_io_save_load,
+    "history.record": bench_history_record,
+    "history.undo_redo": bench_history_undo_redo,
+    "events.dispatch": bench_events_dispatch,
+    "leaderboard.insert": bench_leaderboard_insert,
+    "sessions.update": bench_sessions_update,
+    "sessions.evict": bench_sessions_evict,
+}
+BENCH_SUITES = sorted({name.split(".")[0] for name in BENCHMARKS} | {"startup"})
+
+def run_benchmark(name: str, repeats: int) -> Dict[str, float]:
+    import statistics
+    operation, ops = BENCHMARKS[name]()
+    operation()  # Warm-up
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        operation()
+        times.append(time.perf_counter() - started)
+    median = statistics.median(times)
+    return {"ops": ops, "repeats": repeats, "seconds_per_op": median / ops, "ops_per_s": ops / median}
+
+def bench_startup(runs: int) -> Dict[str, float]:
+    # Cold start of one `evaluate` process, as batch runners spawn per job
+    import subprocess
+    import statistics
+    command = [sys.executable, os.path.abspath(__file__), "evaluate", "--kit", "1"]
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - started)
+    median = statistics.median(timings)
+    return {"ops": 1, "repeats": runs, "seconds_per_op": median, "ops_per_s": 1 / median,
+            "min_seconds": min(timings), "max_seconds": max(timings)}
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+def cmd_bench(args) -> int:
+    import platform
+    suites = set(args.suites or BENCH_SUITES)
+    if suites - set(BENCH_SUITES):
+        print(f"Unknown benchmark suite: {', '.join(sorted(suites - set(BENCH_SUITES)))}", file=sys.stderr)
+        return 2
+    results = {}
+    print(f"{'Benchmark':<20} {'Per op':>12} {'Throughput':>16}")
+    for name in BENCHMARKS:
+        if name.split(".")[0] in suites:
+            results[name] = run_benchmark(name, args.repeats)
+            print(f"{name:<20} {format_seconds(results[name]['seconds_per_op']):>12} "
+                  f"{results[name]['ops_per_s']:>12,.0f}/s", flush=True)
+    status = 0
+    if "startup" in suites:
+        results["startup"] = result = bench_startup(args.runs)
+        print(f"{'startup':<20} {format_seconds(result['seconds_per_op']):>12} "
+              f"(min {format_seconds(result['min_seconds'])}, max {format_seconds(result['max_seconds'])})")
+        if result["seconds_per_op"] * 1000 > args.budget_ms:
+            print(f"FAIL: median cold start exceeds the {args.budget_ms:.0f} ms budget")
+            status = 1
+        else:
+            print(f"OK: cold start within the {args.budget_ms:.0f} ms budget")
+    if args.output:
+        baseline = {"format": 1, "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+                    "machine": platform.machine(), "results": results}
+        with open(args.output, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"Results written to {args.output}")
+    return status
+
+def cmd_bench_compare(args) -> int:
+    # Flag benchmarks whose per-op time grew (throughput fell) by more than the threshold
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        with open(args.current) as f:
+            current = json.load(f)["results"]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Invalid benchmark results: {e}", file=sys.stderr)
+        return 2
+    regressions = 0
+    print(f"{'Benchmark':<20} {'Baseline':>12} {'Current':>12} {'Change':>9}")
+    for name in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[name]["seconds_per_op"], current[name]["seconds_per_op"]
+        change = (after / before - 1) * 100
+        verdict = ""
+        if change > args.threshold:
+            verdict = "  REGRESSION"
+            regressions += 1
+        elif change < -args.threshold:
+            verdict = "  improved"
+        print(f"{name:<20} {format_seconds(before):>12} {format_seconds(after):>12} {change:>+8.1f}%{verdict}")
+    for name in sorted(baseline.keys() ^ current.keys()):
+        print(f"{name:<20} only in {'baseline' if name in baseline else 'current run'}")
+    if regressions:
+        print(f"{regressions} regressions beyond {args.threshold:g}%")
+        return 1
+    print(f"No regressions beyond {args.threshold:g}%")
+    return 0
+
+def add_config_arguments(parser: argparse.ArgumentParser, load: bool = True):
+    parser.add_argument("--kit", help="Catalog index (1-20) or part of the kit name")
+    parser.add_argument("--controller", help="Catalog index (1-4) or part of the controller name")
+    parser.add_argument("--speed", type=int, help="Frequency in MHz (default: XMP)")
+    parser.add_argument("--timings", help="CL-tRCD-tRP-tRAS (default: XMP)")
+    parser.add_argument("--voltage", type=float, help="DRAM voltage (default: XMP)")
+    parser.add_argument("--ambient", type=float, help="Ambient temperature in °C (default: 25)")
+    parser.add_argument("--cooling", choices=sorted(ThermalModel.COOLING_RESISTANCE), help="Cooling solution")
+    if load:
+        parser.add_argument("--load", choices=["idle"] + list(ThermalModel.STRESS_ACTIVITY),
+                            help="Thermal load (default: heavy)")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="RAM Overclocking Simulator")
+    subcommands = parser.add_subparsers(dest="command")
+    
+    kb_search = subcommands.add_parser("kb-search", help="Search the knowledge base")
+    kb_search.add_argument("query", nargs="+", help="Keywords; end a word with * for prefix search")
+    kb_search.add_argument("--limit", type=int, default=10, help="Maximum number of results")
+    kb_search.set_defaults(handler=cmd_kb_search)
+    
+    evaluate = subcommands.add_parser("evaluate", help="Score configurations without starting the game")
+    add_config_arguments(evaluate)
+    evaluate.add_argument("--batch", metavar="FILE", help="JSON-lines file of configs using the same keys ('-' for stdin)")
+    evaluate.add_argument("--leaderboard", action="store_true",
+                          help=f"Record results with at least {LEADERBOARD_MIN_STABILITY:g}%% stability in the leaderboard")
+    evaluate.add_argument("--restart", action="store_true",
+                          help="Start a large batch over instead of resuming an interrupted run of it")
+    evaluate.set_defaults(handler=cmd_evaluate)
+    
+    sensitivity = subcommands.add_parser("sensitivity", help="Rank knobs by their effect on a configuration")
+    add_config_arguments(sensitivity)
+    sensitivity.set_defaults(handler=cmd_sensitivity)
+    
+    stress = subcommands.add_parser("stress", help="Run a fleet of simulated stress tests on one configuration")
+    add_config_arguments(stress, load=False)  # The stress test sets the load
+    stress.add_argument("--test", choices=sorted(LiveDashboard.TESTS), default="3",
+                        help="1 MemTest86, 2 Prime95 Blend, 3 AIDA64 Memory (default), 4 Y-Cruncher")
+    stress.add_argument("--runs", type=int, default=100, help="Number of systems to test")
+    # SUPPRESS keeps the top-level --seed when it is given before the subcommand instead
+    stress.add_argument("--seed", type=int, default=argparse.SUPPRESS,
+                        help="Root seed; results are identical for any --workers")
+    stress.add_argument("--workers", type=int, default=1, help="Worker processes")
+    stress.add_argument("--restart", action="store_true", help="Start over instead of resuming an interrupted run")
+    stress.set_defaults(handler=cmd_stress)
+    
+    import_spd = subcommands.add_parser("import-spd", help="Add kits from SPD EEPROM dumps to the catalog")
+    import_spd.add_argument("paths", nargs="+", help="512-byte DDR4 / 1024-byte DDR5 dump files or directories")
+    import_spd.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    import_spd.add_argument("--dry-run", action="store_true", help="List the kits without adding them")
+    import_spd.set_defaults(handler=cmd_import_spd)
+    
+    profiles = subcommands.add_parser("profiles", help="Manage binary profile libraries")
+    profile_actions = profiles.add_subparsers(dest="action", required=True)
+    profiles_list = profile_actions.add_parser("list", help="List the profiles in a library")
+    profiles_list.add_argument("library", nargs="?", default=PROFILE_FILE, help="Library file (default: yours)")
+    profiles_list.add_argument("--kit", help="Only profiles for kits whose name contains this")
+    profiles_export = profile_actions.add_parser("export", help="Write configurations as a new library")
+    profiles_export.add_argument("output", help="Library file to create")
+    profiles_export.add_argument("--batch", required=True, metavar="FILE",
+                                 help="JSON-lines configs as for evaluate, e.g. compare output ('-' for stdin)")
+    profiles_import = profile_actions.add_parser("import", help="Append libraries to yours")
+    profiles_import.add_argument("files", nargs="+", help="Library files to import")
+    profiles_import.add_argument("--library", default=PROFILE_FILE, help="Library to append to (default: yours)")
+    profiles.set_defaults(handler=cmd_profiles)
+    
+    compare = subcommands.add_parser("compare", help="Auto-tune every kit on every controller and rank them")
+    compare.add_argument("--goal", choices=AutoTuner.GOALS, default="latency", help="Ranking goal (default: latency)")
+    compare.add_argument("--min-stability", type=float, default=90.0, help="Stability target under heavy load")
+    compare.add_argument("--ambient", type=float, default=25.0, help="Ambient temperature in °C (default: 25)")
+    compare.add_argument("--cooling", choices=sorted(ThermalModel.COOLING_RESISTANCE), default="Stock",
+                         help="Cooling solution")
+    compare.add_argument("--limit", type=int, help="Only print the top N")
+    compare.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    compare.add_argument("--no-cache", action="store_true", help="Recompute even if the catalog is unchanged")
+    compare.add_argument("--restart", action="store_true", help="Start over instead of resuming an interrupted run")
+    compare.set_defaults(handler=cmd_compare)
+    
+    leaderboard = subcommands.add_parser("leaderboard", help="Show the best stable results recorded so far")
+    leaderboard.add_argument("--metric", choices=list(LEADERBOARD_METRICS), default="latency",
+                             help="Lowest latency, highest frequency or highest read bandwidth (default: latency)")
+    leaderboard.add_argument("--kit", help="Only this kit (catalog number or part of the name)")
+    leaderboard.add_argument("--ic", help="Only this memory IC, e.g. 'samsung b-die'")
+    leaderboard.add_argument("--controller", help="Only this controller (catalog number or part of the name)")
+    leaderboard.add_argument("--limit", type=int, default=10, help=f"Entries to show (at most {LEADERBOARD_SIZE})")
+    leaderboard.add_argument("--json", action="store_true", help="Print JSON lines instead of a table")
+    leaderboard.set_defaults(handler=cmd_leaderboard)
+    
+    serve = subcommands.add_parser("serve", help="Run the evaluation service with a Prometheus /metrics endpoint")
+    serve.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8080, help="Port to listen on (default: 8080, 0 for any)")
+    serve.add_argument("--verbose", action="store_true", help="Log every request")
+    serve.add_argument("--session-timeout", type=float, default=SESSION_IDLE_TIMEOUT,
+                       help=f"Seconds before an idle session is moved to disk (default: {SESSION_IDLE_TIMEOUT:g})")
+    serve.add_argument("--session-dir", default=SESSION_DIR, help="Where idle sessions are kept")
+    serve.set_defaults(handler=cmd_serve)
+    
+    bench = subcommands.add_parser("bench", help="Run benchmarks")
+    bench.add_argument("suites", nargs="*", metavar="SUITE",
+                       help=f"Suites to run: {', '.join(BENCH_SUITES)} (default: all)")
+    bench.add_argument("--repeats", type=int, default=5, help="Timed repeats per benchmark (median is kept)")
+    bench.add_argument("--runs", type=int, default=10, help="Number of cold starts to time")
+    bench.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS, help="Fail if the median cold start exceeds this")
+    bench.add_argument("--output", metavar="FILE", help="Save the results as a JSON baseline")
+    bench.set_defaults(handler=cmd_bench)
+    
+    bench_compare = subcommands.add_parser("bench-compare", help="Compare two benchmark result files")
+    bench_compare.add_argument("baseline", help="Earlier results (bench --output)")
+    bench_compare.add_argument("current", help="New results")
+    bench_compare.add_argument("--threshold", type=float, default=10.0,
+                               help="Percent slowdown that counts as a regression (default: 10)")
+    bench_compare.set_defaults(handler=cmd_bench_compare)
+    
+    parser.add_argument("--seed", type=int, help="Seed for the game's random events")
+    parser.add_argument("--metrics-file", metavar="FILE", help="Write Prometheus metrics here on exit")
+    parser.add_argument("--profile", metavar="FILE", help="Record timing spans to a Chrome trace file and "
+                                                          "print a per-function summary on exit")
+    args = parser.parse_args(argv)
+    if args.profile:
+        TRACER.enable()
+    try:
+        if args.command:
+            try:
+                return args.handler(args)
+            except KeyboardInterrupt:
+                print("\nInterrupted. Finished work is checkpointed; run the same command again to resume.",
+                      file=sys.stderr)
+                return 130
+        
+        game = RAMOverclockGame()
+        if args.seed is not None:
+            game.set_seed(args.seed)
+        try:
+            game.main_menu()
+        except KeyboardInterrupt:
+            print("\n\nExiting game...")
+            if game.current_modules:
+                game.save_game()
+                print(f"Session saved to {SAVE_FILE}")
+        return 0
+    finally:
+        if args.metrics_file:
+            METRICS.dump(args.metrics_file)
+        if args.profile and TRACER.enabled:
+            TRACER.disable()
+            TRACER.write_chrome_trace(args.profile)
+            for line in TRACER.format_summary():
+                print(line, file=sys.stderr)
+            print(f"Trace of {len(TRACER.events)} spans written to {args.profile}", file=sys.stderr)
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
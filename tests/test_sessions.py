@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ram_overclock
+
+INVALID_UPDATES = [
+    {"speed": 0},
+    {"speed": -5},
+    {"speed": 70000},
+    {"voltage": 99},
+    {"gear": 300},
+    {"secondaries": {"tREFI": 70000}},
+    {"secondaries": [1, 2]},
+    {"speed": 3600, "ambient": "hot"},
+    {"bogus": 1},
+    {"kit": 5, "controller": 3},
+]
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    manager = ram_overclock.SessionManager(str(tmp_path))
+    monkeypatch.setattr(ram_overclock, "_session_manager", manager)
+    return manager
+
+
+def post(action, request):
+    return ram_overclock.session_route(action)(json.dumps(request).encode())
+
+
+@pytest.mark.parametrize("changes", INVALID_UPDATES)
+def test_invalid_update_is_rejected_without_a_history_step(manager, changes):
+    session_id = manager.create({"kit": 1})
+    before, rows = manager.config(session_id), manager.states.size
+    code, _, _ = post(ram_overclock.session_update, dict(changes, session=session_id))
+    assert code == 400
+    assert manager.config(session_id) == before
+    assert manager.states.size == rows
+    assert not manager.undo(session_id)
+    assert post(ram_overclock.session_get, {"session": session_id})[0] == 200
+
+
+@pytest.mark.parametrize("config", [{"kit": 1, "speed": 0}, {"kit": 1, "gear": 300}, {"kit": 99},
+                                    {"kit": 1, "ambient": 100}, {"kit": 1, "cooling": "Lava"}])
+def test_invalid_new_session_leaves_nothing_behind(manager, config):
+    code, _, _ = post(ram_overclock.session_new, config)
+    assert code == 400
+    assert manager.stats()["active"] == 0
+    assert manager.states.size == 0
+
+
+def test_update_undo_redo(manager):
+    session_id = manager.create({"kit": 2})
+    code, _, body = post(ram_overclock.session_update, {"session": session_id, "speed": 4000})
+    assert code == 200 and json.loads(body)["settings"]["speed"] == 4000
+    assert json.loads(post(ram_overclock.session_undo, {"session": session_id})[2])["settings"]["speed"] == 3600
+    assert json.loads(post(ram_overclock.session_redo, {"session": session_id})[2])["settings"]["speed"] == 4000
@@ -0,0 +1,23 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ram_overclock
+
+
+def test_evaluate_cold_start_within_budget():
+    # Batch runners spawn one `evaluate` process per job, so its cold start is budgeted
+    result = ram_overclock.bench_startup(runs=5)
+    median_ms = result["seconds_per_op"] * 1000
+    assert median_ms <= ram_overclock.STARTUP_BUDGET_MS, (
+        f"median cold start {median_ms:.0f} ms exceeds the {ram_overclock.STARTUP_BUDGET_MS} ms budget")
+
+
+def test_evaluate_does_not_import_numpy_eagerly():
+    # The budget relies on NumPy-backed engines loading on first use only
+    import subprocess
+    code = "import sys, ram_overclock; print('numpy' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True,
+                            cwd=os.path.dirname(ram_overclock.__file__)).stdout
+    assert output.strip() == "False"